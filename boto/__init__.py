@@ -33,7 +33,6 @@ import platform
 import re
 import sys
 import logging
-import logging.config
 
 from boto.compat import urlparse
 from boto.exception import InvalidUriError
@@ -63,6 +62,11 @@ ENDPOINTS_PATH = os.path.join(os.path.dirname(__file__), 'endpoints.json')
 
 
 def init_logging():
+    # logging.config is slow to import, so only import it if the config
+    # files configure logging at all.
+    if not config.has_section('loggers'):
+        return
+    import logging.config
     for file in BotoConfigLocations:
         try:
             logging.config.fileConfig(os.path.expanduser(file))
@@ -1099,6 +1103,32 @@ def connect_machinelearning(aws_access_key_id=None,
     )
 
 
+def shared_connection(service, *args, **kwargs):
+    """
+    Return a connection that is shared by everything in the process that
+    asks for one with the same arguments, instead of creating a new
+    connection (with its own credential lookup and HTTP connections) every
+    time.
+
+    The shared connections are used by many threads at once, so they
+    shouldn't be modified. See :class:`boto.connection.ConnectionRegistry`.
+
+    :type service: str or callable
+    :param service: The name of one of the ``boto.connect_*`` functions
+        without its ``connect_`` prefix (e.g. ``'s3'``), or any function
+        returning a connection (e.g. ``boto.ec2.connect_to_region``).
+
+    The remaining arguments are passed on to the connect function.
+
+    :rtype: :class:`boto.connection.AWSAuthConnection`
+    :return: A shared connection to the service.
+    """
+    from boto.connection import shared_connections
+    if not callable(service):
+        service = globals()['connect_%s' % service]
+    return shared_connections.get(service, *args, **kwargs)
+
+
 def storage_uri(uri_str, default_scheme='file', debug=0, validate=True,
                 bucket_storage_uri_class=BucketStorageUri,
                 suppress_consec_slashes=True, is_latest=False):
@@ -1213,4 +1243,20 @@ def storage_uri_for_key(key):
     uri_str = '%s://%s/%s' % (prov_name, key.bucket.name, key.name)
     return storage_uri(uri_str)
 
+# boto.endpoints, boto.regioninfo and boto.s3 used to be imported as a side
+# effect of importing boto, so code relies on e.g. boto.s3.connect_to_region
+# working after only "import boto". Where modules can define __getattr__
+# (Python 3.7+), they are imported the first time they are used.
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name not in ('endpoints', 'regioninfo', 's3'):
+            raise AttributeError("module %r has no attribute %r" %
+                                 (__name__, name))
+        import importlib
+        return importlib.import_module('boto.' + name)
+else:
+    import boto.endpoints
+    import boto.regioninfo
+    import boto.s3
+
 boto.plugin.load_plugins(config)
@@ -0,0 +1,512 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+"""
+Sends the requests of boto connections over asyncio, so that many requests
+can be in flight at once without a thread for each of them.
+
+This module requires Python 3.5 or later, and isn't installed on older
+Pythons, which can't compile it.
+
+An :class:`AsyncConnection` wraps a regular connection object. Requests are
+built and signed by the wrapped connection exactly as they would be for a
+blocking call (by its ``build_request`` method, which takes the same
+arguments as its ``make_request``), then sent, retried and redirected on
+the event loop::
+
+    import asyncio
+    import json
+    import boto.dynamodb2
+    from boto.async_connection import AsyncConnection
+
+    async def main():
+        conn = AsyncConnection(boto.dynamodb2.connect_to_region('us-west-2'))
+        try:
+            items = await asyncio.gather(*[
+                conn.make_json_request('GetItem', json.dumps({
+                    'TableName': 'users',
+                    'Key': {'username': {'S': name}},
+                }))
+                for name in names])
+        finally:
+            conn.close()
+
+Depending on the kind of service, use:
+
+* :meth:`AsyncConnection.make_json_request` for JSON services such as
+  DynamoDB (``boto.dynamodb2``) or Kinesis.
+* :meth:`AsyncConnection.get_object`, :meth:`AsyncConnection.get_list` and
+  :meth:`AsyncConnection.get_status` for query services such as SQS.
+* :meth:`AsyncConnection.make_request` for anything else, e.g. S3 object
+  GETs and PUTs. It takes the same arguments as the wrapped connection's
+  ``make_request`` and returns an :class:`AsyncHTTPResponse`.
+
+Request and response bodies are held in memory, and proxies and custom
+``https_connection_factory`` or ``sender`` arguments are not supported.
+Neither are connections whose ``make_request`` takes other arguments than
+their ``build_request``, e.g. because it was overridden without it.
+"""
+import asyncio
+import ssl
+import time
+from datetime import datetime
+from io import BytesIO
+
+import boto
+import boto.utils
+from boto.compat import json, urlparse, http_client
+from boto.connection import ConnectionPool, PORTS_BY_SECURITY
+from boto.exception import BotoClientError, BotoServerError
+from boto.exception import PleaseRetryException
+
+
+class AsyncHTTPResponse(object):
+    """
+    A response read by an :class:`AsyncConnection`, with the parts of the
+    ``http_client.HTTPResponse`` interface that boto uses.
+
+    The whole body is read before the response is returned. Like
+    :class:`boto.connection.HTTPResponse`, calling :meth:`read` without a
+    size returns all of it, however often it is called.
+    """
+
+    def __init__(self, status, reason, msg, body, version=11):
+        self.status = status
+        self.reason = reason
+        self.msg = msg
+        self.version = version
+        self._body = body
+        self._position = 0
+
+    def read(self, amt=None):
+        if amt is None:
+            return self._body
+        data = self._body[self._position:self._position + amt]
+        self._position += len(data)
+        return data
+
+    def getheader(self, name, default=None):
+        values = self.msg.get_all(name)
+        if not values:
+            return default
+        return ', '.join(values)
+
+    def getheaders(self):
+        return list(self.msg.items())
+
+
+def _defined_by(cls, name):
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+
+class AsyncConnection(object):
+    """
+    Sends the requests of a boto connection over asyncio.
+
+    Connections to each host are kept open and reused between requests.
+    An ``AsyncConnection`` can be used by any number of tasks at once, but
+    only from one event loop.
+
+    :type connection: :class:`boto.connection.AWSAuthConnection`
+    :param connection: The connection whose requests are sent. It still
+        signs the requests and decides how they are retried.
+
+    :type max_connections: int
+    :param max_connections: The maximum number of requests in flight at
+        once. Further requests wait for one of them to finish.
+    """
+
+    # The exceptions, besides the connection's http_exceptions, after
+    # which a request is retried.
+    retryable_exceptions = (OSError, EOFError, asyncio.IncompleteReadError,
+                            asyncio.TimeoutError, http_client.HTTPException)
+
+    def __init__(self, connection, max_connections=100):
+        if connection.use_proxy:
+            raise BotoClientError(
+                'AsyncConnection does not support proxies.')
+        self.connection = connection
+        self.max_connections = max_connections
+        self.timeout = connection.http_connection_kwargs.get('timeout')
+        self._idle = {}
+        self._semaphore = None
+        self._ssl_context = None
+
+    def close(self):
+        """
+        Close the connections kept open for reuse.
+        """
+        for connections in self._idle.values():
+            for reader, writer, last_used in connections:
+                writer.close()
+        self._idle.clear()
+
+    async def make_request(self, *args, **kwargs):
+        """
+        Build a request with the wrapped connection's ``make_request``
+        method, which takes the same arguments, and send it.
+
+        :rtype: :class:`AsyncHTTPResponse`
+        :return: The final response, after retries and redirects.
+        """
+        request, kwargs = self._build_request(*args, **kwargs)
+        if kwargs.get('sender') is not None:
+            raise BotoClientError(
+                'AsyncConnection does not support custom senders.')
+        return await self.send(request, kwargs.get('override_num_retries'),
+                               kwargs.get('retry_handler'))
+
+    async def make_json_request(self, action, body):
+        """
+        Call an action of a JSON service (e.g. ``boto.dynamodb2`` or
+        ``boto.kinesis``), with the same error handling as the service's
+        own ``make_request``.
+
+        :type action: str
+        :param action: The name of the API action, e.g. ``'GetItem'``.
+
+        :type body: str
+        :param body: The JSON encoded parameters of the action.
+
+        :return: The decoded JSON response.
+        """
+        conn = self.connection
+        response = await self.make_request(action, body)
+        response_body = response.read().decode('utf-8')
+        boto.log.debug(response_body)
+        if response.status == 200:
+            if response_body:
+                return json.loads(response_body)
+        else:
+            json_body = json.loads(response_body)
+            fault_name = json_body.get('__type', None)
+            exception_class = getattr(conn, '_faults', {}).get(
+                fault_name, conn.ResponseError)
+            raise exception_class(response.status, response.reason,
+                                  body=json_body)
+
+    async def get_list(self, action, params, markers, path='/',
+                       parent=None, verb='GET'):
+        """
+        Like :meth:`boto.connection.AWSQueryConnection.get_list`.
+        """
+        response = await self.make_request(action, params, path, verb)
+        return self.connection._parse_list(response, markers,
+                                           parent or self.connection)
+
+    async def get_object(self, action, params, cls, path='/',
+                         parent=None, verb='GET'):
+        """
+        Like :meth:`boto.connection.AWSQueryConnection.get_object`.
+        """
+        response = await self.make_request(action, params, path, verb)
+        return self.connection._parse_object(response, cls,
+                                             parent or self.connection)
+
+    async def get_status(self, action, params, path='/', parent=None,
+                         verb='GET'):
+        """
+        Like :meth:`boto.connection.AWSQueryConnection.get_status`.
+        """
+        response = await self.make_request(action, params, path, verb)
+        return self.connection._parse_status(response,
+                                             parent or self.connection)
+
+    def _build_request(self, *args, **kwargs):
+        # build_request only takes the same arguments as make_request if
+        # it's overridden along with it.
+        cls = type(self.connection)
+        builder = _defined_by(cls, 'build_request')
+        if builder is None or not issubclass(builder,
+                                             _defined_by(cls, 'make_request')):
+            raise BotoClientError(
+                '%s has no build_request for its make_request, so '
+                'AsyncConnection cannot send its requests.' % cls.__name__)
+        return self.connection.build_request(*args, **kwargs)
+
+    async def send(self, request, override_num_retries=None,
+                   retry_handler=None):
+        """
+        Send a :class:`boto.connection.HTTPRequest`, retrying and following
+        redirects the way :meth:`AWSAuthConnection._mexe
+        <boto.connection.AWSAuthConnection._mexe>` does.
+
+        :rtype: :class:`AsyncHTTPResponse`
+        """
+        conn = self.connection
+        boto.log.debug('Method: %s' % request.method)
+        boto.log.debug('Path: %s' % request.path)
+        boto.log.debug('Host: %s' % request.host)
+        response = None
+        body = None
+        ex = None
+        if override_num_retries is None:
+            num_retries = boto.config.getint('Boto', 'num_retries',
+                                             conn.num_retries)
+        else:
+            num_retries = override_num_retries
+        is_secure = conn.is_secure
+        policy = conn.retry_policy
+        last_sleep = None
+        if not isinstance(request.body, bytes) and hasattr(request.body,
+                                                           'encode'):
+            request.body = request.body.encode('utf-8')
+
+        i = 0
+        while i <= num_retries:
+            next_sleep = policy.delay(i, 'server', last_sleep)
+            error_class = 'server'
+            try:
+                request.authorize(connection=conn)
+                if 's3' not in conn._required_auth_capability():
+                    if not getattr(conn, 'anon', False):
+                        if not request.headers.get('Host'):
+                            conn.set_host_header(request)
+                request.start_time = datetime.now()
+                response = await self._request(request, is_secure)
+                location = response.getheader('location')
+                if callable(retry_handler):
+                    status = retry_handler(response, i, next_sleep)
+                    if status:
+                        msg, i, next_sleep = status
+                        if msg:
+                            boto.log.debug(msg)
+                        policy.record_sleep(next_sleep)
+                        await asyncio.sleep(next_sleep)
+                        last_sleep = next_sleep
+                        continue
+                if response.status in [500, 502, 503, 504]:
+                    boto.log.debug('Received %d response.  Retrying in %3.1f '
+                                   'seconds' % (response.status, next_sleep))
+                    body = response.read().decode('utf-8')
+                elif response.status < 300 or response.status >= 400 or \
+                        not location:
+                    if i == 0:
+                        policy.record_success()
+                    if conn.request_hook is not None:
+                        conn.request_hook.handle_request_data(request,
+                                                              response)
+                    return response
+                else:
+                    scheme, request.host, request.path, \
+                        params, query, fragment = urlparse(location)
+                    if query:
+                        request.path += '?' + query
+                    if ':' in request.host:
+                        request.host, request.port = request.host.split(':', 1)
+                    else:
+                        request.port = PORTS_BY_SECURITY[scheme == 'https']
+                    is_secure = scheme == 'https'
+                    boto.log.debug('Redirecting: %s://%s%s' % (
+                        scheme, request.host, request.path))
+                    response = None
+                    continue
+            except PleaseRetryException as e:
+                boto.log.debug('encountered a retry exception: %s' % e)
+                response = e.response
+                ex = e
+            except ssl.CertificateError:
+                # Like InvalidCertificateException for blocking requests,
+                # this won't go away by retrying.
+                raise
+            except self.retryable_exceptions + conn.http_exceptions as e:
+                boto.log.debug('encountered %s exception, reconnecting' %
+                               e.__class__.__name__)
+                ex = e
+                error_class = 'connection'
+                next_sleep = policy.delay(i, error_class, last_sleep)
+            if i >= num_retries or not policy.acquire(error_class):
+                break
+            policy.record_sleep(next_sleep)
+            await asyncio.sleep(next_sleep)
+            last_sleep = next_sleep
+            i += 1
+
+        if conn.request_hook is not None:
+            conn.request_hook.handle_request_data(request, response,
+                                                  error=True)
+        if response:
+            raise BotoServerError(response.status, response.reason, body)
+        elif ex:
+            raise ex
+        else:
+            msg = 'Please report this exception as a Boto Issue!'
+            raise BotoClientError(msg)
+
+    async def _request(self, request, is_secure):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        async with self._semaphore:
+            if self.timeout is None:
+                return await self._roundtrip(request, is_secure)
+            return await asyncio.wait_for(
+                self._roundtrip(request, is_secure), self.timeout)
+
+    async def _roundtrip(self, request, is_secure):
+        host = boto.utils.parse_host(request.host)
+        port = int(request.port or PORTS_BY_SECURITY[is_secure])
+        key = (host, port, is_secure)
+        data = self._encode_request(request, host, port, is_secure)
+        reader, writer, reused = await self._get_stream(key)
+        try:
+            writer.write(data)
+            await writer.drain()
+            response, keep_alive = await self._read_response(
+                reader, request.method)
+        except (OSError, EOFError, asyncio.IncompleteReadError,
+                http_client.BadStatusLine):
+            writer.close()
+            if not reused:
+                raise
+            # The server may have closed the idle connection just as it was
+            # picked from the pool; try again on a new one.
+            reader, writer = await self._open(key)
+            try:
+                writer.write(data)
+                await writer.drain()
+                response, keep_alive = await self._read_response(
+                    reader, request.method)
+            except BaseException:
+                writer.close()
+                raise
+        except BaseException:
+            writer.close()
+            raise
+        if keep_alive:
+            self._idle.setdefault(key, []).append(
+                (reader, writer, time.time()))
+        else:
+            writer.close()
+        return response
+
+    async def _get_stream(self, key):
+        connections = self._idle.get(key)
+        while connections:
+            reader, writer, last_used = connections.pop()
+            stale = (time.time() - last_used >
+                     ConnectionPool.STALE_DURATION)
+            if stale or reader.at_eof():
+                writer.close()
+                continue
+            return reader, writer, True
+        reader, writer = await self._open(key)
+        return reader, writer, False
+
+    async def _open(self, key):
+        host, port, is_secure = key
+        if not is_secure:
+            return await asyncio.open_connection(host, port)
+        return await asyncio.open_connection(
+            host, port, ssl=self._get_ssl_context(), server_hostname=host)
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            conn = self.connection
+            if conn.https_validate_certificates:
+                context = ssl.create_default_context(
+                    cafile=conn.ca_certificates_file)
+            else:
+                context = ssl.create_default_context()
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._ssl_context = context
+        return self._ssl_context
+
+    def _encode_request(self, request, host, port, is_secure):
+        headers = dict(request.headers)
+        names = set(name.lower() for name in headers)
+        if 'host' not in names:
+            if port == PORTS_BY_SECURITY[is_secure]:
+                headers['Host'] = host
+            else:
+                headers['Host'] = '%s:%d' % (host, port)
+        if 'accept-encoding' not in names:
+            headers['Accept-Encoding'] = 'identity'
+        body = request.body or b''
+        if 'content-length' not in names and (
+                body or request.method in ('POST', 'PUT')):
+            headers['Content-Length'] = str(len(body))
+        lines = ['%s %s HTTP/1.1' % (request.method, request.path)]
+        for name, value in headers.items():
+            lines.append('%s: %s' % (name, value))
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+        return head + body
+
+    async def _read_response(self, reader, method):
+        status_line = await reader.readline()
+        if not status_line:
+            raise http_client.BadStatusLine(status_line)
+        parts = status_line.decode('iso-8859-1').rstrip('\r\n').split(' ', 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+            raise http_client.BadStatusLine(status_line)
+        version = parts[0]
+        status = int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ''
+
+        header_lines = []
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            header_lines.append(line)
+        msg = http_client.parse_headers(BytesIO(b''.join(header_lines)))
+
+        connection_header = (msg.get('connection') or '').lower()
+        if version == 'HTTP/1.0':
+            keep_alive = connection_header == 'keep-alive'
+        else:
+            keep_alive = connection_header != 'close'
+
+        transfer_encoding = (msg.get('transfer-encoding') or '').lower()
+        content_length = msg.get('content-length')
+        if method == 'HEAD' or status in (204, 304) or status < 200:
+            body = b''
+        elif 'chunked' in transfer_encoding:
+            body = await self._read_chunked(reader)
+        elif content_length is not None:
+            body = await reader.readexactly(int(content_length))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        response = AsyncHTTPResponse(
+            status, reason, msg, body,
+            version=10 if version == 'HTTP/1.0' else 11)
+        return response, keep_alive
+
+    async def _read_chunked(self, reader):
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                raise asyncio.IncompleteReadError(b''.join(chunks), None)
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                # Skip any trailers.
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
@@ -21,13 +21,18 @@
 # IN THE SOFTWARE.
 #
 
+import threading
+
 import boto.exception
-from boto.compat import json
+from boto.compat import json, Queue
 import requests
 import boto
 from boto.cloudsearchdomain.layer1 import CloudSearchDomainConnection
 
 
+MAX_BATCH_SIZE = 5 * 1024 * 1024
+
+
 class SearchServiceException(Exception):
     pass
 
@@ -93,6 +98,7 @@ class DocumentServiceConnection(object):
             self.endpoint = domain.doc_service_endpoint
         self.documents_batch = []
         self._sdf = None
+        self._session = None
 
         # Copy proxy settings from connection and check if request should be signed
         self.proxy = {}
@@ -184,21 +190,26 @@ class DocumentServiceConnection(object):
 
     def _commit_without_auth(self, sdf, api_version):
         url = "http://%s/%s/documents/batch" % (self.endpoint, api_version)
-
-        # Keep-alive is automatic in a post-1.0 requests world.
-        session = requests.Session()
-        session.proxies = self.proxy
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=20,
-            pool_maxsize=50,
-            max_retries=5
-        )
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-
+        session = self._get_session()
         resp = session.post(url, data=sdf, headers={'Content-Type': 'application/json'})
         return resp
 
+    def _get_session(self):
+        # The session is created once and reused by every commit so that
+        # connections to the document endpoint are kept alive.
+        if self._session is None:
+            session = requests.Session()
+            session.proxies = self.proxy
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=50,
+                max_retries=5
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+
     def commit(self):
         """
         Actually send an SDF to CloudSearch for processing
@@ -218,6 +229,9 @@ class DocumentServiceConnection(object):
             index = sdf.index(': null')
             boto.log.error(sdf[index - 100:index + 100])
 
+        return self._commit_sdf(sdf)
+
+    def _commit_sdf(self, sdf, num_ops=None):
         api_version = '2013-01-01'
         if self.domain and self.domain.layer1:
             api_version = self.domain.layer1.APIVersion
@@ -227,7 +241,8 @@ class DocumentServiceConnection(object):
         else:
             r = self._commit_without_auth(sdf, api_version)
 
-        return CommitResponse(r, self, sdf, signed_request=self.sign_request)
+        return CommitResponse(r, self, sdf, signed_request=self.sign_request,
+                              num_ops=num_ops)
 
 
 class CommitResponse(object):
@@ -240,16 +255,23 @@ class CommitResponse(object):
     :param doc_service: Object containing the documents posted and methods to
         retry
 
+    :type num_ops: dict
+    :param num_ops: Number of 'add' and 'delete' operations in the
+        committed SDF. Counted from the documents batch of ``doc_service``
+        when not given.
+
     :raises: :class:`boto.exception.BotoServerError`
     :raises: :class:`boto.cloudsearch2.document.SearchServiceException`
     :raises: :class:`boto.cloudsearch2.document.EncodingError`
     :raises: :class:`boto.cloudsearch2.document.ContentTooLongError`
     """
-    def __init__(self, response, doc_service, sdf, signed_request=False):
+    def __init__(self, response, doc_service, sdf, signed_request=False,
+                 num_ops=None):
         self.response = response
         self.doc_service = doc_service
         self.sdf = sdf
         self.signed_request = signed_request
+        self.num_ops = num_ops
 
         if self.signed_request:
             self.content = response
@@ -292,8 +314,11 @@ class CommitResponse(object):
 
         :raises: :class:`boto.cloudsearch2.document.CommitMismatchError`
         """
-        commit_num = len([d for d in self.doc_service.documents_batch
-                          if d['type'] == type_])
+        if self.num_ops is not None:
+            commit_num = self.num_ops.get(type_, 0)
+        else:
+            commit_num = len([d for d in self.doc_service.documents_batch
+                              if d['type'] == type_])
 
         if response_num != commit_num:
             if self.signed_request:
@@ -313,3 +338,148 @@ class CommitResponse(object):
             )
             exc.errors = self.errors
             raise exc
+
+
+class BulkDocumentUploader(object):
+    """
+    Upload a large number of documents to CloudSearch in automatically
+    sized batches.
+
+    Documents given to :func:`add` and :func:`delete` are serialized as
+    they arrive instead of being held in memory. Whenever the next
+    document would take the pending batch past ``max_batch_size`` bytes
+    (the 5MB CloudSearch limit by default) the batch is handed to a pool
+    of ``num_threads`` threads, which commit batches concurrently through
+    the document service. At most ``max_pending_batches`` batches wait
+    for a thread; adding documents blocks while that many are queued.
+
+    Call :func:`close` once every document has been added to send the
+    final batch and wait for all commits to finish. The totals reported
+    by CloudSearch are summed in ``adds`` and ``deletes``, and the
+    exception raised by each failed batch is kept in ``errors``::
+
+        uploader = BulkDocumentUploader(domain.get_document_service())
+        for doc in docs:
+            uploader.add(doc['id'], doc)
+        uploader.close()
+
+    :type doc_service: :class:`boto.cloudsearch2.document.DocumentServiceConnection`
+    :param doc_service: The document service to commit batches through.
+
+    :type max_batch_size: int
+    :param max_batch_size: The maximum size in bytes of an uploaded batch.
+
+    :type num_threads: int
+    :param num_threads: The number of batches committed concurrently.
+
+    :type max_pending_batches: int
+    :param max_pending_batches: The number of batches that may wait for a
+        thread. Defaults to ``num_threads``.
+    """
+    def __init__(self, doc_service, max_batch_size=MAX_BATCH_SIZE,
+                 num_threads=4, max_pending_batches=None):
+        self.doc_service = doc_service
+        self.max_batch_size = max_batch_size
+        self.adds = 0
+        self.deletes = 0
+        self.errors = []
+        self.closed = False
+        self._lock = threading.Lock()
+        self._reset_batch()
+        if max_pending_batches is None:
+            max_pending_batches = num_threads
+        self._queue = Queue(max_pending_batches)
+        self._threads = []
+        for _ in range(num_threads):
+            thread = threading.Thread(target=self._commit_batches)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def add(self, _id, fields):
+        """
+        Add a document to be processed by the DocumentService
+
+        :type _id: string
+        :param _id: A unique ID used to refer to this document.
+
+        :type fields: dict
+        :param fields: A dictionary of key-value pairs to be uploaded .
+        """
+        self._append({'type': 'add', 'id': _id, 'fields': fields})
+
+    def delete(self, _id):
+        """
+        Schedule a document to be removed from the CloudSearch service
+
+        :type _id: string
+        :param _id: The unique ID of this document.
+        """
+        self._append({'type': 'delete', 'id': _id})
+
+    def flush(self):
+        """
+        Hand the pending batch to the upload threads.
+        """
+        if not self._batch:
+            return
+        sdf = '[' + ','.join(self._batch) + ']'
+        self._queue.put((sdf, self._num_ops))
+        self._reset_batch()
+
+    def close(self):
+        """
+        Send the final batch and wait for every commit to finish.
+        """
+        if self.closed:
+            return
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self.closed = True
+
+    def _reset_batch(self):
+        self._batch = []
+        # The enclosing brackets of the JSON list.
+        self._batch_size = 2
+        self._num_ops = {'add': 0, 'delete': 0}
+
+    def _append(self, document):
+        if self.closed:
+            raise ValueError("I/O operation on closed uploader")
+        # json.dumps escapes non-ASCII characters, so the length of the
+        # string is its size in bytes.
+        encoded = json.dumps(document)
+        if ': null' in encoded:
+            boto.log.error('null value in document %s detected. This will '
+                           'probably raise 500 error.', document['id'])
+        size = len(encoded) + 1
+        if size + 2 > self.max_batch_size:
+            raise ContentTooLongError("Document %s is larger than the "
+                                      "maximum batch size" % document['id'])
+        if self._batch and self._batch_size + size > self.max_batch_size:
+            self.flush()
+        self._batch.append(encoded)
+        self._batch_size += size
+        self._num_ops[document['type']] += 1
+
+    def _commit_batches(self):
+        while True:
+            work = self._queue.get()
+            if work is None:
+                return
+            sdf, num_ops = work
+            try:
+                response = self.doc_service._commit_sdf(sdf, num_ops)
+            except Exception as e:
+                boto.log.error('Error committing batch of %s adds and %s '
+                               'deletes: %s', num_ops['add'],
+                               num_ops['delete'], e)
+                with self._lock:
+                    self.errors.append(e)
+                continue
+            with self._lock:
+                self.adds += response.adds
+                self.deletes += response.deletes
@@ -20,6 +20,7 @@
 # IN THE SOFTWARE.
 #
 import os
+import sys
 
 # This allows boto modules to say "from boto.compat import json".  This is
 # preferred so that all modules don't have to repeat this idiom.
@@ -49,13 +50,29 @@ except (AttributeError, ImportError):
 from boto.vendored import six
 
 from boto.vendored.six import BytesIO, StringIO
-from boto.vendored.six.moves import filter, http_client, map, _thread, \
-                                    urllib, zip
-from boto.vendored.six.moves.queue import Queue
+from boto.vendored.six.moves import filter, map, _thread, urllib, zip
+from boto.vendored.six.moves.queue import Queue, Empty
 from boto.vendored.six.moves.urllib.parse import parse_qs, quote, unquote, \
                                                  urlparse, urlsplit
 from boto.vendored.six.moves.urllib.parse import unquote_plus
-from boto.vendored.six.moves.urllib.request import urlopen
+
+# http_client and urlopen pull in the ssl and email packages, which make up
+# most of the time it takes to import boto. Where modules can define
+# __getattr__ (Python 3.7+), they are only imported when first used.
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name == 'http_client':
+            from boto.vendored.six.moves import http_client as value
+        elif name == 'urlopen':
+            from boto.vendored.six.moves.urllib.request import urlopen as value
+        else:
+            raise AttributeError("module %r has no attribute %r" %
+                                 (__name__, name))
+        globals()[name] = value
+        return value
+else:
+    from boto.vendored.six.moves import http_client
+    from boto.vendored.six.moves.urllib.request import urlopen
 
 if six.PY3:
     # StandardError was removed, so use the base exception type instead
@@ -45,7 +45,6 @@ Handles basic connections to AWS
 from datetime import datetime
 import errno
 import os
-import random
 import re
 import socket
 import sys
@@ -66,8 +65,10 @@ from boto.exception import AWSConnectionError
 from boto.exception import BotoClientError
 from boto.exception import BotoServerError
 from boto.exception import PleaseRetryException
+from boto.metrics import NULL_METRICS, RequestMetrics
 from boto.provider import Provider
 from boto.resultset import ResultSet
+from boto.retry import DEFAULT_RULES, RetryPolicy
 
 HAVE_HTTPS_CONNECTION = False
 try:
@@ -389,6 +390,30 @@ class HTTPResponse(http_client.HTTPResponse):
     def __init__(self, *args, **kwargs):
         http_client.HTTPResponse.__init__(self, *args, **kwargs)
         self._cached_response = ''
+        self._metrics = None
+        self._bytes_read = 0
+        self._body_read = None
+
+    def set_metrics(self, metrics):
+        """
+        Reports ``metrics`` (a :class:`boto.metrics.RequestMetrics`) once the
+        body has been read or the response is closed.
+        """
+        if self._body_read is not None:
+            metrics.finish(self._bytes_read, self._body_read)
+        else:
+            self._metrics = metrics
+
+    def _finish_body(self):
+        if self._body_read is None:
+            self._body_read = time.time()
+            if self._metrics is not None:
+                self._metrics.finish(self._bytes_read, self._body_read)
+
+    def close(self):
+        http_client.HTTPResponse.close(self)
+        if self._metrics is not None:
+            self._metrics.finish(self._bytes_read)
 
     def read(self, amt=None):
         """Read the response.
@@ -408,12 +433,23 @@ class HTTPResponse(http_client.HTTPResponse):
             # happens if the amt arg is not specified.
             if not self._cached_response:
                 self._cached_response = http_client.HTTPResponse.read(self)
+                self._bytes_read += len(self._cached_response)
+                self._finish_body()
             return self._cached_response
         else:
-            return http_client.HTTPResponse.read(self, amt)
+            data = http_client.HTTPResponse.read(self, amt)
+            self._bytes_read += len(data)
+            if amt and not data:
+                self._finish_body()
+            return data
 
 
 class AWSAuthConnection(object):
+
+    RetryRules = {}
+    """The :class:`boto.retry.RetryRule` of each error class that differs
+    from ``boto.retry.DEFAULT_RULES`` for this service."""
+
     def __init__(self, host, aws_access_key_id=None,
                  aws_secret_access_key=None,
                  is_secure=True, port=None, proxy=None, proxy_port=None,
@@ -573,6 +609,7 @@ class AWSAuthConnection(object):
         if getattr(self, 'AuthServiceName', None) is not None:
             self.auth_service_name = self.AuthServiceName
         self.request_hook = None
+        self.retry_policy = RetryPolicy(rules=self.RetryRules)
 
     def __repr__(self):
         return '%s:%s' % (self.__class__.__name__, self.host)
@@ -886,6 +923,50 @@ class AWSAuthConnection(object):
     def set_request_hook(self, hook):
         self.request_hook = hook
 
+    def _get_timed_http_connection(self, metrics, host, port, is_secure,
+                                   reuse=True):
+        # Like get_http_connection (or new_http_connection, if reuse is
+        # False), recording the time taken and whether the pool had a
+        # connection to reuse.
+        start = time.time()
+        connection = None
+        if reuse:
+            connection = self._pool.get_http_connection(host, port, is_secure)
+        if connection is None:
+            metrics.pool_misses += 1
+            connection = self.new_http_connection(host, port, is_secure)
+        else:
+            metrics.pool_hits += 1
+        metrics.connect_time += time.time() - start
+        return connection
+
+    def _report_metrics(self, metrics, response=None, error=False):
+        handler = getattr(self.request_hook, 'handle_request_metrics', None)
+        if handler is None:
+            return
+        metrics.error = error
+        if response is not None:
+            metrics.status = getattr(response, 'status', None)
+        metrics.report_to(handler)
+        if not error and isinstance(response, HTTPResponse):
+            response.set_metrics(metrics)
+        else:
+            metrics.finish()
+
+    def set_retry_policy(self, policy):
+        """
+        Sets the :class:`boto.retry.RetryPolicy` used by this connection.
+        The same policy may be given to several connections to share its
+        retry budget and counters.
+
+        Error classes for which the policy has no rule of its own get the
+        rules in ``RetryRules``, so that the service's own backoff is kept.
+        """
+        for error_class, rule in six.iteritems(self.RetryRules):
+            if policy.rules.get(error_class) is DEFAULT_RULES.get(error_class):
+                policy.rules[error_class] = rule
+        self.retry_policy = policy
+
     def _mexe(self, request, sender=None, override_num_retries=None,
               retry_handler=None):
         """
@@ -911,9 +992,15 @@ class AWSAuthConnection(object):
             num_retries = config.getint('Boto', 'num_retries', self.num_retries)
         else:
             num_retries = override_num_retries
+        policy = self.retry_policy
+        if self.request_hook is not None:
+            metrics = RequestMetrics.for_request(self, request)
+        else:
+            metrics = NULL_METRICS
         i = 0
-        connection = self.get_http_connection(request.host, request.port,
-                                              self.is_secure)
+        last_sleep = None
+        connection = self._get_timed_http_connection(
+            metrics, request.host, request.port, self.is_secure)
 
         # Convert body to bytes if needed
         if not isinstance(request.body, bytes) and hasattr(request.body,
@@ -921,9 +1008,11 @@ class AWSAuthConnection(object):
             request.body = request.body.encode('utf-8')
 
         while i <= num_retries:
-            # Use binary exponential backoff to desynchronize client requests.
-            next_sleep = min(random.random() * (2 ** i),
-                             float(boto.config.get('Boto', 'max_retry_delay', 60)))
+            # Use jittered exponential backoff to desynchronize client requests.
+            next_sleep = policy.delay(i, 'server', last_sleep)
+            error_class = 'server'
+            metrics.attempts += 1
+            metrics.mark('attempt')
             try:
                 # we now re-sign each request before it is retried
                 boto.log.debug('Token: %s' % self.provider.security_token)
@@ -938,13 +1027,18 @@ class AWSAuthConnection(object):
                             self.set_host_header(request)
                 boto.log.debug('Final headers: %s' % request.headers)
                 request.start_time = datetime.now()
+                metrics.mark('signed')
+                metrics.measure_request(request)
                 if callable(sender):
                     response = sender(connection, request.method, request.path,
                                       request.body, request.headers)
+                    metrics.mark('sent')
                 else:
                     connection.request(request.method, request.path,
                                        request.body, request.headers)
+                    metrics.mark('sent')
                     response = connection.getresponse()
+                metrics.mark('first_byte')
                 boto.log.debug('Response headers: %s' % response.getheaders())
                 location = response.getheader('location')
                 # -- gross hack --
@@ -959,7 +1053,11 @@ class AWSAuthConnection(object):
                         msg, i, next_sleep = status
                         if msg:
                             boto.log.debug(msg)
+                        policy.record_sleep(next_sleep)
+                        metrics.retries += 1
+                        metrics.retry_sleep += next_sleep
                         time.sleep(next_sleep)
+                        last_sleep = next_sleep
                         continue
                 if response.status in [500, 502, 503, 504]:
                     msg = 'Received %d response.  ' % response.status
@@ -981,8 +1079,11 @@ class AWSAuthConnection(object):
                     else:
                         self.put_http_connection(request.host, request.port,
                                                  self.is_secure, connection)
+                    if i == 0:
+                        policy.record_success()
                     if self.request_hook is not None:
                         self.request_hook.handle_request_data(request, response)
+                        self._report_metrics(metrics, response)
                     return response
                 else:
                     scheme, request.host, request.path, \
@@ -996,15 +1097,15 @@ class AWSAuthConnection(object):
                     msg = 'Redirecting: %s' % scheme + '://'
                     msg += request.host + request.path
                     boto.log.debug(msg)
-                    connection = self.get_http_connection(request.host,
-                                                          request.port,
-                                                          scheme == 'https')
+                    connection = self._get_timed_http_connection(
+                        metrics, request.host, request.port, scheme == 'https')
                     response = None
                     continue
             except PleaseRetryException as e:
                 boto.log.debug('encountered a retry exception: %s' % e)
-                connection = self.new_http_connection(request.host, request.port,
-                                                      self.is_secure)
+                connection = self._get_timed_http_connection(
+                    metrics, request.host, request.port, self.is_secure,
+                    reuse=False)
                 response = e.response
                 ex = e
             except self.http_exceptions as e:
@@ -1013,20 +1114,32 @@ class AWSAuthConnection(object):
                         boto.log.debug(
                             'encountered unretryable %s exception, re-raising' %
                             e.__class__.__name__)
+                        if self.request_hook is not None:
+                            self._report_metrics(metrics, error=True)
                         raise
                 boto.log.debug('encountered %s exception, reconnecting' %
                                e.__class__.__name__)
-                connection = self.new_http_connection(request.host, request.port,
-                                                      self.is_secure)
+                connection = self._get_timed_http_connection(
+                    metrics, request.host, request.port, self.is_secure,
+                    reuse=False)
                 ex = e
+                error_class = 'connection'
+                next_sleep = policy.delay(i, error_class, last_sleep)
+            if i >= num_retries or not policy.acquire(error_class):
+                break
+            policy.record_sleep(next_sleep)
+            metrics.retries += 1
+            metrics.retry_sleep += next_sleep
             time.sleep(next_sleep)
+            last_sleep = next_sleep
             i += 1
         # If we made it here, it's because we have exhausted our retries
-        # and stil haven't succeeded.  So, if we have a response object,
-        # use it to raise an exception.
+        # (or the retry budget) and still haven't succeeded.  So, if we have
+        # a response object, use it to raise an exception.
         # Otherwise, raise the exception that must have already happened.
         if self.request_hook is not None:
             self.request_hook.handle_request_data(request, response, error=True)
+            self._report_metrics(metrics, response, error=True)
         if response:
             raise BotoServerError(response.status, response.reason, body)
         elif ex:
@@ -1062,16 +1175,36 @@ class AWSAuthConnection(object):
         return HTTPRequest(method, self.protocol, host, self.port,
                            path, auth_path, params, headers, data)
 
-    def make_request(self, method, path, headers=None, data='', host=None,
-                     auth_path=None, sender=None, override_num_retries=None,
-                     params=None, retry_handler=None):
-        """Makes a request to the server, with stock multiple-retry logic."""
+    def build_request(self, method, path, headers=None, data='', host=None,
+                      auth_path=None, sender=None, override_num_retries=None,
+                      params=None, retry_handler=None):
+        """
+        Builds the request that :meth:`make_request`, given the same
+        arguments, would send. Returns the request and a dict of the
+        keyword arguments to send it with.
+
+        Subclasses that override ``make_request`` with other arguments
+        override this to match, so that the request can be sent some other
+        way, e.g. by :class:`boto.async_connection.AsyncConnection`.
+        """
         if params is None:
             params = {}
         http_request = self.build_base_http_request(method, path, auth_path,
                                                     params, headers, data, host)
-        return self._mexe(http_request, sender, override_num_retries,
-                          retry_handler=retry_handler)
+        return http_request, {'sender': sender,
+                              'override_num_retries': override_num_retries,
+                              'retry_handler': retry_handler}
+
+    def make_request(self, method, path, headers=None, data='', host=None,
+                     auth_path=None, sender=None, override_num_retries=None,
+                     params=None, retry_handler=None):
+        """Makes a request to the server, with stock multiple-retry logic."""
+        # Subclasses calling this through super() keep these arguments, even
+        # where their own build_request takes others.
+        http_request, kwargs = AWSAuthConnection.build_request(
+            self, method, path, headers, data, host, auth_path, sender,
+            override_num_retries, params, retry_handler)
+        return self._mexe(http_request, **kwargs)
 
     def close(self):
         """(Optional) Close any open HTTP connections.  This is non-destructive,
@@ -1110,7 +1243,7 @@ class AWSQueryConnection(AWSAuthConnection):
         return boto.utils.get_utf8_value(value)
 
 
-    def make_request(self, action, params=None, path='/', verb='GET'):
+    def build_request(self, action, params=None, path='/', verb='GET'):
         http_request = self.build_base_http_request(verb, path, None,
                                                     params, {}, '',
                                                     self.host)
@@ -1118,7 +1251,12 @@ class AWSQueryConnection(AWSAuthConnection):
             http_request.params['Action'] = action
         if self.APIVersion:
             http_request.params['Version'] = self.APIVersion
-        return self._mexe(http_request)
+        return http_request, {}
+
+    def make_request(self, action, params=None, path='/', verb='GET'):
+        http_request, kwargs = AWSQueryConnection.build_request(
+            self, action, params, path, verb)
+        return self._mexe(http_request, **kwargs)
 
     def build_list_params(self, params, items, label):
         if isinstance(items, six.string_types):
@@ -1173,6 +1311,22 @@ class AWSQueryConnection(AWSAuthConnection):
         if not parent:
             parent = self
         response = self.make_request(action, params, path, verb)
+        return self._parse_list(response, markers, parent)
+
+    def get_object(self, action, params, cls, path='/',
+                   parent=None, verb='GET'):
+        if not parent:
+            parent = self
+        response = self.make_request(action, params, path, verb)
+        return self._parse_object(response, cls, parent)
+
+    def get_status(self, action, params, path='/', parent=None, verb='GET'):
+        if not parent:
+            parent = self
+        response = self.make_request(action, params, path, verb)
+        return self._parse_status(response, parent)
+
+    def _parse_list(self, response, markers, parent):
         body = response.read()
         boto.log.debug(body)
         if not body:
@@ -1190,11 +1344,7 @@ class AWSQueryConnection(AWSAuthConnection):
             boto.log.error('%s' % body)
             raise self.ResponseError(response.status, response.reason, body)
 
-    def get_object(self, action, params, cls, path='/',
-                   parent=None, verb='GET'):
-        if not parent:
-            parent = self
-        response = self.make_request(action, params, path, verb)
+    def _parse_object(self, response, cls, parent):
         body = response.read()
         boto.log.debug(body)
         if not body:
@@ -1212,10 +1362,7 @@ class AWSQueryConnection(AWSAuthConnection):
             boto.log.error('%s' % body)
             raise self.ResponseError(response.status, response.reason, body)
 
-    def get_status(self, action, params, path='/', parent=None, verb='GET'):
-        if not parent:
-            parent = self
-        response = self.make_request(action, params, path, verb)
+    def _parse_status(self, response, parent):
         body = response.read()
         boto.log.debug(body)
         if not body:
@@ -1230,3 +1377,104 @@ class AWSQueryConnection(AWSAuthConnection):
             boto.log.error('%s %s' % (response.status, response.reason))
             boto.log.error('%s' % body)
             raise self.ResponseError(response.status, response.reason, body)
+
+
+class ConnectionRegistry(object):
+    """
+    Hands out connections that are shared by everything in the process
+    that asks for one with the same arguments, so that credential lookups,
+    auth handler setup and the HTTP connections in the pool are reused.
+
+    Connections that talk to a host over the same kind of transport (proxy,
+    certificate validation, timeouts) also share one
+    :class:`ConnectionPool`, so a TLS session set up by one of them can be
+    reused by the others.
+
+    The connections handed out are used by many threads at once. Changing
+    their attributes (``num_retries``, ``request_hook``, ...) affects every
+    user of the connection.
+
+    This class is thread-safe. Making a connection can take a while, e.g.
+    to get credentials from the instance metadata service, so each one is
+    made holding a lock of its own; threads asking for other connections
+    don't wait for it.
+    """
+
+    def __init__(self):
+        self._connections = {}
+        self._pools = {}
+        self._creating = {}
+        self._lock = threading.Lock()
+
+    def get(self, factory, *args, **kwargs):
+        """
+        Return the shared connection made by calling ``factory`` with the
+        given arguments, creating it on first use.
+
+        :type factory: callable
+        :param factory: The function or class that makes the connection,
+            e.g. ``boto.connect_s3`` or ``boto.ec2.connect_to_region``.
+
+        The remaining arguments are passed on to ``factory``. They must be
+        hashable, apart from lists, tuples, dicts and
+        :class:`boto.regioninfo.RegionInfo` objects, which are compared by
+        value.
+        """
+        key = (factory, _freeze(args), _freeze(kwargs))
+        with self._lock:
+            conn = self._connections.get(key)
+            if conn is not None:
+                return conn
+            key_lock = self._creating.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have made it while we were waiting.
+            with self._lock:
+                conn = self._connections.get(key)
+            if conn is not None:
+                return conn
+            try:
+                conn = factory(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._creating.pop(key, None)
+            with self._lock:
+                if isinstance(conn, AWSAuthConnection):
+                    conn._pool = self._get_pool(conn)
+                return self._connections.setdefault(key, conn)
+
+    def _get_pool(self, conn):
+        key = (conn.proxy, conn.proxy_port, conn.proxy_user, conn.proxy_pass,
+               conn.https_validate_certificates, conn.ca_certificates_file,
+               conn.https_connection_factory,
+               _freeze(conn.http_connection_kwargs))
+        if key not in self._pools:
+            self._pools[key] = ConnectionPool()
+        return self._pools[key]
+
+    def clear(self):
+        """
+        Forget all the connections handed out so far. Connections that are
+        still in use keep working, but later calls to :meth:`get` create new
+        ones.
+        """
+        with self._lock:
+            self._connections.clear()
+            self._pools.clear()
+
+
+def _freeze(value):
+    # Turns the arguments of a ConnectionRegistry.get call into something
+    # that can be used as a dict key.
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    elif hasattr(value, 'name') and hasattr(value, 'endpoint'):
+        # RegionInfo objects don't compare by value.
+        return (value.__class__, value.name, value.endpoint,
+                getattr(value, 'connection_cls', None))
+    return value
+
+
+# The registry used by boto.shared_connection.
+shared_connections = ConnectionRegistry()
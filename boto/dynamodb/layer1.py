@@ -135,13 +135,14 @@ class Layer1(AWSAuthConnection):
             if self.ThruputError in data.get('__type'):
                 self.throughput_exceeded_events += 1
                 msg = "%s, retry attempt %s" % (self.ThruputError, i)
-                next_sleep = self._exponential_time(i)
+                next_sleep = self.retry_policy.delay(i, 'throttling')
                 i += 1
                 status = (msg, i, next_sleep)
-                if i == self.NumberRetries:
-                    # If this was our last retry attempt, raise
-                    # a specific error saying that the throughput
-                    # was exceeded.
+                if i == self.NumberRetries or \
+                        not self.retry_policy.acquire('throttling'):
+                    # If this was our last retry attempt, or the retry
+                    # budget is spent, raise a specific error saying that
+                    # the throughput was exceeded.
                     raise dynamodb_exceptions.DynamoDBThroughputExceededError(
                         response.status, response.reason, data)
             elif self.SessionExpiredError in data.get('__type'):
@@ -166,17 +167,14 @@ class Layer1(AWSAuthConnection):
             if actual_crc32 != expected_crc32:
                 msg = ("The calculated checksum %s did not match the expected "
                        "checksum %s" % (actual_crc32, expected_crc32))
-                status = (msg, i + 1, self._exponential_time(i))
+                if not self.retry_policy.acquire('checksum'):
+                    # The body can't be trusted, so don't hand it back.
+                    raise self.ResponseError(response.status,
+                                             response.reason,
+                                             {'message': msg})
+                status = (msg, i + 1, self.retry_policy.delay(i, 'checksum'))
         return status
 
-    def _exponential_time(self, i):
-        if i == 0:
-            next_sleep = 0
-        else:
-            next_sleep = min(0.05 * (2 ** i),
-                             boto.config.get('Boto', 'max_retry_delay', 60))
-        return next_sleep
-
     def list_tables(self, limit=None, start_table=None):
         """
         Returns a dictionary of results.  The dictionary contains
@@ -29,13 +29,18 @@ from decimal import (Decimal, DecimalException, Context,
                      Clamped, Overflow, Inexact, Underflow, Rounded)
 from collections import Mapping
 from boto.dynamodb.exceptions import DynamoDBNumberError
-from boto.compat import filter, map, six, long_type
+from boto.compat import map, six, long_type
 
 
 DYNAMODB_CONTEXT = Context(
     Emin=-128, Emax=126, rounding=None, prec=38,
     traps=[Clamped, Overflow, Inexact, Rounded, Underflow])
 
+# Integers of these types and of fewer than 38 digits are encoded without
+# going through DYNAMODB_CONTEXT.
+_FAST_INT_TYPES = (int, long_type)
+_MAX_FAST_INT = 10 ** 38
+
 
 # python2.6 cannot convert floats directly to
 # Decimals.  This is taken from:
@@ -260,41 +265,90 @@ class Dynamizer(object):
             v
         'foo'     (Python type)
 
+    The ``_encode_*`` and ``_decode_*`` methods are looked up once per
+    instance and kept in dispatch tables, keyed by DynamoDB type, so they
+    should be overridden in subclasses rather than set on instances.
+
     """
+    _encoders = None
+    _decoders = None
+    _python_types = None
+    _hook_decoders = None
+
     def _get_dynamodb_type(self, attr):
         return get_dynamodb_type(attr)
 
+    def _build_dispatch_tables(self):
+        encoders = {}
+        decoders = {}
+        for name in dir(self):
+            if name.startswith('_encode_'):
+                encoders[name[len('_encode_'):].upper()] = getattr(self, name)
+            elif name.startswith('_decode_'):
+                decoders[name[len('_decode_'):].upper()] = getattr(self, name)
+        # The DynamoDB types of the most common python types, so that
+        # get_dynamodb_type's isinstance checks can be skipped for them.
+        # Subclasses and sets are still left to _get_dynamodb_type, as is
+        # everything if a subclass has its own _get_dynamodb_type.
+        get_type = six.get_unbound_function(type(self)._get_dynamodb_type)
+        python_types = {}
+        if get_type in (six.get_unbound_function(
+                            Dynamizer._get_dynamodb_type),
+                        six.get_unbound_function(
+                            NonBooleanDynamizer._get_dynamodb_type)):
+            for sample in (None, True, 0, long_type(0), 0.0, Decimal(0),
+                           u'', b'', {}, [], Binary(b'')):
+                python_types[type(sample)] = self._get_dynamodb_type(sample)
+        self._python_types = python_types
+        hook_decoders = dict(decoders)
+        # Maps and lists are decoded by the time the object hook sees them.
+        hook_decoders['M'] = _decoded_map
+        hook_decoders['L'] = _decoded_list
+        self._hook_decoders = hook_decoders
+        self._decoders = decoders
+        self._encoders = encoders
+
     def encode(self, attr):
         """
         Encodes a python type to the format expected
         by DynamoDB.
 
         """
-        dynamodb_type = self._get_dynamodb_type(attr)
-        try:
-            encoder = getattr(self, '_encode_%s' % dynamodb_type.lower())
-        except AttributeError:
+        if self._encoders is None:
+            self._build_dispatch_tables()
+        dynamodb_type = self._python_types.get(type(attr))
+        if dynamodb_type is None:
+            dynamodb_type = self._get_dynamodb_type(attr)
+        encoder = self._encoders.get(dynamodb_type)
+        if encoder is None:
             raise ValueError("Unable to encode dynamodb type: %s" %
                              dynamodb_type)
         return {dynamodb_type: encoder(attr)}
 
     def _encode_n(self, attr):
+        if (type(attr) in _FAST_INT_TYPES and
+                -_MAX_FAST_INT < attr < _MAX_FAST_INT):
+            # Short enough to be represented exactly, so creating a Decimal
+            # would give the same string.
+            return str(attr)
         try:
             if isinstance(attr, float) and not hasattr(Decimal, 'from_float'):
                 # python2.6 does not support creating Decimals directly
                 # from floats so we have to do this ourself.
-                n = str(float_to_decimal(attr))
+                n = float_to_decimal(attr)
             else:
-                n = str(DYNAMODB_CONTEXT.create_decimal(attr))
-            if list(filter(lambda x: x in n, ('Infinity', 'NaN'))):
+                n = DYNAMODB_CONTEXT.create_decimal(attr)
+            if not n.is_finite():
                 raise TypeError('Infinity and NaN not supported')
-            return n
+            return str(n)
         except (TypeError, DecimalException) as e:
             msg = '{0} numeric for `{1}`\n{2}'.format(
                 e.__class__.__name__, attr, str(e) or '')
         raise DynamoDBNumberError(msg)
 
     def _encode_s(self, attr):
+        if type(attr) is six.text_type:
+            return attr
         if isinstance(attr, bytes):
             attr = attr.decode('utf-8')
         elif not isinstance(attr, six.text_type):
@@ -333,18 +387,54 @@ class Dynamizer(object):
         the appropriate python type.
 
         """
-        if len(attr) > 1 or not attr or is_str(attr):
+        if len(attr) != 1 or (type(attr) is not dict and is_str(attr)):
             return attr
-        dynamodb_type = list(attr.keys())[0]
-        if dynamodb_type.lower() == dynamodb_type:
-            # It's not an actual type, just a single character attr that
-            # overlaps with the DDB types. Return it.
-            return attr
-        try:
-            decoder = getattr(self, '_decode_%s' % dynamodb_type.lower())
-        except AttributeError:
-            return attr
-        return decoder(attr[dynamodb_type])
+        if self._decoders is None:
+            self._build_dispatch_tables()
+        (dynamodb_type, value), = attr.items()
+        decoder = self._decoders.get(dynamodb_type)
+        if decoder is None:
+            if dynamodb_type.lower() == dynamodb_type:
+                # It's not an actual type, just a single character attr
+                # that overlaps with the DDB types. Return it.
+                return attr
+            decoder = self._decoders.get(dynamodb_type.upper())
+            if decoder is None:
+                return attr
+        return decoder(value)
+
+    def json_object_hook(self, dct):
+        """
+        A ``json.loads`` object hook decoding the attribute values of the
+        items in a DynamoDB response as the response is parsed, so that
+        they don't have to be walked again with :meth:`decode`::
+
+            json.loads(body, object_hook=dynamizer.json_object_hook)
+
+        turns ``{"Items": [{"id": {"N": "1"}}]}`` into
+        ``{'Items': [{'id': Decimal('1')}]}``.
+
+        As JSON objects are passed to the hook from the innermost out, each
+        decoded value is wrapped until the object holding it is seen, so
+        that e.g. a map with a single key named ``S`` isn't mistaken for a
+        string. The attribute values must therefore be held by an object
+        (an item or a key), as they are in responses.
+        """
+        if len(dct) == 1:
+            (dynamodb_type, value), = dct.items()
+            json_type = _ENCODED_TYPES.get(dynamodb_type)
+            if (json_type is not None and type(value) is json_type and
+                    (json_type is not list or
+                     _is_encoded_list(dynamodb_type, value))):
+                if self._decoders is None:
+                    self._build_dispatch_tables()
+                decoder = self._hook_decoders.get(dynamodb_type)
+                if decoder is not None:
+                    return _DecodedValue(decoder(value))
+        for key, value in dct.items():
+            if type(value) is _DecodedValue:
+                dct[key] = value.value
+        return dct
 
     def _decode_n(self, attr):
         return DYNAMODB_CONTEXT.create_decimal(attr)
@@ -377,6 +467,43 @@ class Dynamizer(object):
         return [self.decode(i) for i in attr]
 
 
+class _DecodedValue(object):
+    """
+    An attribute value decoded by ``Dynamizer.json_object_hook``.
+    """
+    __slots__ = ['value']
+
+    def __init__(self, value):
+        self.value = value
+
+
+# The JSON types of the encoded values of each DynamoDB type.
+_ENCODED_TYPES = {
+    'S': six.text_type, 'N': six.text_type, 'B': six.text_type,
+    'SS': list, 'NS': list, 'BS': list, 'BOOL': bool, 'NULL': bool,
+    'M': dict, 'L': list,
+}
+
+
+def _is_encoded_list(dynamodb_type, value):
+    # Tells lists and sets apart from other lists held by single key
+    # objects, such as the items of a table named "L" in a BatchGetItem
+    # response.
+    if not value:
+        return True
+    if dynamodb_type == 'L':
+        return type(value[0]) is _DecodedValue
+    return type(value[0]) is six.text_type
+
+
+def _decoded_map(value):
+    return value
+
+
+def _decoded_list(value):
+    return [item.value for item in value]
+
+
 class NonBooleanDynamizer(Dynamizer):
     """Casting boolean type to numeric types.
 
@@ -1,4 +1,35 @@
 from copy import deepcopy
+from decimal import Decimal
+
+from boto.compat import six, long_type
+
+
+# Values of these types can be shared between the data of an item and its
+# original data, rather than copied.
+_IMMUTABLE_TYPES = (six.text_type, bytes, int, long_type, float, bool,
+                   Decimal, type(None), frozenset)
+
+
+def _copy_value(value):
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    elif value_type is set:
+        # The elements of sets are strings, numbers or binary data.
+        return set(value)
+    elif value_type is dict:
+        return _copy_data(value)
+    elif value_type is list:
+        return [_copy_value(item) for item in value]
+    return deepcopy(value)
+
+
+def _copy_data(data):
+    """
+    Copies the data of an item, like ``deepcopy`` but without copying
+    strings and numbers, which are immutable.
+    """
+    return dict((key, _copy_value(value)) for key, value in data.items())
 
 
 class NEWVALUE(object):
@@ -76,7 +107,7 @@ class Item(object):
             self._data = {}
 
         if self._loaded:
-            self._orig_data = deepcopy(self._data)
+            self._orig_data = _copy_data(self._data)
 
     def __getitem__(self, key):
         return self._data.get(key, None)
@@ -195,7 +226,7 @@ class Item(object):
             False
 
         """
-        self._orig_data = deepcopy(self._data)
+        self._orig_data = _copy_data(self._data)
 
     def mark_dirty(self):
         """
@@ -221,7 +252,20 @@ class Item(object):
             self[field_name] = self._dynamizer.decode(field_value)
 
         self._loaded = True
-        self._orig_data = deepcopy(self._data)
+        self._orig_data = _copy_data(self._data)
+
+    def load_decoded(self, data):
+        """
+        Like ``load``, but for the attributes of an item that were decoded
+        while the response was parsed, by passing
+        ``Dynamizer.json_object_hook`` to the low-level API. The item takes
+        ownership of ``data``.
+
+        Largely internal.
+        """
+        self._data = data
+        self._loaded = True
+        self._orig_data = _copy_data(self._data)
 
     def get_keys(self):
         """
@@ -181,7 +181,8 @@ class DynamoDBConnection(AWSQueryConnection):
     def _required_auth_capability(self):
         return ['hmac-v4']
 
-    def batch_get_item(self, request_items, return_consumed_capacity=None):
+    def batch_get_item(self, request_items, return_consumed_capacity=None,
+                       object_hook=None):
         """
         The BatchGetItem operation returns the attributes of one or
         more items from one or more tables. You identify requested
@@ -274,12 +275,17 @@ class DynamoDBConnection(AWSQueryConnection):
             indexes. If set to `NONE` (the default), ConsumedCapacity is not
             included in the response.
 
+        :type object_hook: function
+        :param object_hook: A ``json.loads`` object hook used to parse the
+            response, such as ``Dynamizer.json_object_hook``.
+
         """
         params = {'RequestItems': request_items, }
         if return_consumed_capacity is not None:
             params['ReturnConsumedCapacity'] = return_consumed_capacity
         return self.make_request(action='BatchGetItem',
-                                 body=json.dumps(params))
+                                 body=json.dumps(params),
+                                 object_hook=object_hook)
 
     def batch_write_item(self, request_items, return_consumed_capacity=None,
                          return_item_collection_metrics=None):
@@ -979,7 +985,8 @@ class DynamoDBConnection(AWSQueryConnection):
 
     def get_item(self, table_name, key, attributes_to_get=None,
                  consistent_read=None, return_consumed_capacity=None,
-                 projection_expression=None, expression_attribute_names=None):
+                 projection_expression=None, expression_attribute_names=None,
+                 object_hook=None):
         """
         The GetItem operation returns a set of attributes for the item
         with the given primary key. If there is no matching item,
@@ -1083,6 +1090,10 @@ class DynamoDBConnection(AWSQueryConnection):
         For more information on expression attribute names, go to `Accessing
             Item Attributes`_ in the Amazon DynamoDB Developer Guide .
 
+        :type object_hook: function
+        :param object_hook: A ``json.loads`` object hook used to parse the
+            response, such as ``Dynamizer.json_object_hook``.
+
         """
         params = {'TableName': table_name, 'Key': key, }
         if attributes_to_get is not None:
@@ -1096,7 +1107,8 @@ class DynamoDBConnection(AWSQueryConnection):
         if expression_attribute_names is not None:
             params['ExpressionAttributeNames'] = expression_attribute_names
         return self.make_request(action='GetItem',
-                                 body=json.dumps(params))
+                                 body=json.dumps(params),
+                                 object_hook=object_hook)
 
     def list_tables(self, exclusive_start_table_name=None, limit=None):
         """
@@ -1515,7 +1527,7 @@ class DynamoDBConnection(AWSQueryConnection):
               scan_index_forward=None, exclusive_start_key=None,
               return_consumed_capacity=None, projection_expression=None,
               filter_expression=None, expression_attribute_names=None,
-              expression_attribute_values=None):
+              expression_attribute_values=None, object_hook=None):
         """
         A Query operation directly accesses items from a table using
         the table primary key, or from an index using the index key.
@@ -1906,6 +1918,10 @@ class DynamoDBConnection(AWSQueryConnection):
         For more information on expression attribute values, go to `Specifying
             Conditions`_ in the Amazon DynamoDB Developer Guide .
 
+        :type object_hook: function
+        :param object_hook: A ``json.loads`` object hook used to parse the
+            response, such as ``Dynamizer.json_object_hook``.
+
         """
         params = {
             'TableName': table_name,
@@ -1940,14 +1956,15 @@ class DynamoDBConnection(AWSQueryConnection):
         if expression_attribute_values is not None:
             params['ExpressionAttributeValues'] = expression_attribute_values
         return self.make_request(action='Query',
-                                 body=json.dumps(params))
+                                 body=json.dumps(params),
+                                 object_hook=object_hook)
 
     def scan(self, table_name, attributes_to_get=None, limit=None,
              select=None, scan_filter=None, conditional_operator=None,
              exclusive_start_key=None, return_consumed_capacity=None,
              total_segments=None, segment=None, projection_expression=None,
              filter_expression=None, expression_attribute_names=None,
-             expression_attribute_values=None):
+             expression_attribute_values=None, object_hook=None):
         """
         The Scan operation returns one or more items and item
         attributes by accessing every item in the table. To have
@@ -2214,6 +2231,10 @@ class DynamoDBConnection(AWSQueryConnection):
         For more information on expression attribute values, go to `Specifying
             Conditions`_ in the Amazon DynamoDB Developer Guide .
 
+        :type object_hook: function
+        :param object_hook: A ``json.loads`` object hook used to parse the
+            response, such as ``Dynamizer.json_object_hook``.
+
         """
         params = {'TableName': table_name, }
         if attributes_to_get is not None:
@@ -2243,7 +2264,8 @@ class DynamoDBConnection(AWSQueryConnection):
         if expression_attribute_values is not None:
             params['ExpressionAttributeValues'] = expression_attribute_values
         return self.make_request(action='Scan',
-                                 body=json.dumps(params))
+                                 body=json.dumps(params),
+                                 object_hook=object_hook)
 
     def update_item(self, table_name, key, attribute_updates=None,
                     expected=None, conditional_operator=None,
@@ -2827,7 +2849,7 @@ class DynamoDBConnection(AWSQueryConnection):
         return self.make_request(action='UpdateTable',
                                  body=json.dumps(params))
 
-    def make_request(self, action, body):
+    def build_request(self, action, body):
         headers = {
             'X-Amz-Target': '%s.%s' % (self.TargetPrefix, action),
             'Host': self.host,
@@ -2837,14 +2859,17 @@ class DynamoDBConnection(AWSQueryConnection):
         http_request = self.build_base_http_request(
             method='POST', path='/', auth_path='/', params={},
             headers=headers, data=body, host=self.host)
-        response = self._mexe(http_request, sender=None,
-                              override_num_retries=self.NumberRetries,
-                              retry_handler=self._retry_handler)
+        return http_request, {'override_num_retries': self.NumberRetries,
+                              'retry_handler': self._retry_handler}
+
+    def make_request(self, action, body, object_hook=None):
+        http_request, kwargs = self.build_request(action, body)
+        response = self._mexe(http_request, **kwargs)
         response_body = response.read().decode('utf-8')
         boto.log.debug(response_body)
         if response.status == 200:
             if response_body:
-                return json.loads(response_body)
+                return json.loads(response_body, object_hook=object_hook)
         else:
             json_body = json.loads(response_body)
             fault_name = json_body.get('__type', None)
@@ -2865,13 +2890,14 @@ class DynamoDBConnection(AWSQueryConnection):
                     'ProvisionedThroughputExceededException',
                     i
                 )
-                next_sleep = self._truncated_exponential_time(i)
+                next_sleep = self.retry_policy.delay(i, 'throttling')
                 i += 1
                 status = (msg, i, next_sleep)
-                if i == self.NumberRetries:
-                    # If this was our last retry attempt, raise
-                    # a specific error saying that the throughput
-                    # was exceeded.
+                if i == self.NumberRetries or \
+                        not self.retry_policy.acquire('throttling'):
+                    # If this was our last retry attempt, or the retry
+                    # budget is spent, raise a specific error saying that
+                    # the throughput was exceeded.
                     raise exceptions.ProvisionedThroughputExceededException(
                         response.status, response.reason, data)
             elif 'ConditionalCheckFailedException' in data.get('__type'):
@@ -2892,13 +2918,10 @@ class DynamoDBConnection(AWSQueryConnection):
             if actual_crc32 != expected_crc32:
                 msg = ("The calculated checksum %s did not match the expected "
                        "checksum %s" % (actual_crc32, expected_crc32))
-                status = (msg, i + 1, self._truncated_exponential_time(i))
+                if not self.retry_policy.acquire('checksum'):
+                    # The body can't be trusted, so don't hand it back.
+                    raise self.ResponseError(response.status,
+                                             response.reason,
+                                             {'message': msg})
+                status = (msg, i + 1, self.retry_policy.delay(i, 'checksum'))
         return status
-
-    def _truncated_exponential_time(self, i):
-        if i == 0:
-            next_sleep = 0
-        else:
-            next_sleep = min(0.05 * (2 ** i),
-                             boto.config.get('Boto', 'max_retry_delay', 60))
-        return next_sleep
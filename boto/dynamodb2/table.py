@@ -1345,25 +1345,22 @@ class Table(object):
             using=FILTER_OPERATORS
         )
 
+        # The items are decoded while the response is parsed.
         raw_results = self.connection.query(
             self.table_name,
+            object_hook=self._dynamizer.json_object_hook,
             **kwargs
         )
         results = []
         last_key = None
 
-        for raw_item in raw_results.get('Items', []):
+        for item_data in raw_results.get('Items', []):
             item = Item(self)
-            item.load({
-                'Item': raw_item,
-            })
+            item.load_decoded(item_data)
             results.append(item)
 
         if raw_results.get('LastEvaluatedKey', None):
-            last_key = {}
-
-            for key, value in raw_results['LastEvaluatedKey'].items():
-                last_key[key] = self._dynamizer.decode(value)
+            last_key = raw_results['LastEvaluatedKey']
 
         return {
             'results': results,
@@ -1476,25 +1473,22 @@ class Table(object):
             using=FILTER_OPERATORS
         )
 
+        # The items are decoded while the response is parsed.
         raw_results = self.connection.scan(
             self.table_name,
+            object_hook=self._dynamizer.json_object_hook,
             **kwargs
         )
         results = []
         last_key = None
 
-        for raw_item in raw_results.get('Items', []):
+        for item_data in raw_results.get('Items', []):
             item = Item(self)
-            item.load({
-                'Item': raw_item,
-            })
+            item.load_decoded(item_data)
             results.append(item)
 
         if raw_results.get('LastEvaluatedKey', None):
-            last_key = {}
-
-            for key, value in raw_results['LastEvaluatedKey'].items():
-                last_key[key] = self._dynamizer.decode(value)
+            last_key = raw_results['LastEvaluatedKey']
 
         return {
             'results': results,
@@ -1570,26 +1564,20 @@ class Table(object):
 
             items[self.table_name]['Keys'].append(raw_key)
 
-        raw_results = self.connection.batch_get_item(request_items=items)
+        # The items are decoded while the response is parsed.
+        raw_results = self.connection.batch_get_item(
+            request_items=items,
+            object_hook=self._dynamizer.json_object_hook
+        )
         results = []
-        unprocessed_keys = []
 
-        for raw_item in raw_results['Responses'].get(self.table_name, []):
+        for item_data in raw_results['Responses'].get(self.table_name, []):
             item = Item(self)
-            item.load({
-                'Item': raw_item,
-            })
+            item.load_decoded(item_data)
             results.append(item)
 
         raw_unprocessed = raw_results.get('UnprocessedKeys', {}).get(self.table_name, {})
-
-        for raw_key in raw_unprocessed.get('Keys', []):
-            py_key = {}
-
-            for key, value in raw_key.items():
-                py_key[key] = self._dynamizer.decode(value)
-
-            unprocessed_keys.append(py_key)
+        unprocessed_keys = raw_unprocessed.get('Keys', [])
 
         return {
             'results': results,
@@ -0,0 +1,161 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+
+"""
+Caches the results of EC2 Describe calls that are made over and over
+with the same arguments, such as ``get_all_images`` or
+``get_all_security_groups``::
+
+    conn = boto.ec2.connect_to_region('us-west-2')
+    conn.enable_describe_cache()
+
+Results are kept for a time that depends on the action, and are dropped
+early when the same connection makes a call that changes the resources
+they describe, e.g. ``RegisterImage`` for ``DescribeImages``. Changes made
+by other connections or processes are only seen once results expire.
+"""
+import threading
+import time
+
+from boto.resultset import ResultSet
+from boto.utils import LRUCache
+
+
+#: The seconds results of each cached action are kept for.
+DEFAULT_TTLS = {
+    'DescribeAvailabilityZones': 300,
+    'DescribeImages': 60,
+    'DescribeInstanceTypes': 3600,
+    'DescribeKeyPairs': 60,
+    'DescribeRegions': 3600,
+    'DescribeSecurityGroups': 30,
+}
+
+#: The actions dropping the cached results of each action.
+INVALIDATED_BY = {
+    'DescribeImages': ('RegisterImage', 'DeregisterImage', 'CreateImage',
+                       'CopyImage', 'ModifyImageAttribute',
+                       'ResetImageAttribute', 'CreateTags', 'DeleteTags'),
+    'DescribeKeyPairs': ('CreateKeyPair', 'DeleteKeyPair', 'ImportKeyPair'),
+    'DescribeSecurityGroups': ('CreateSecurityGroup', 'DeleteSecurityGroup',
+                               'AuthorizeSecurityGroupIngress',
+                               'AuthorizeSecurityGroupEgress',
+                               'RevokeSecurityGroupIngress',
+                               'RevokeSecurityGroupEgress', 'CreateTags',
+                               'DeleteTags'),
+}
+
+
+class DescribeCache(object):
+    """
+    A size-bounded cache of the results of Describe calls, keyed by action
+    and parameters.
+
+    :type ttls: dict
+    :param ttls: The seconds the results of each action are kept for,
+        overriding those of ``DEFAULT_TTLS``. Only the actions in the
+        resulting dict are cached; a TTL of 0 or None turns caching off for
+        an action.
+
+    :type max_entries: int
+    :param max_entries: The most results kept. The least recently used
+        results are dropped first.
+    """
+
+    def __init__(self, ttls=None, max_entries=256):
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_entries = max_entries
+        self._invalidates = {}
+        for action, mutators in INVALIDATED_BY.items():
+            for mutator in mutators:
+                self._invalidates.setdefault(mutator, set()).add(action)
+        self._entries = LRUCache(max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return 'DescribeCache(%d entries, hits=%d, misses=%d)' % (
+            len(self._entries), self.hits, self.misses)
+
+    def caches(self, action):
+        """
+        Returns True if the results of ``action`` are cached.
+        """
+        return bool(self.ttls.get(action))
+
+    def key(self, action, params, path, verb):
+        return (action, tuple(sorted((params or {}).items())), path, verb)
+
+    def get(self, key):
+        """
+        Returns a copy of the result cached under ``key``, or None if there
+        is none or it has expired.
+        """
+        with self._lock:
+            entry = None
+            if key in self._entries:
+                entry = self._entries[key]
+                if entry[0] <= time.time():
+                    del self._entries[key]
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return self._copy(entry[1])
+
+    def put(self, key, result):
+        """
+        Caches the result of the action in ``key`` for its TTL.
+        """
+        expires = time.time() + self.ttls[key[0]]
+        with self._lock:
+            self._entries[key] = (expires, self._copy(result))
+
+    def invalidate(self, action):
+        """
+        Drops the cached results made stale by a call to ``action``.
+        """
+        stale = self._invalidates.get(action)
+        if not stale:
+            return
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in stale]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Drops all cached results.
+        """
+        with self._lock:
+            self._entries = LRUCache(self.max_entries)
+
+    def _copy(self, result):
+        # The cached objects are shared, but not the list holding them, so
+        # that callers may sort or filter what they get.
+        copy = ResultSet(result.markers)
+        copy.extend(result)
+        copy.__dict__.update(result.__dict__)
+        return copy
@@ -0,0 +1,176 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+"""
+Client-side aggregation of CloudWatch metric data.
+"""
+import datetime
+import threading
+
+import boto
+from boto.compat import six
+
+# The maximum number of datums PutMetricData accepts per request.
+MAX_DATUMS_PER_REQUEST = 20
+
+
+class MetricPublisher(object):
+    """
+    Aggregates metric values in-process and publishes them to CloudWatch
+    from a background thread.
+
+    Every value passed to :func:`put` is folded into a statistic set
+    (minimum, maximum, sum and sample count) for its metric name, unit
+    and dimensions. Once per ``interval`` seconds the statistic sets are
+    sent with :meth:`boto.ec2.cloudwatch.CloudWatchConnection.put_metric_data`,
+    up to 20 per request, so :func:`put` never waits on the network.
+
+    At most ``max_series`` distinct metrics are aggregated per interval;
+    values for new metrics beyond that are dropped and counted in
+    ``dropped``, as are the values of a flush whose request fails::
+
+        publisher = MetricPublisher(cloudwatch, 'MyService')
+        publisher.put('Latency', 12.5, unit='Milliseconds',
+                      dimensions={'Operation': 'GetItem'})
+        ...
+        publisher.close()
+
+    :type connection: :class:`boto.ec2.cloudwatch.CloudWatchConnection`
+    :param connection: The connection used to publish metric data.
+
+    :type namespace: str
+    :param namespace: The namespace of the metrics.
+
+    :type interval: int
+    :param interval: The number of seconds between flushes.
+
+    :type max_series: int
+    :param max_series: The maximum number of distinct metrics aggregated
+        between flushes.
+    """
+    def __init__(self, connection, namespace, interval=60, max_series=10000):
+        self.connection = connection
+        self.namespace = namespace
+        self.interval = interval
+        self.max_series = max_series
+        self.sent = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._series = {}
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, name, value, unit='None', dimensions=None):
+        """
+        Add a value to the statistic set of a metric.
+
+        :type name: str
+        :param name: The name of the metric.
+
+        :type value: float
+        :param value: The value for the metric.
+
+        :type unit: str
+        :param unit: The unit of the metric. See
+            :meth:`boto.ec2.cloudwatch.CloudWatchConnection.put_metric_data`
+            for the valid values.
+
+        :type dimensions: dict
+        :param dimensions: Add extra name value pairs to associate
+            with the metric, i.e.:
+            {'name1': value1, 'name2': (value2, value3)}
+        """
+        key = (name, unit, self._dimensions_key(dimensions))
+        with self._lock:
+            stats = self._series.get(key)
+            if stats is None:
+                if len(self._series) >= self.max_series:
+                    self.dropped += 1
+                    return
+                self._series[key] = {
+                    'timestamp': datetime.datetime.utcnow(),
+                    'dimensions': dimensions or {},
+                    'statistics': {'maximum': value, 'minimum': value,
+                                   'samplecount': 1, 'sum': value},
+                }
+                return
+            statistics = stats['statistics']
+            if value > statistics['maximum']:
+                statistics['maximum'] = value
+            if value < statistics['minimum']:
+                statistics['minimum'] = value
+            statistics['samplecount'] += 1
+            statistics['sum'] += value
+
+    def flush(self):
+        """
+        Publish every statistic set aggregated since the last flush.
+        """
+        with self._lock:
+            series, self._series = self._series, {}
+        items = list(series.items())
+        for start in range(0, len(items), MAX_DATUMS_PER_REQUEST):
+            batch = items[start:start + MAX_DATUMS_PER_REQUEST]
+            try:
+                self.connection.put_metric_data(
+                    self.namespace,
+                    [key[0] for key, stats in batch],
+                    timestamp=[stats['timestamp'] for key, stats in batch],
+                    unit=[key[1] for key, stats in batch],
+                    dimensions=[stats['dimensions'] for key, stats in batch],
+                    statistics=[stats['statistics'] for key, stats in batch])
+            except Exception as e:
+                boto.log.error('Unable to publish %s metrics to %s: %s',
+                               len(batch), self.namespace, e)
+                with self._lock:
+                    self.dropped += sum(stats['statistics']['samplecount']
+                                        for key, stats in batch)
+                continue
+            with self._lock:
+                self.sent += len(batch)
+
+    def close(self):
+        """
+        Stop the background thread and publish any remaining values.
+        """
+        self._stopped.set()
+        self._thread.join()
+        self.flush()
+
+    def _dimensions_key(self, dimensions):
+        if not dimensions:
+            return ()
+        key = []
+        for name, value in six.iteritems(dimensions):
+            if not isinstance(value, six.string_types) and value is not None:
+                value = tuple(value)
+            key.append((name, value))
+        return tuple(sorted(key))
+
+    def _run(self):
+        while True:
+            # Event.wait() only returns the flag from Python 2.7 on.
+            self._stopped.wait(self.interval)
+            if self._stopped.is_set():
+                break
+            self.flush()
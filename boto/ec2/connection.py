@@ -63,6 +63,9 @@ from boto.ec2.instancestatus import InstanceStatusSet
 from boto.ec2.volumestatus import VolumeStatusSet
 from boto.ec2.networkinterface import NetworkInterface
 from boto.ec2.attributes import AccountAttribute, VPCAttribute
+from boto.ec2.waiter import ResourceWaiter
+from boto.ec2.cache import DescribeCache
+from boto.ec2.paginator import item_lister
 from boto.ec2.blockdevicemapping import BlockDeviceMapping, BlockDeviceType
 from boto.exception import EC2ResponseError
 from boto.compat import six
@@ -103,10 +106,77 @@ class EC2Connection(AWSQueryConnection):
                                             profile_name=profile_name)
         if api_version:
             self.APIVersion = api_version
+        self.describe_cache = None
 
     def _required_auth_capability(self):
         return ['hmac-v4']
 
+    def enable_describe_cache(self, ttls=None, max_entries=256):
+        """
+        Caches the results of read-mostly Describe calls, such as
+        ``get_all_images``, ``get_all_security_groups`` and
+        ``get_all_zones``, so that repeating a call with the same arguments
+        doesn't make another request until the result expires. Results are
+        dropped early when this connection changes the resources they
+        describe, but changes made elsewhere are only seen once they
+        expire.
+
+        The objects in cached results are shared by everyone getting them,
+        so they should not be modified.
+
+        :type ttls: dict
+        :param ttls: The seconds the results of each action are kept for,
+            overriding those of ``boto.ec2.cache.DEFAULT_TTLS``, e.g.
+            ``{'DescribeImages': 300}``.
+
+        :type max_entries: int
+        :param max_entries: The most results kept.
+
+        :rtype: :class:`boto.ec2.cache.DescribeCache`
+        :return: The cache, which counts its ``hits`` and ``misses``.
+        """
+        self.describe_cache = DescribeCache(ttls, max_entries)
+        return self.describe_cache
+
+    def disable_describe_cache(self):
+        """
+        Stops caching the results of Describe calls.
+        """
+        self.describe_cache = None
+
+    def build_request(self, action, params=None, path='/', verb='GET'):
+        # Requests sent some other way, e.g. by AsyncConnection, don't go
+        # through make_request, so the cache is invalidated here for them.
+        if self.describe_cache is not None:
+            self.describe_cache.invalidate(action)
+        return super(EC2Connection, self).build_request(action, params,
+                                                        path, verb)
+
+    def make_request(self, action, params=None, path='/', verb='GET'):
+        try:
+            return super(EC2Connection, self).make_request(action, params,
+                                                           path, verb)
+        finally:
+            # Even a failed call may have changed something.
+            if self.describe_cache is not None:
+                self.describe_cache.invalidate(action)
+
+    def get_list(self, action, params, markers, path='/',
+                 parent=None, verb='GET'):
+        cache = self.describe_cache
+        if cache is None or parent is not None or not cache.caches(action):
+            return super(EC2Connection, self).get_list(action, params,
+                                                       markers, path,
+                                                       parent, verb)
+        key = cache.key(action, params, path, verb)
+        result = cache.get(key)
+        if result is None:
+            result = super(EC2Connection, self).get_list(action, params,
+                                                         markers, path,
+                                                         parent, verb)
+            cache.put(key, result)
+        return result
+
     def get_params(self):
         """
         Returns a dictionary containing the value of all of the keyword
@@ -680,6 +750,80 @@ class EC2Connection(AWSQueryConnection):
         return self.get_list('DescribeInstances', params,
                              [('item', Reservation)], verb='POST')
 
+    def iter_reservations(self, instance_ids=None, filters=None,
+                          dry_run=False, page_size=None, prefetch=True):
+        """
+        Iterate over all the instance reservations associated with your
+        account, fetching them a page at a time. Takes the same arguments
+        as :meth:`get_all_reservations`, plus:
+
+        :type page_size: int
+        :param page_size: The most reservations fetched per request.
+
+        :type prefetch: bool
+        :param prefetch: Whether to fetch the next page of results in the
+            background while the current one is consumed.
+
+        :rtype: iterator
+        :return: An iterator of :class:`boto.ec2.instance.Reservation`
+        """
+        return item_lister(self.get_all_reservations, prefetch=prefetch,
+                           instance_ids=instance_ids, filters=filters,
+                           dry_run=dry_run, max_results=page_size)
+
+    def iter_instances(self, instance_ids=None, filters=None, dry_run=False,
+                       page_size=None, prefetch=True):
+        """
+        Iterate over all the instances associated with your account,
+        fetching them a page at a time. Takes the same arguments as
+        :meth:`iter_reservations`.
+
+        :rtype: iterator
+        :return: An iterator of :class:`boto.ec2.instance.Instance`
+        """
+        for reservation in self.iter_reservations(instance_ids, filters,
+                                                  dry_run, page_size,
+                                                  prefetch):
+            for instance in reservation.instances:
+                yield instance
+
+    def wait_for_state(self, resources, state, timeout=None, interval=5,
+                       max_interval=60):
+        """
+        Wait for instances, volumes, snapshots or images to reach a state,
+        polling them together with one filtered Describe call per type of
+        resource (per 200 resources) rather than one call per resource.
+        The resources are updated in place.
+
+        :type resources: list
+        :param resources: The :class:`boto.ec2.instance.Instance`,
+            :class:`boto.ec2.volume.Volume`,
+            :class:`boto.ec2.snapshot.Snapshot` or
+            :class:`boto.ec2.image.Image` objects to wait for.
+
+        :type state: str
+        :param state: The state to wait for, e.g. ``'running'``.
+
+        :type timeout: float
+        :param timeout: The most seconds to wait for.
+
+        :type interval: float
+        :param interval: The seconds between the first two polls. Later
+            polls back off up to ``max_interval`` seconds apart.
+
+        :rtype: list
+        :return: The resources.
+
+        :raises: :class:`boto.exception.WaiterError` if a resource fails
+            (e.g. an instance being terminated while waiting for it to
+            run) or the timeout expires.
+        """
+        waiter = ResourceWaiter(self, interval=interval,
+                                max_interval=max_interval)
+        waits = [waiter.add(resource, state) for resource in resources]
+        waiter.wait(timeout)
+        return [wait.result() for wait in waits]
+
     def get_all_instance_status(self, instance_ids=None,
                                 max_results=None, next_token=None,
                                 filters=None, dry_run=False,
@@ -735,6 +879,31 @@ class EC2Connection(AWSQueryConnection):
         return self.get_object('DescribeInstanceStatus', params,
                                InstanceStatusSet, verb='POST')
 
+    def iter_instance_status(self, instance_ids=None, filters=None,
+                             dry_run=False, include_all_instances=False,
+                             page_size=None, prefetch=True):
+        """
+        Iterate over the status of the instances in your account, fetching
+        them a page at a time. Takes the same arguments as
+        :meth:`get_all_instance_status`, plus:
+
+        :type page_size: int
+        :param page_size: The most statuses fetched per request.
+
+        :type prefetch: bool
+        :param prefetch: Whether to fetch the next page of results in the
+            background while the current one is consumed.
+
+        :rtype: iterator
+        :return: An iterator of
+            :class:`boto.ec2.instancestatus.InstanceStatus`
+        """
+        return item_lister(self.get_all_instance_status, prefetch=prefetch,
+                           instance_ids=instance_ids, filters=filters,
+                           dry_run=dry_run,
+                           include_all_instances=include_all_instances,
+                           max_results=page_size)
+
     def run_instances(self, image_id, min_count=1, max_count=1,
                       key_name=None, security_groups=None,
                       user_data=None, addressing_type=None,
@@ -1423,6 +1592,34 @@ class EC2Connection(AWSQueryConnection):
         return self.get_list('DescribeSpotPriceHistory', params,
                              [('item', SpotPriceHistory)], verb='POST')
 
+    def iter_spot_price_history(self, start_time=None, end_time=None,
+                                instance_type=None, product_description=None,
+                                availability_zone=None, filters=None,
+                                dry_run=False, page_size=None, prefetch=True):
+        """
+        Iterate over the history of spot instances pricing, fetching it a
+        page at a time. Takes the same arguments as
+        :meth:`get_spot_price_history`, plus:
+
+        :type page_size: int
+        :param page_size: The most prices fetched per request.
+
+        :type prefetch: bool
+        :param prefetch: Whether to fetch the next page of results in the
+            background while the current one is consumed.
+
+        :rtype: iterator
+        :return: An iterator of
+            :class:`boto.ec2.spotpricehistory.SpotPriceHistory`
+        """
+        return item_lister(self.get_spot_price_history, prefetch=prefetch,
+                           start_time=start_time, end_time=end_time,
+                           instance_type=instance_type,
+                           product_description=product_description,
+                           availability_zone=availability_zone,
+                           filters=filters, dry_run=dry_run,
+                           max_results=page_size)
+
     def request_spot_instances(self, price, image_id, count=1, type='one-time',
                                valid_from=None, valid_until=None,
                                launch_group=None, availability_zone_group=None,
@@ -4160,7 +4357,8 @@ class EC2Connection(AWSQueryConnection):
                 params['Tag.%d.Value' % i] = value
             i += 1
 
-    def get_all_tags(self, filters=None, dry_run=False, max_results=None):
+    def get_all_tags(self, filters=None, dry_run=False, max_results=None,
+                     next_token=None):
         """
         Retrieve all the metadata tags associated with your account.
 
@@ -4181,6 +4379,10 @@ class EC2Connection(AWSQueryConnection):
         :param max_results: The maximum number of paginated instance
             items per response.
 
+        :type next_token: str
+        :param next_token: A string specifying the next paginated set
+            of results to return.
+
         :rtype: list
         :return: A list of :class:`boto.ec2.tag.Tag` objects
         """
@@ -4191,9 +4393,32 @@ class EC2Connection(AWSQueryConnection):
             params['DryRun'] = 'true'
         if max_results is not None:
             params['MaxResults'] = max_results
+        if next_token:
+            params['NextToken'] = next_token
         return self.get_list('DescribeTags', params,
                              [('item', Tag)], verb='POST')
 
+    def iter_tags(self, filters=None, dry_run=False, page_size=None,
+                  prefetch=True):
+        """
+        Iterate over all the metadata tags associated with your account,
+        fetching them a page at a time. Takes the same arguments as
+        :meth:`get_all_tags`, plus:
+
+        :type page_size: int
+        :param page_size: The most tags fetched per request.
+
+        :type prefetch: bool
+        :param prefetch: Whether to fetch the next page of results in the
+            background while the current one is consumed.
+
+        :rtype: iterator
+        :return: An iterator of :class:`boto.ec2.tag.Tag`
+        """
+        return item_lister(self.get_all_tags, prefetch=prefetch,
+                           filters=filters, dry_run=dry_run,
+                           max_results=page_size)
+
     def create_tags(self, resource_ids, tags, dry_run=False):
         """
         Create new metadata tags for the specified resource ids.
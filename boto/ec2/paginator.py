@@ -0,0 +1,106 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+
+"""
+Iterates over every result of an EC2 Describe call that pages its results
+with ``MaxResults`` and ``NextToken``, fetching one page at a time::
+
+    for instance in conn.iter_instances(page_size=1000):
+        print(instance.id)
+
+While the results of one page are being consumed, the next page is
+fetched by a background thread, so that the time spent waiting for EC2
+overlaps with the time spent processing its results. At most two pages
+are held in memory at once.
+"""
+import threading
+
+
+class _PageFetch(threading.Thread):
+    """
+    Fetches a page in the background.
+    """
+
+    def __init__(self, method, kwargs):
+        super(_PageFetch, self).__init__()
+        self.daemon = True
+        self.method = method
+        self.kwargs = kwargs
+        self.page = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.page = self.method(**self.kwargs)
+        except Exception as e:
+            self.error = e
+
+    def result(self):
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.page
+
+
+def page_lister(method, next_token=None, prefetch=True, **kwargs):
+    """
+    A generator function for the pages of results of a paginated call.
+
+    :type method: callable
+    :param method: The method making the call, e.g.
+        ``conn.get_all_reservations``. It is passed ``next_token`` and
+        ``kwargs`` and must return a list with a ``next_token`` attribute.
+
+    :type next_token: str
+    :param next_token: The token of the first page to fetch, if not the
+        first page of all.
+
+    :type prefetch: bool
+    :param prefetch: Whether to fetch the next page in the background
+        while the current one is consumed.
+    """
+    page = method(next_token=next_token, **kwargs)
+    while True:
+        next_token = getattr(page, 'next_token', None)
+        fetch = None
+        if next_token:
+            fetch_kwargs = dict(kwargs, next_token=next_token)
+            if prefetch:
+                fetch = _PageFetch(method, fetch_kwargs)
+                fetch.start()
+        yield page
+        if not next_token:
+            return
+        if fetch is not None:
+            page = fetch.result()
+        else:
+            page = method(**fetch_kwargs)
+
+
+def item_lister(method, next_token=None, prefetch=True, **kwargs):
+    """
+    A generator function for every result of a paginated call. Takes the
+    same arguments as :func:`page_lister`.
+    """
+    for page in page_lister(method, next_token, prefetch, **kwargs):
+        for item in page:
+            yield item
@@ -0,0 +1,239 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""
+Waits for many EC2 instances, volumes, snapshots and images to reach a
+state, polling all of them with a few Describe calls rather than one
+``update()`` call per resource::
+
+    waiter = ResourceWaiter(conn)
+    for instance in reservation.instances:
+        waiter.add(instance, 'running')
+    waiter.wait(timeout=600)
+"""
+import time
+
+import boto
+from boto.exception import WaiterError
+from boto.ec2.image import Image
+from boto.ec2.instance import Instance
+from boto.ec2.snapshot import Snapshot
+from boto.ec2.volume import Volume
+
+
+class ResourceKind(object):
+    """
+    How resources of one type are described, and which of their states
+    mean they will never reach another state.
+    """
+
+    def __init__(self, name, method, filter_name, state_attr,
+                 failure_states, gone_states):
+        self.name = name
+        self.method = method
+        self.filter_name = filter_name
+        self.state_attr = state_attr
+        self.failure_states = failure_states
+        self.gone_states = gone_states
+
+    def describe(self, connection, ids):
+        describe = getattr(connection, self.method)
+        return describe(filters={self.filter_name: ids})
+
+
+RESOURCE_KINDS = {
+    Instance: ResourceKind('instance', 'get_only_instances', 'instance-id',
+                           'state', ('shutting-down',), ('terminated',)),
+    Volume: ResourceKind('volume', 'get_all_volumes', 'volume-id', 'status',
+                         ('error',), ('deleted',)),
+    Snapshot: ResourceKind('snapshot', 'get_all_snapshots', 'snapshot-id',
+                           'status', ('error',), ('deleted',)),
+    Image: ResourceKind('image', 'get_all_images', 'image-id', 'state',
+                        ('failed',), ('deregistered',)),
+}
+
+
+class ResourceWait(object):
+    """
+    A resource being waited for, much like a future.
+
+    ``done`` is True once the resource has reached the state, failed or
+    timed out; in the latter cases, ``error`` is a
+    :class:`boto.exception.WaiterError`.
+    """
+
+    def __init__(self, resource, state, kind, callback=None):
+        self.resource = resource
+        self.state = state
+        self.kind = kind
+        self.callback = callback
+        self.done = False
+        self.error = None
+
+    def __repr__(self):
+        return 'ResourceWait(%s, %s)' % (self.resource.id, self.state)
+
+    def result(self):
+        """
+        Returns the resource if it reached the state, or raises the error.
+        """
+        if not self.done:
+            raise WaiterError('Still waiting for %s to be %s' % (
+                self.resource.id, self.state), self.resource)
+        if self.error is not None:
+            raise self.error
+        return self.resource
+
+    def _resolve(self, error=None):
+        self.done = True
+        self.error = error
+        if self.callback is not None:
+            self.callback(self)
+
+
+class ResourceWaiter(object):
+    """
+    Waits for EC2 resources to reach states.
+
+    Each poll describes the pending resources of each type with as few
+    filtered calls as possible, updates the resource objects in place, and
+    resolves those that are done. The time between polls starts at
+    ``interval`` and is multiplied by ``backoff`` after every poll, up to
+    ``max_interval``.
+
+    :type connection: :class:`boto.ec2.connection.EC2Connection`
+    :param connection: The connection to poll with.
+
+    :type interval: float
+    :param interval: The seconds between the first polls.
+
+    :type max_interval: float
+    :param max_interval: The most seconds between polls.
+
+    :type backoff: float
+    :param backoff: How much longer each wait between polls is than the
+        one before.
+
+    :type chunk_size: int
+    :param chunk_size: The most resource IDs given to one Describe call.
+    """
+
+    def __init__(self, connection, interval=5, max_interval=60, backoff=1.5,
+                 chunk_size=200):
+        self.connection = connection
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.chunk_size = chunk_size
+        self.pending = []
+
+    def add(self, resource, state, callback=None):
+        """
+        Starts waiting for a resource to reach a state.
+
+        :type resource: :class:`boto.ec2.instance.Instance`,
+            :class:`boto.ec2.volume.Volume`,
+            :class:`boto.ec2.snapshot.Snapshot` or
+            :class:`boto.ec2.image.Image`
+        :param resource: The resource to wait for.
+
+        :type state: str
+        :param state: The state to wait for, e.g. ``'running'`` for an
+            instance or ``'available'`` for a volume.
+
+        :type callback: callable
+        :param callback: Called with the :class:`ResourceWait` when it is
+            done.
+
+        :rtype: :class:`ResourceWait`
+        """
+        for cls, kind in RESOURCE_KINDS.items():
+            if isinstance(resource, cls):
+                break
+        else:
+            raise TypeError("Can't wait for %r" % resource)
+        wait = ResourceWait(resource, state, kind, callback)
+        self.pending.append(wait)
+        return wait
+
+    def poll(self):
+        """
+        Describes the pending resources once, resolving those that are done.
+
+        :rtype: int
+        :return: The number of resources still pending.
+        """
+        by_kind = {}
+        for wait in self.pending:
+            by_kind.setdefault(wait.kind.name, []).append(wait)
+        for waits in by_kind.values():
+            kind = waits[0].kind
+            ids = sorted(set(wait.resource.id for wait in waits))
+            found = {}
+            for start in range(0, len(ids), self.chunk_size):
+                chunk = ids[start:start + self.chunk_size]
+                for described in kind.describe(self.connection, chunk):
+                    found[described.id] = described
+            for wait in waits:
+                self._check(wait, found.get(wait.resource.id))
+        self.pending = [wait for wait in self.pending if not wait.done]
+        return len(self.pending)
+
+    def _check(self, wait, described):
+        kind = wait.kind
+        if described is None:
+            # Newly created resources may not be visible yet, while deleted
+            # ones eventually disappear.
+            if wait.state in kind.gone_states:
+                wait._resolve()
+            return
+        wait.resource._update(described)
+        state = getattr(wait.resource, kind.state_attr)
+        if state == wait.state:
+            wait._resolve()
+        elif wait.state in kind.gone_states:
+            # Anything may come before a resource is gone.
+            return
+        elif state in kind.failure_states or state in kind.gone_states:
+            wait._resolve(WaiterError('%s is %s, not %s' % (
+                wait.resource.id, state, wait.state), wait.resource))
+
+    def wait(self, timeout=None):
+        """
+        Polls until every resource is done, or ``timeout`` seconds have
+        passed, in which case the remaining resources fail with a
+        :class:`boto.exception.WaiterError`.
+        """
+        if timeout is not None:
+            deadline = time.time() + timeout
+        interval = self.interval
+        while self.poll():
+            if timeout is not None and time.time() + interval > deadline:
+                pending, self.pending = self.pending, []
+                for wait in pending:
+                    wait._resolve(WaiterError(
+                        'Timed out waiting for %s to be %s' % (
+                            wait.resource.id, wait.state), wait.resource))
+                return
+            boto.log.debug('Waiting %.1fs for %d EC2 resources' % (
+                interval, len(self.pending)))
+            time.sleep(interval)
+            interval = min(interval * self.backoff, self.max_interval)
@@ -430,6 +430,22 @@ class AWSConnectionError(BotoClientError):
     pass
 
 
+class WaiterError(BotoClientError):
+    """
+    A resource being waited for failed, or didn't reach the expected state
+    in time.
+    """
+    def __init__(self, reason, resource=None, *args):
+        super(WaiterError, self).__init__(reason, *args)
+        self.resource = resource
+
+    def __repr__(self):
+        return 'WaiterError: %s' % self.reason
+
+    def __str__(self):
+        return 'WaiterError: %s' % self.reason
+
+
 class StorageDataError(BotoClientError):
     """
     Error receiving data from a storage service.
@@ -25,8 +25,7 @@ import threading
 import hashlib
 import time
 import logging
-from boto.compat import Queue
-import binascii
+from boto.compat import Queue, Empty
 
 from boto.glacier.utils import DEFAULT_PART_SIZE, minimum_part_size, \
                                chunk_hashes, tree_hash, bytes_to_hex
@@ -36,6 +35,7 @@ from boto.glacier.exceptions import UploadArchiveError, \
 
 
 _END_SENTINEL = object()
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 log = logging.getLogger('boto.glacier.concurrent')
 
 
@@ -293,6 +293,10 @@ class ConcurrentDownloader(ConcurrentTransferer):
         """
         Concurrently download an archive.
 
+        Each worker thread writes the parts it downloads directly to
+        their offsets in ``filename``, so only the tree hashes of the
+        parts are passed back to the calling thread.
+
         :param filename: The filename to download the archive to
         :type filename: str
 
@@ -301,8 +305,12 @@ class ConcurrentDownloader(ConcurrentTransferer):
         total_parts, part_size = self._calculate_required_part_size(total_size)
         worker_queue = Queue()
         result_queue = Queue()
+        # Create the file up front so that every worker can open it
+        # and write its parts in place.
+        with open(filename, "wb") as f:
+            f.truncate(total_size)
         self._add_work_items_to_queue(total_parts, worker_queue, part_size)
-        self._start_download_threads(result_queue, worker_queue)
+        self._start_download_threads(result_queue, worker_queue, filename)
         try:
             self._wait_for_download_threads(filename, result_queue, total_parts)
         except DownloadArchiveError as e:
@@ -315,29 +323,25 @@ class ConcurrentDownloader(ConcurrentTransferer):
         Waits until the result_queue is filled with all the downloaded parts
         This indicates that all part downloads have completed
 
-        Saves downloaded parts into filename
+        The parts have already been written to filename by the worker
+        threads, so only their tree hashes are collected here.
 
         :param filename:
         :param result_queue:
         :param total_parts:
         """
         hash_chunks = [None] * total_parts
-        with open(filename, "wb") as f:
-            for _ in range(total_parts):
-                result = result_queue.get()
-                if isinstance(result, Exception):
-                    log.debug("An error was found in the result queue, "
-                              "terminating threads: %s", result)
-                    self._shutdown_threads()
-                    raise DownloadArchiveError(
-                        "An error occurred while uploading "
-                        "an archive: %s" % result)
-                part_number, part_size, actual_hash, data = result
-                hash_chunks[part_number] = actual_hash
-                start_byte = part_number * part_size
-                f.seek(start_byte)
-                f.write(data)
-                f.flush()
+        for _ in range(total_parts):
+            result = result_queue.get()
+            if isinstance(result, Exception):
+                log.debug("An error was found in the result queue, "
+                          "terminating threads: %s", result)
+                self._shutdown_threads()
+                raise DownloadArchiveError(
+                    "An error occurred while uploading "
+                    "an archive: %s" % result)
+            part_number, part_size, actual_hash = result
+            hash_chunks[part_number] = actual_hash
         final_hash = bytes_to_hex(tree_hash(hash_chunks))
         log.debug("Verifying final tree hash of archive, expecting: %s, "
                   "actual: %s", self._job.sha256_treehash, final_hash)
@@ -349,11 +353,11 @@ class ConcurrentDownloader(ConcurrentTransferer):
                                            final_hash))
         self._shutdown_threads()
 
-    def _start_download_threads(self, result_queue, worker_queue):
+    def _start_download_threads(self, result_queue, worker_queue, filename):
         log.debug("Starting threads.")
         for _ in range(self._num_threads):
-            thread = DownloadWorkerThread(self._job, worker_queue, result_queue)
-            time.sleep(0.2)
+            thread = DownloadWorkerThread(self._job, worker_queue,
+                                          result_queue, filename)
             thread.start()
             self._threads.append(thread)
 
@@ -361,6 +365,7 @@ class ConcurrentDownloader(ConcurrentTransferer):
 class DownloadWorkerThread(TransferThread):
     def __init__(self, job,
                  worker_queue, result_queue,
+                 filename,
                  num_retries=5,
                  time_between_retries=5,
                  retry_exceptions=Exception):
@@ -368,18 +373,21 @@ class DownloadWorkerThread(TransferThread):
         Individual download thread that will download parts of the file from Glacier. Parts
         to download stored in work queue.
 
-        Parts download to a temp dir with each part a separate file
+        Each part is streamed from Glacier and written directly to its
+        offset in ``filename``, which must already exist.
 
         :param job: Glacier job object
         :param work_queue: A queue of tuples which include the part_number and
             part_size
-        :param result_queue: A priority queue of tuples which include the
-            part_number and the path to the temp file that holds that
-            part's data.
+        :param result_queue: A queue of tuples which include the
+            part_number, the part_size and the tree hash of that part.
+        :param filename: The filename the archive is being downloaded to.
 
         """
         super(DownloadWorkerThread, self).__init__(worker_queue, result_queue)
         self._job = job
+        self._filename = filename
+        self._fileobj = open(filename, 'r+b')
         self._num_retries = num_retries
         self._time_between_retries = time_between_retries
         self._retry_exceptions = retry_exceptions
@@ -405,8 +413,9 @@ class DownloadWorkerThread(TransferThread):
 
     def _download_chunk(self, work):
         """
-        Downloads a chunk of archive from Glacier. Saves the data to a temp file
-        Returns the part number and temp file location
+        Downloads a chunk of archive from Glacier and writes it to its
+        offset in the output file, hashing it as it is read.
+        Returns the part number, part size and tree hash of the part
 
         :param work:
         """
@@ -415,11 +424,35 @@ class DownloadWorkerThread(TransferThread):
         byte_range = (start_byte, start_byte + part_size - 1)
         log.debug("Downloading chunk %s of size %s", part_number, part_size)
         response = self._job.get_output(byte_range)
-        data = response.read()
-        actual_hash = bytes_to_hex(tree_hash(chunk_hashes(data)))
+        self._fileobj.seek(start_byte)
+        hashes = []
+        data = self._read_chunk(response)
+        while data:
+            self._fileobj.write(data)
+            hashes.append(hashlib.sha256(data).digest())
+            data = self._read_chunk(response)
+        self._fileobj.flush()
+        if not hashes:
+            hashes = [hashlib.sha256(b'').digest()]
+        tree_hash_bytes = tree_hash(hashes)
+        actual_hash = bytes_to_hex(tree_hash_bytes)
         if response['TreeHash'] != actual_hash:
             raise TreeHashDoesNotMatchError(
                 "Tree hash for part number %s does not match, "
                 "expected: %s, got: %s" % (part_number, response['TreeHash'],
                                            actual_hash))
-        return (part_number, part_size, binascii.unhexlify(actual_hash), data)
+        return (part_number, part_size, tree_hash_bytes)
+
+    def _read_chunk(self, response):
+        # The tree hash is defined over 1MB chunks, so keep reading
+        # until a full chunk is available or the body is exhausted.
+        data = response.read(_DOWNLOAD_CHUNK_SIZE)
+        while data and len(data) < _DOWNLOAD_CHUNK_SIZE:
+            more = response.read(_DOWNLOAD_CHUNK_SIZE - len(data))
+            if not more:
+                break
+            data += more
+        return data
+
+    def _cleanup(self):
+        self._fileobj.close()
@@ -21,7 +21,9 @@
 #
 import hashlib
 import math
+import mmap
 import binascii
+import threading
 
 from boto.compat import six
 
@@ -71,15 +73,50 @@ def minimum_part_size(size_in_bytes, default_part_size=DEFAULT_PART_SIZE):
     return part_size
 
 
-def chunk_hashes(bytestring, chunk_size=_MEGABYTE):
-    chunk_count = int(math.ceil(len(bytestring) / float(chunk_size)))
-    hashes = []
-    for i in range(chunk_count):
-        start = i * chunk_size
-        end = (i + 1) * chunk_size
-        hashes.append(hashlib.sha256(bytestring[start:end]).digest())
-    if not hashes:
+def chunk_hashes(bytestring, chunk_size=_MEGABYTE, num_threads=1):
+    """
+    Compute the SHA-256 digest of every ``chunk_size`` chunk of
+    ``bytestring``.
+
+    Chunks are sliced through a ``memoryview`` so no chunk is copied.
+    When ``num_threads`` is greater than one the chunks are hashed by
+    that many threads; hashlib releases the GIL while hashing, so this
+    uses multiple cores for large inputs.
+
+    """
+    try:
+        view = memoryview(bytestring)
+    except TypeError:
+        return _chunk_hashes(bytestring, chunk_size, num_threads)
+    try:
+        return _chunk_hashes(view, chunk_size, num_threads)
+    finally:
+        _release(view)
+
+
+def _chunk_hashes(view, chunk_size, num_threads):
+    chunk_count = int(math.ceil(len(view) / float(chunk_size)))
+    if not chunk_count:
         return [hashlib.sha256(b'').digest()]
+    hashes = [None] * chunk_count
+
+    def hash_chunks(first, step):
+        for i in range(first, chunk_count, step):
+            start = i * chunk_size
+            end = (i + 1) * chunk_size
+            hashes[i] = hashlib.sha256(view[start:end]).digest()
+
+    num_threads = min(num_threads, chunk_count)
+    if num_threads <= 1:
+        hash_chunks(0, 1)
+    else:
+        threads = [threading.Thread(target=hash_chunks,
+                                    args=(i, num_threads))
+                   for i in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
     return hashes
 
 
@@ -145,6 +182,72 @@ def compute_hashes_from_fileobj(fileobj, chunk_size=1024 * 1024):
     return linear_hash.hexdigest(), bytes_to_hex(tree_hash(chunks))
 
 
+def compute_hashes_from_filename(filename, chunk_size=_MEGABYTE,
+                                 num_threads=None):
+    """Compute the linear and tree hash of a file.
+
+    The file is memory mapped rather than read into memory.  The tree
+    hash chunks are hashed by ``num_threads`` threads while the linear
+    hash is computed by another, so large archives are hashed using
+    several cores.  Files that cannot be memory mapped (e.g. empty
+    files) are hashed with :func:`compute_hashes_from_fileobj`.
+
+    :param filename: The name of the file to hash.
+
+    :param chunk_size: The size of the chunks to use for the tree
+        hash.
+
+    :param num_threads: The number of threads used to compute the tree
+        hash chunks.  Defaults to the number of CPUs.
+
+    :rtype: tuple
+    :return: A tuple of (linear_hash, tree_hash).  Both hashes
+        are returned in hex.
+
+    """
+    if num_threads is None:
+        num_threads = _cpu_count()
+    with open(filename, 'rb') as fileobj:
+        try:
+            mapped = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            return compute_hashes_from_fileobj(fileobj, chunk_size)
+        view = memoryview(mapped)
+        try:
+            linear_hash = []
+            linear_thread = threading.Thread(target=_linear_hash,
+                                             args=(view, linear_hash))
+            linear_thread.start()
+            try:
+                chunks = chunk_hashes(view, chunk_size, num_threads)
+            finally:
+                linear_thread.join()
+        finally:
+            # The buffer export must be released before the mapping can
+            # be closed.
+            _release(view)
+            mapped.close()
+    return linear_hash[0], bytes_to_hex(tree_hash(chunks))
+
+
+def _linear_hash(view, result):
+    result.append(hashlib.sha256(view).hexdigest())
+
+
+def _release(view):
+    # memoryview.release() is new in Python 3.2.
+    if hasattr(view, 'release'):
+        view.release()
+
+
+def _cpu_count():
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+
 def bytes_to_hex(str_as_bytes):
     return binascii.hexlify(str_as_bytes)
 
@@ -24,10 +24,10 @@
 import codecs
 from boto.glacier.exceptions import UploadArchiveError
 from boto.glacier.job import Job
-from boto.glacier.writer import compute_hashes_from_fileobj, \
-                                resume_file_upload, Writer
+from boto.glacier.writer import resume_file_upload, Writer
 from boto.glacier.concurrent import ConcurrentUploader
-from boto.glacier.utils import minimum_part_size, DEFAULT_PART_SIZE
+from boto.glacier.utils import minimum_part_size, DEFAULT_PART_SIZE, \
+                               compute_hashes_from_filename
 import os.path
 
 
@@ -101,9 +101,8 @@ class Vault(object):
         :rtype: str
         :return: The archive id of the newly created archive
         """
+        linear_hash, tree_hash = compute_hashes_from_filename(filename)
         with open(filename, 'rb') as fileobj:
-            linear_hash, tree_hash = compute_hashes_from_fileobj(fileobj)
-            fileobj.seek(0)
             response = self.layer1.upload_archive(self.name, fileobj,
                                                   linear_hash, tree_hash,
                                                   description)
@@ -852,7 +852,7 @@ class KinesisConnection(AWSQueryConnection):
         return self.make_request(action='SplitShard',
                                  body=json.dumps(params))
 
-    def make_request(self, action, body):
+    def build_request(self, action, body):
         headers = {
             'X-Amz-Target': '%s.%s' % (self.TargetPrefix, action),
             'Host': self.region.endpoint,
@@ -862,8 +862,11 @@ class KinesisConnection(AWSQueryConnection):
         http_request = self.build_base_http_request(
             method='POST', path='/', auth_path='/', params={},
             headers=headers, data=body)
-        response = self._mexe(http_request, sender=None,
-                              override_num_retries=10)
+        return http_request, {'override_num_retries': 10}
+
+    def make_request(self, action, body):
+        http_request, kwargs = self.build_request(action, body)
+        response = self._mexe(http_request, **kwargs)
         response_body = response.read().decode('utf-8')
         boto.log.debug(response.getheaders())
         boto.log.debug(response_body)
@@ -0,0 +1,357 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+"""
+Timings and byte counts of the requests made by a connection.
+
+For every request, a connection with a request hook fills in a
+:class:`RequestMetrics` and passes it to the hook's
+``handle_request_metrics`` method once the response body has been read
+(or the response has been closed). :class:`MetricsHook` hands the metrics
+on to any number of sinks, e.g. a :class:`LatencyHistogram` or
+:func:`log_request_metrics`::
+
+    import boto
+    from boto.metrics import MetricsHook, LatencyHistogram
+
+    histogram = LatencyHistogram()
+    conn = boto.connect_sqs()
+    conn.set_request_hook(MetricsHook([histogram.record]))
+    ...
+    print(histogram.report())
+"""
+import bisect
+import threading
+import time
+
+import boto
+from boto.utils import RequestHook
+
+
+class RequestMetrics(object):
+    """
+    What happened while making one request.
+
+    The timestamps in ``marks`` (from ``time.time()``) are those of the
+    last attempt, if the request was retried:
+
+    * ``start`` - the request was handed to the connection.
+    * ``attempt`` - the last attempt started.
+    * ``signed`` - the request was signed.
+    * ``sent`` - the request was sent. This includes opening the
+      connection, unless a pooled one was reused.
+    * ``first_byte`` - the status line and headers of the response arrived.
+    * ``body_read`` - the response body was read.
+    * ``end`` - the metrics were reported.
+
+    The other attributes are:
+
+    * ``service``, ``operation``, ``method`` and ``host`` - what was
+      requested. The operation is the ``Action`` of query requests, the
+      target of JSON requests and the HTTP method otherwise.
+    * ``status`` - the HTTP status of the final response, if any.
+    * ``error`` - whether the request failed.
+    * ``attempts`` and ``retries`` - the number of attempts and retries.
+    * ``pool_hits`` and ``pool_misses`` - the number of times a pooled
+      connection was reused or a new one had to be made.
+    * ``connect_time`` - the seconds spent getting connections.
+    * ``retry_sleep`` - the seconds spent waiting before retries.
+    * ``request_bytes`` and ``response_bytes`` - the size of the request
+      and response bodies.
+    """
+
+    def __init__(self, service, operation, method, host):
+        self.service = service
+        self.operation = operation
+        self.method = method
+        self.host = host
+        self.status = None
+        self.error = False
+        self.attempts = 0
+        self.retries = 0
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.connect_time = 0.0
+        self.retry_sleep = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.marks = {'start': time.time()}
+        self._handler = None
+
+    def __repr__(self):
+        return '<RequestMetrics %s.%s status=%s total=%.3fs>' % (
+            self.service, self.operation, self.status,
+            self.durations().get('total', 0))
+
+    @classmethod
+    def for_request(cls, connection, request):
+        """
+        Starts the metrics of an ``HTTPRequest`` made by ``connection``.
+        """
+        name = connection.__class__.__name__
+        if name.endswith('Connection'):
+            name = name[:-len('Connection')]
+        operation = None
+        if request.params:
+            operation = request.params.get('Action')
+        target = request.headers.get('X-Amz-Target')
+        if operation is None and target:
+            operation = target.rsplit('.', 1)[-1]
+        return cls(name.lower() or 'aws', operation or request.method,
+                   request.method, request.host)
+
+    def measure_request(self, request):
+        """
+        Records the size of a signed request's body.
+        """
+        try:
+            self.request_bytes = int(request.headers['Content-Length'])
+        except (KeyError, TypeError, ValueError):
+            if request.body and hasattr(request.body, '__len__'):
+                self.request_bytes = len(request.body)
+
+    def mark(self, name, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        self.marks[name] = timestamp
+
+    def durations(self):
+        """
+        Returns the seconds spent in each phase of the request, as a dict
+        with (some of) the keys ``connect``, ``sign``, ``send``, ``wait``,
+        ``read``, ``retry_sleep`` and ``total``.
+        """
+        marks = self.marks
+        durations = {'connect': self.connect_time,
+                     'retry_sleep': self.retry_sleep}
+        phases = [('sign', 'attempt', 'signed'), ('send', 'signed', 'sent'),
+                  ('wait', 'sent', 'first_byte'),
+                  ('read', 'first_byte', 'body_read'),
+                  ('total', 'start', 'end')]
+        for phase, begin, end in phases:
+            if begin in marks and end in marks:
+                durations[phase] = marks[end] - marks[begin]
+        return durations
+
+    def report_to(self, handler):
+        """
+        Sets the callable the metrics are passed to by :meth:`finish`.
+        """
+        self._handler = handler
+
+    def finish(self, response_bytes=None, body_read=None):
+        """
+        Completes the metrics and reports them, the first time it is called.
+        """
+        handler, self._handler = self._handler, None
+        if handler is None:
+            return
+        if response_bytes is not None:
+            self.response_bytes = response_bytes
+        if body_read is not None:
+            self.mark('body_read', body_read)
+        self.mark('end')
+        try:
+            handler(self)
+        except Exception:
+            boto.log.exception('Error reporting request metrics')
+
+
+class NullMetrics(object):
+    """
+    Stands in for :class:`RequestMetrics` when a connection has no request
+    hook, so that nothing is timed or counted. Everything written to it is
+    discarded.
+    """
+    attempts = retries = pool_hits = pool_misses = 0
+    connect_time = retry_sleep = 0
+
+    def __setattr__(self, name, value):
+        pass
+
+    def measure_request(self, request):
+        pass
+
+    def mark(self, name, timestamp=None):
+        pass
+
+    def report_to(self, handler):
+        pass
+
+    def finish(self, response_bytes=None, body_read=None):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+class MetricsHook(RequestHook):
+    """
+    A request hook passing the metrics of every request to each of
+    ``sinks``, which are callables taking a :class:`RequestMetrics`.
+    """
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks or [])
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+
+    def handle_request_metrics(self, metrics):
+        for sink in self.sinks:
+            sink(metrics)
+
+
+def log_request_metrics(metrics):
+    """
+    A sink writing a line per request to the ``boto.perf`` logger.
+    """
+    durations = metrics.durations()
+    boto.perflog.debug(
+        '%s.%s: status=%s total=%dms %s attempts=%d pool_hits=%d '
+        'request_bytes=%d response_bytes=%d', metrics.service,
+        metrics.operation, metrics.status, durations.get('total', 0) * 1000,
+        ' '.join('%s=%dms' % (phase, durations[phase] * 1000)
+                 for phase in ('connect', 'sign', 'send', 'wait', 'read',
+                               'retry_sleep') if phase in durations),
+        metrics.attempts, metrics.pool_hits, metrics.request_bytes,
+        metrics.response_bytes)
+
+
+class LatencyHistogram(object):
+    """
+    Counts the latencies of requests in buckets, per service and operation.
+
+    :type phase: str
+    :param phase: The phase of the requests to measure, one of the keys of
+        :meth:`RequestMetrics.durations`. Defaults to the whole request.
+
+    :type bounds: list
+    :param bounds: The upper bounds of the buckets, in milliseconds. Slower
+        requests are counted in one more bucket.
+    """
+
+    DEFAULT_BOUNDS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000,
+                      10000, 30000, 60000]
+
+    def __init__(self, phase='total', bounds=None):
+        self.phase = phase
+        self.bounds = sorted(bounds or self.DEFAULT_BOUNDS)
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, metrics):
+        """
+        Counts a :class:`RequestMetrics`. Usable as a :class:`MetricsHook`
+        sink.
+        """
+        seconds = metrics.durations().get(self.phase)
+        if seconds is None:
+            return
+        self.add(metrics.service, metrics.operation, seconds * 1000,
+                 metrics.error)
+
+    def add(self, service, operation, milliseconds, error=False):
+        key = (service, operation)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    'buckets': [0] * (len(self.bounds) + 1), 'count': 0,
+                    'errors': 0, 'sum': 0.0, 'min': milliseconds,
+                    'max': milliseconds}
+            stats['buckets'][bisect.bisect_left(self.bounds,
+                                                milliseconds)] += 1
+            stats['count'] += 1
+            stats['sum'] += milliseconds
+            stats['min'] = min(stats['min'], milliseconds)
+            stats['max'] = max(stats['max'], milliseconds)
+            if error:
+                stats['errors'] += 1
+
+    def keys(self):
+        """
+        Returns the ``(service, operation)`` pairs seen so far.
+        """
+        with self._lock:
+            return sorted(self._stats)
+
+    def buckets(self, service, operation):
+        """
+        Returns a list of ``(upper bound in ms, count)`` pairs. The upper
+        bound of the last bucket is None.
+        """
+        with self._lock:
+            counts = list(self._stats[(service, operation)]['buckets'])
+        return list(zip(self.bounds + [None], counts))
+
+    def percentile(self, service, operation, percent):
+        """
+        Returns the upper bound, in milliseconds, of the bucket holding the
+        given percentile of the latencies, or the slowest latency seen if
+        that's in the last bucket.
+        """
+        with self._lock:
+            stats = self._stats[(service, operation)]
+            rank = stats['count'] * percent / 100.0
+            seen = 0
+            for bound, count in zip(self.bounds, stats['buckets']):
+                seen += count
+                if seen >= rank and count:
+                    return min(bound, stats['max'])
+            return stats['max']
+
+    def summary(self):
+        """
+        Returns a dict mapping ``(service, operation)`` to a dict of the
+        ``count``, ``errors``, ``mean``, ``min``, ``max``, ``p50``, ``p90``
+        and ``p99`` latencies in milliseconds.
+        """
+        summary = {}
+        for service, operation in self.keys():
+            with self._lock:
+                stats = dict(self._stats[(service, operation)])
+            summary[(service, operation)] = {
+                'count': stats['count'], 'errors': stats['errors'],
+                'mean': stats['sum'] / stats['count'],
+                'min': stats['min'], 'max': stats['max'],
+                'p50': self.percentile(service, operation, 50),
+                'p90': self.percentile(service, operation, 90),
+                'p99': self.percentile(service, operation, 99),
+            }
+        return summary
+
+    def report(self):
+        """
+        Returns the summary as a table.
+        """
+        lines = ['%-40s %8s %6s %9s %9s %9s %9s' % (
+            'operation', 'count', 'errors', 'mean', 'p50', 'p90', 'p99')]
+        for (service, operation), stats in sorted(self.summary().items()):
+            lines.append('%-40s %8d %6d %7.1fms %7.1fms %7.1fms %7.1fms' % (
+                '%s.%s' % (service, operation), stats['count'],
+                stats['errors'], stats['mean'], stats['p50'], stats['p90'],
+                stats['p99']))
+        return '\n'.join(lines)
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
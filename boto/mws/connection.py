@@ -22,6 +22,7 @@ import xml.sax
 import hashlib
 import string
 import collections
+import threading
 from boto.connection import AWSQueryConnection
 from boto.exception import BotoServerError
 import boto.mws.exception
@@ -60,6 +61,15 @@ decorated_attrs = ('action', 'response', 'section',
 api_call_map = {}
 
 
+def check_content_md5(response, md5):
+    digest = response.getheader('Content-MD5')
+    if digest is not None:
+        computed = encodebytes(md5.digest()).strip()
+        if not isinstance(computed, str):
+            computed = computed.decode('utf-8')
+        assert computed == digest
+
+
 def add_attrs_from(func, to):
     for attr in decorated_attrs:
         setattr(to, attr, getattr(func, attr, None))
@@ -260,8 +270,48 @@ def api_action(section, quota, restore, *api):
     return decorator
 
 
+class _NextTokenFetch(threading.Thread):
+    """
+    Makes a ByNextToken call in the background. Until the call is sent,
+    it can be cancelled; time spent waiting for quota is spent waiting
+    for that instead.
+    """
+
+    def __init__(self, connection, method, next_token):
+        super(_NextTokenFetch, self).__init__()
+        self.daemon = True
+        self.connection = connection
+        self.method = method
+        self.next_token = next_token
+        self.response = None
+        self.error = None
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+        self.join()
+
+    def run(self):
+        try:
+            wait = self.connection._quota_wait_time(self.method)
+            if wait:
+                self._cancelled.wait(wait)
+            if self._cancelled.is_set():
+                return
+            self.response = self.method(NextToken=self.next_token)
+        except Exception as e:
+            self.error = e
+
+    def result(self):
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
 class MWSConnection(AWSQueryConnection):
 
+    BufferSize = 65536
     ResponseFactory = boto.mws.response.ResponseFactory
     ResponseErrorFactory = boto.mws.exception.ResponseErrorFactory
 
@@ -270,6 +320,7 @@ class MWSConnection(AWSQueryConnection):
         self._sandboxed = kw.pop('sandbox', False)
         self.Merchant = kw.pop('Merchant', None) or kw.get('SellerId')
         self.SellerId = kw.pop('SellerId', None) or self.Merchant
+        self.quota_scheduler = kw.pop('quota_scheduler', None)
         kw = self._setup_factories(kw.pop('factory_scopes', []), **kw)
         super(MWSConnection, self).__init__(*args, **kw)
 
@@ -297,36 +348,101 @@ class MWSConnection(AWSQueryConnection):
     def _required_auth_capability(self):
         return ['mws']
 
-    def _post_request(self, request, params, parser, body='', headers=None):
+    def _post_request(self, request, params, parser, body='', headers=None,
+                      fp=None):
         """Make a POST request, optionally with a content body,
-           and return the response, optionally as raw text.
+           and return the response, optionally as raw text. If a file
+           object is given as fp, a successful response is written to
+           it as it's read instead, and the number of bytes written
+           is returned.
         """
         headers = headers or {}
         path = self._sandboxify(request['path'])
+        retry_handler = None
+        if self.quota_scheduler is not None:
+            self.quota_scheduler.acquire(
+                params.get('SellerId') or params.get('Merchant'),
+                params.get('Action'), request['quota'], request['restore'])
+            retry_handler = self._quota_retry_handler(
+                params, request['quota'], request['restore'])
         request = self.build_base_http_request('POST', path, None, data=body,
                                                params=params, headers=headers,
                                                host=self.host)
         try:
-            response = self._mexe(request, override_num_retries=None)
+            response = self._mexe(request, retry_handler=retry_handler)
+        except boto.mws.exception.ResponseError:
+            # Already made by the retry handler.
+            raise
         except BotoServerError as bs:
-            raise self._response_error_factory(bs.status, bs.reason, bs.body)
+            raise self._response_error(params, bs.status, bs.reason, bs.body)
+        if fp is not None and response.status == 200:
+            return self._stream_response(response, fp)
         body = response.read()
         boto.log.debug(body)
         if not body:
             boto.log.error('Null body %s' % body)
-            raise self._response_error_factory(response.status,
-                                               response.reason, body)
+            raise self._response_error(params, response.status,
+                                       response.reason, body)
         if response.status != 200:
             boto.log.error('%s %s' % (response.status, response.reason))
             boto.log.error('%s' % body)
-            raise self._response_error_factory(response.status,
-                                               response.reason, body)
-        digest = response.getheader('Content-MD5')
-        if digest is not None:
-            assert content_md5(body) == digest
+            raise self._response_error(params, response.status,
+                                       response.reason, body)
+        check_content_md5(response, hashlib.md5(body))
         contenttype = response.getheader('Content-Type')
         return self._parse_response(parser, contenttype, body)
 
+    def _stream_response(self, response, fp):
+        md5 = hashlib.md5()
+        size = 0
+        while True:
+            chunk = response.read(self.BufferSize)
+            if not chunk:
+                break
+            md5.update(chunk)
+            fp.write(chunk)
+            size += len(chunk)
+        check_content_md5(response, md5)
+        return size
+
+    def _response_error(self, params, status, reason, body):
+        error = self._response_error_factory(status, reason, body)
+        if (self.quota_scheduler is not None and
+                getattr(error, 'error_code', None) == 'RequestThrottled'):
+            self.quota_scheduler.throttled(
+                params.get('SellerId') or params.get('Merchant'),
+                params.get('Action'))
+        return error
+
+    def _quota_retry_handler(self, params, quota, restore):
+        # MWS refuses calls over quota with a 503 RequestThrottled error,
+        # which _mexe would otherwise retry on its own backoff. Retries of
+        # throttled calls instead wait for the quota scheduler.
+        seller = params.get('SellerId') or params.get('Merchant')
+        action = params.get('Action')
+        num_retries = boto.config.getint('Boto', 'num_retries',
+                                         self.num_retries)
+
+        def retry_handler(response, i, next_sleep):
+            if response.status not in (500, 502, 503, 504):
+                return None
+            error = self._response_error(params, response.status,
+                                         response.reason, response.read())
+            if i >= num_retries:
+                raise error
+            if getattr(error, 'error_code', None) == 'RequestThrottled':
+                next_sleep = self.quota_scheduler.delay(seller, action,
+                                                        quota, restore)
+                msg = 'MWS %s throttled. Retrying in %.2f seconds' % (
+                    action, next_sleep)
+            elif self.retry_policy.acquire('server'):
+                msg = 'Received %d response.  Retrying in %3.1f seconds' % (
+                    response.status, next_sleep)
+            else:
+                raise error
+            return msg, i + 1, next_sleep
+        return retry_handler
+
     def _parse_response(self, parser, contenttype, body):
         if not contenttype.startswith('text/xml'):
             return body
@@ -347,22 +463,59 @@ class MWSConnection(AWSQueryConnection):
     def iter_call(self, call, *args, **kw):
         """Pass a call name as the first argument and a generator
            is returned for the initial response and any continuation
-           call responses made using the NextToken.
+           call responses made using the NextToken. See iter_response
+           for the prefetch argument.
         """
+        prefetch = kw.pop('prefetch', True)
         method = self.method_for(call)
         assert method, 'No call named "{0}"'.format(call)
-        return self.iter_response(method(*args, **kw))
+        return self.iter_response(method(*args, **kw), prefetch=prefetch)
 
-    def iter_response(self, response):
+    def iter_response(self, response, prefetch=True):
         """Pass a call's response as the initial argument and a
            generator is returned for the initial response and any
            continuation call responses made using the NextToken.
+           Unless prefetch is False, each continuation call is made
+           in the background while the previous response is consumed,
+           waiting on the quota_scheduler if there is one. Closing the
+           generator early cancels a call that is still waiting for
+           quota, or waits for one that has already been sent.
         """
-        yield response
         more = self.method_for(response._action + 'ByNextToken')
-        while more and response._result.HasNext == 'true':
-            response = more(NextToken=response._result.NextToken)
-            yield response
+        while True:
+            result = response._result
+            next_token = more and self._next_token(result)
+            fetch = None
+            if next_token and prefetch:
+                fetch = _NextTokenFetch(self, more, next_token)
+                fetch.start()
+            try:
+                yield response
+            except GeneratorExit:
+                if fetch is not None:
+                    fetch.cancel()
+                raise
+            if not next_token:
+                return
+            if fetch is not None:
+                response = fetch.result()
+            else:
+                response = more(NextToken=next_token)
+
+    def _quota_wait_time(self, method):
+        if self.quota_scheduler is None:
+            return 0.0
+        accesskey = api_version_path[method.section][1]
+        return self.quota_scheduler.wait_time(
+            getattr(self, accesskey, None), method.action, method.quota,
+            method.restore)
+
+    def _next_token(self, result):
+        # Only some APIs say whether there is a next page with HasNext;
+        # the others just leave out the NextToken.
+        if getattr(result, 'HasNext', 'true') != 'true':
+            return None
+        return getattr(result, 'NextToken', None)
 
     @requires(['FeedType'])
     @boolean_arguments('PurgeAndReplace')
@@ -409,10 +562,12 @@ class MWSConnection(AWSQueryConnection):
 
     @requires(['FeedSubmissionId'])
     @api_action('Feeds', 15, 60)
-    def get_feed_submission_result(self, request, response, **kw):
-        """Returns the feed processing report.
+    def get_feed_submission_result(self, request, response, fp=None, **kw):
+        """Returns the feed processing report. If a file object is
+           given as fp, the report is written to it as it's downloaded
+           and the number of bytes written is returned.
         """
-        return self._post_request(request, kw, response)
+        return self._post_request(request, kw, response, fp=fp)
 
     def get_service_status(self, **kw):
         """Instruct the user on how to get service status.
@@ -497,10 +652,13 @@ class MWSConnection(AWSQueryConnection):
 
     @requires(['ReportId'])
     @api_action('Reports', 15, 60)
-    def get_report(self, request, response, **kw):
-        """Returns the contents of a report.
+    def get_report(self, request, response, fp=None, **kw):
+        """Returns the contents of a report. If a file object is given
+           as fp, the report is written to it as it's downloaded, without
+           holding it all in memory, and the number of bytes written is
+           returned.
         """
-        return self._post_request(request, kw, response)
+        return self._post_request(request, kw, response, fp=fp)
 
     @requires(['ReportType', 'Schedule'])
     @api_action('Reports', 10, 45)
@@ -0,0 +1,178 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""
+Keeps MWS calls within their request quotas.
+
+Every MWS call has a quota (the most requests that can be made at once)
+and a restore rate (the seconds it takes for one more request to be
+allowed), as declared by ``@api_action`` in :mod:`boto.mws.connection`.
+Calls going over their quota are refused with ``RequestThrottled`` errors.
+
+A :class:`QuotaScheduler` keeps a token bucket per seller and action,
+delaying calls just long enough for them to stay within quota. It can be
+shared by the connections of several threads::
+
+    scheduler = QuotaScheduler()
+    conn = MWSConnection(SellerId='A1B2C3', quota_scheduler=scheduler)
+"""
+import threading
+import time
+
+import boto
+
+
+class QuotaBucket(object):
+    """
+    The requests allowed for one seller and action.
+
+    Requests are let through in the order they reserve a token; when none
+    are left, tokens are borrowed from the future, so that each request
+    waits until its own token has been restored.
+    """
+
+    def __init__(self, quota, restore, now):
+        self.quota = quota
+        self.restore = restore
+        self.tokens = float(quota)
+        self.updated = now
+
+    def _refill(self, now):
+        if self.restore > 0:
+            self.tokens = min(self.quota, self.tokens +
+                              (now - self.updated) / self.restore)
+        else:
+            self.tokens = float(self.quota)
+        self.updated = now
+
+    def reserve(self, now):
+        """
+        Takes a token, returning the seconds to wait until it's available.
+        """
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens * self.restore
+
+    def wait_time(self, now):
+        """
+        Returns the seconds until a token is available, without taking it.
+        """
+        self._refill(now)
+        return max(0.0, 1 - self.tokens) * self.restore
+
+    def drain(self, now):
+        """
+        Gives up any tokens left, e.g. after a request was throttled anyway
+        because of requests made by another process.
+        """
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class QuotaScheduler(object):
+    """
+    Delays MWS calls so that each seller's calls of each action stay
+    within the quota and restore rate of the action. Thread safe.
+
+    ``stats`` maps ``(seller, action)`` to a dict of:
+
+    * ``calls`` - the number of calls made.
+    * ``delayed`` - the number of calls that had to wait.
+    * ``wait_time`` - the seconds spent waiting.
+    * ``throttled`` - the number of calls throttled by MWS regardless.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def __repr__(self):
+        return 'QuotaScheduler(%d buckets)' % len(self._buckets)
+
+    def delay(self, seller, action, quota, restore):
+        """
+        Reserves a request of ``action`` for ``seller``, returning the
+        seconds to wait before making it.
+        """
+        if quota <= 0:
+            return 0.0
+        key = (seller, action)
+        with self._lock:
+            now = time.time()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = QuotaBucket(quota, restore,
+                                                          now)
+            wait = bucket.reserve(now)
+            stats = self._key_stats(key)
+            stats['calls'] += 1
+            if wait:
+                stats['delayed'] += 1
+                stats['wait_time'] += wait
+        return wait
+
+    def wait_time(self, seller, action, quota, restore):
+        """
+        Returns the seconds until a request of ``action`` could be made for
+        ``seller``, without reserving it.
+        """
+        if quota <= 0:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get((seller, action))
+            if bucket is None:
+                return 0.0
+            return bucket.wait_time(time.time())
+
+    def acquire(self, seller, action, quota, restore):
+        """
+        Waits until a request of ``action`` can be made for ``seller``.
+        """
+        wait = self.delay(seller, action, quota, restore)
+        if wait:
+            boto.log.debug('Waiting %.2fs for MWS %s quota' % (wait, action))
+            time.sleep(wait)
+        return wait
+
+    def throttled(self, seller, action):
+        """
+        Records that a request was throttled by MWS, so that the next ones
+        wait for the quota to be restored.
+        """
+        key = (seller, action)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.drain(time.time())
+            self._key_stats(key)['throttled'] += 1
+
+    def _key_stats(self, key):
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = {'calls': 0, 'delayed': 0,
+                                       'wait_time': 0.0, 'throttled': 0}
+        return stats
+
+    def reset_stats(self):
+        self.stats = {}
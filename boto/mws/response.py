@@ -32,7 +32,7 @@ class ComplexType(dict):
 
 class DeclarativeType(object):
     def __init__(self, _hint=None, **kw):
-        self._value = None
+        self._value = self._initial_value()
         if _hint is not None:
             self._hint = _hint
             return
@@ -45,6 +45,9 @@ class DeclarativeType(object):
         for name, value in kw.items():
             setattr(self._hint, name, value)
 
+    def _initial_value(self):
+        return None
+
     def __repr__(self):
         parent = getattr(self, '_parent', None)
         return '<{0}_{1}/{2}_{3}>'.format(self.__class__.__name__,
@@ -53,12 +56,15 @@ class DeclarativeType(object):
                                           hex(id(self.__class__)))
 
     def setup(self, parent, name, *args, **kw):
-        self._parent = parent
-        self._name = name
-        self._clone = self.__class__(_hint=self._hint)
-        self._clone._parent = parent
-        self._clone._name = name
-        setattr(self._parent, self._name, self._clone)
+        # Declarations are shared by every parse of their class, so the
+        # value is collected by a clone on the parent.  The clone skips
+        # __init__, which may build another JIT class.
+        clone = self.__class__.__new__(self.__class__)
+        clone._hint = self._hint
+        clone._value = self._initial_value()
+        clone._parent = parent
+        clone._name = name
+        setattr(parent, name, clone)
 
     def start(self, *args, **kw):
         raise NotImplementedError
@@ -80,9 +86,8 @@ class Element(DeclarativeType):
 
 
 class SimpleList(DeclarativeType):
-    def __init__(self, *args, **kw):
-        super(SimpleList, self).__init__(*args, **kw)
-        self._value = []
+    def _initial_value(self):
+        return []
 
     def start(self, *args, **kw):
         return None
@@ -133,8 +138,17 @@ class MemberList(Element):
 
 
 class ResponseFactory(object):
+    """
+    Makes the response object of each action, with a class found in the
+    ``scopes`` or made on the fly. The class of an action is only looked
+    up and made once; call :meth:`clear` after changing the scopes.
+    """
     def __init__(self, scopes=None):
         self.scopes = [] if scopes is None else scopes
+        self._classes = {}
+
+    def clear(self):
+        self._classes.clear()
 
     def element_factory(self, name, parent):
         class DynamicElement(parent):
@@ -160,11 +174,18 @@ class ResponseFactory(object):
                 return self.element_factory(action + suffix, element)
         return self.element_factory(action + suffix, parent)
 
-    def __call__(self, action, connection=None):
+    def response_class(self, action):
         response = self.find_element(action, 'Response', Response)
         if not hasattr(response, action + 'Result'):
             result = self.find_element(action, 'Result', ResponseElement)
             setattr(response, action + 'Result', Element(result))
+            response._forget_declarations()
+        return response
+
+    def __call__(self, action, connection=None):
+        response = self._classes.get(action)
+        if response is None:
+            response = self._classes[action] = self.response_class(action)
         return response(connection=connection)
 
 
@@ -191,18 +212,41 @@ class ResponseElement(dict):
         self._declared('setup', attrs=attrs)
         dict.__init__(self, attrs and attrs.copy() or {})
 
+    @classmethod
+    def _declarations(cls):
+        """
+        Returns the ``(name, DeclarativeType)`` pairs declared by the class
+        and its bases, which are only looked up the first time.
+        """
+        declarations = cls.__dict__.get('_declared_nodes')
+        if declarations is None:
+            def inherit(obj):
+                result = {}
+                for base in getattr(obj, '__bases__', ()):
+                    if base is not dict and base is not object:
+                        result.update(inherit(base))
+                result.update(obj.__dict__)
+                return result
+
+            declarations = [(name, node)
+                            for name, node in inherit(cls).items()
+                            if isinstance(node, DeclarativeType)]
+            cls._declared_nodes = declarations
+        return declarations
+
+    @classmethod
+    def _forget_declarations(cls):
+        if '_declared_nodes' in cls.__dict__:
+            del cls._declared_nodes
+
     def _declared(self, op, **kw):
-        def inherit(obj):
-            result = {}
-            for cls in getattr(obj, '__bases__', ()):
-                result.update(inherit(cls))
-            result.update(obj.__dict__)
-            return result
-
-        scope = inherit(self.__class__)
-        scope.update(self.__dict__)
-        declared = lambda attr: isinstance(attr[1], DeclarativeType)
-        for name, node in filter(declared, scope.items()):
+        local = self.__dict__
+        nodes = [(name, node) for name, node in list(local.items())
+                 if isinstance(node, DeclarativeType)]
+        if op == 'setup':
+            nodes.extend([(name, node) for name, node in self._declarations()
+                          if name not in local])
+        for name, node in nodes:
             getattr(node, op)(self, name, parentname=self._name, **kw)
 
     @property
@@ -485,14 +529,18 @@ class AttributeSet(ResponseElement):
 
 class ItemAttributes(AttributeSet):
     Languages = Element(Language=ElementList())
-
-    def __init__(self, *args, **kw):
-        names = ('Actor', 'Artist', 'Author', 'Creator', 'Director',
-                 'Feature', 'Format', 'GemType', 'MaterialType',
-                 'MediaType', 'OperatingSystem', 'Platform')
-        for name in names:
-            setattr(self, name, SimpleList())
-        super(ItemAttributes, self).__init__(*args, **kw)
+    Actor = SimpleList()
+    Artist = SimpleList()
+    Author = SimpleList()
+    Creator = SimpleList()
+    Director = SimpleList()
+    Feature = SimpleList()
+    Format = SimpleList()
+    GemType = SimpleList()
+    MaterialType = SimpleList()
+    MediaType = SimpleList()
+    OperatingSystem = SimpleList()
+    Platform = SimpleList()
 
 
 class VariationRelationship(ResponseElement):
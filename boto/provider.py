@@ -27,6 +27,8 @@ This class encapsulates the provider-specific header differences.
 """
 
 import os
+import threading
+import weakref
 from boto.compat import six
 from datetime import datetime
 
@@ -183,6 +185,11 @@ class Provider(object):
         self.host = None
         self.port = None
         self.host_header = None
+        self._credential_lock = threading.RLock()
+        # The access key, secret key and security token are kept in one
+        # tuple so that a refresh replaces them all in a single assignment,
+        # and no reader sees a mix of old and new credentials.
+        self._credentials = (None, None, None)
         self.access_key = access_key
         self.secret_key = secret_key
         self.security_token = security_token
@@ -192,6 +199,7 @@ class Provider(object):
         self.acl_class = self.AclClassMap[self.name]
         self.canned_acls = self.CannedAclsMap[self.name]
         self._credential_expiry_time = None
+        self._credential_refresher = None
 
         # Load shared credentials file if it exists
         shared_path = os.path.join(expanduser('~'), '.' + name, 'credentials')
@@ -214,36 +222,63 @@ class Provider(object):
         if config.has_option('Credentials', host_header_opt_name):
             self.host_header = config.get('Credentials', host_header_opt_name)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Locks and threads can't be pickled; the refresher isn't carried
+        # over to the copy.
+        del state['_credential_lock']
+        state['_credential_refresher'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._credential_lock = threading.RLock()
+
     def get_access_key(self):
         if self._credentials_need_refresh():
-            self._populate_keys_from_metadata_server()
-        return self._access_key
+            self._refresh_credentials()
+        return self._credentials[0]
 
     def set_access_key(self, value):
-        self._access_key = value
+        with self._credential_lock:
+            _, secret_key, security_token = self._credentials
+            self._credentials = (value, secret_key, security_token)
 
     access_key = property(get_access_key, set_access_key)
 
     def get_secret_key(self):
         if self._credentials_need_refresh():
-            self._populate_keys_from_metadata_server()
-        return self._secret_key
+            self._refresh_credentials()
+        return self._credentials[1]
 
     def set_secret_key(self, value):
-        self._secret_key = value
+        with self._credential_lock:
+            access_key, _, security_token = self._credentials
+            self._credentials = (access_key, value, security_token)
 
     secret_key = property(get_secret_key, set_secret_key)
 
     def get_security_token(self):
         if self._credentials_need_refresh():
-            self._populate_keys_from_metadata_server()
-        return self._security_token
+            self._refresh_credentials()
+        return self._credentials[2]
 
     def set_security_token(self, value):
-        self._security_token = value
+        with self._credential_lock:
+            access_key, secret_key, _ = self._credentials
+            self._credentials = (access_key, secret_key, value)
 
     security_token = property(get_security_token, set_security_token)
 
+    def _seconds_until_expiry(self):
+        delta = self._credential_expiry_time - datetime.utcnow()
+        # python2.6 does not have timedelta.total_seconds() so we have
+        # to calculate this ourselves.  This is straight from the
+        # datetime docs.
+        return (
+            (delta.microseconds + (delta.seconds + delta.days * 24 * 3600)
+             * 10 ** 6) / 10 ** 6)
+
     def _credentials_need_refresh(self):
         if self.anon:
             return False
@@ -253,19 +288,68 @@ class Provider(object):
         else:
             # The credentials should be refreshed if they're going to expire
             # in less than 5 minutes.
-            delta = self._credential_expiry_time - datetime.utcnow()
-            # python2.6 does not have timedelta.total_seconds() so we have
-            # to calculate this ourselves.  This is straight from the
-            # datetime docs.
-            seconds_left = (
-                (delta.microseconds + (delta.seconds + delta.days * 24 * 3600)
-                 * 10 ** 6) / 10 ** 6)
-            if seconds_left < (5 * 60):
+            if self._seconds_until_expiry() < (5 * 60):
                 boto.log.debug("Credentials need to be refreshed.")
                 return True
             else:
                 return False
 
+    def _refresh_credentials(self):
+        # While a background refresher is running, it renews the
+        # credentials well before they expire, so requests keep using the
+        # current ones until they have actually expired.
+        refresher = self._credential_refresher
+        if (refresher is not None and refresher.is_alive() and
+                self._seconds_until_expiry() > 0):
+            return
+        with self._credential_lock:
+            # Another thread may have refreshed the credentials while we
+            # were waiting for the lock.
+            if self._credentials_need_refresh():
+                self._populate_keys_from_metadata_server()
+
+    def start_credential_refresher(self, lead_time=15 * 60, interval=30):
+        """
+        Start a daemon thread that renews credentials obtained from the
+        instance metadata service before they expire.
+
+        Without it, the credentials are renewed by whichever request first
+        notices they are about to expire, which then waits on the metadata
+        service. With it, requests only ever wait if the credentials have
+        actually expired, e.g. because the metadata service could not be
+        reached for a long time.
+
+        This can also be enabled for every provider by setting
+        ``background_credential_refresh`` to ``True`` in the ``Boto``
+        section of the config file.
+
+        :type lead_time: int
+        :param lead_time: How many seconds before the credentials expire to
+            renew them.
+
+        :type interval: int
+        :param interval: How often, in seconds, to check whether the
+            credentials are due for renewal. This is also how long a failed
+            renewal waits before it is tried again.
+        """
+        with self._credential_lock:
+            refresher = self._credential_refresher
+            if refresher is not None and refresher.is_alive():
+                return
+            self._credential_refresher = CredentialRefresher(
+                self, lead_time, interval)
+            self._credential_refresher.start()
+
+    def stop_credential_refresher(self):
+        """
+        Stop the thread started by :meth:`start_credential_refresher`.
+        """
+        with self._credential_lock:
+            refresher = self._credential_refresher
+            self._credential_refresher = None
+        if refresher is not None:
+            refresher.stop()
+
     def get_credentials(self, access_key=None, secret_key=None,
                         security_token=None, profile_name=None):
         if self.anon:
@@ -379,12 +463,22 @@ class Provider(object):
                                                  security_token_name)
                 boto.log.debug("Using security token found in config file.")
 
-        if ((self._access_key is None or self._secret_key is None) and
+        access_key, secret_key, _ = self._credentials
+        if ((access_key is None or secret_key is None) and
                 self.MetadataServiceSupport[self.name]):
             self._populate_keys_from_metadata_server()
-        self._secret_key = self._convert_key_to_str(self._secret_key)
+        self.set_secret_key(self._convert_key_to_str(self._credentials[1]))
 
     def _populate_keys_from_metadata_server(self):
+        creds = self._fetch_credentials_from_metadata_server()
+        if creds is not None:
+            self._swap_credentials(creds)
+            if (self._credential_refresher is None and
+                    config.getbool('Boto', 'background_credential_refresh',
+                                   False)):
+                self.start_credential_refresher()
+
+    def _fetch_credentials_from_metadata_server(self):
         # get_instance_metadata is imported here because of a circular
         # dependency.
         boto.log.debug("Retrieving credentials from metadata server.")
@@ -398,17 +492,17 @@ class Provider(object):
             timeout=timeout, num_retries=attempts,
             data='meta-data/iam/security-credentials/')
         if metadata:
-            creds = self._get_credentials_from_metadata(metadata)
-            self._access_key = creds[0]
-            self._secret_key = creds[1]
-            self._security_token = creds[2]
-            expires_at = creds[3]
-            # I'm assuming there's only one role on the instance profile.
-            self._credential_expiry_time = datetime.strptime(
-                expires_at, "%Y-%m-%dT%H:%M:%SZ")
-            boto.log.debug("Retrieved credentials will expire in %s at: %s",
-                           self._credential_expiry_time - datetime.now(),
-                           expires_at)
+            return self._get_credentials_from_metadata(metadata)
+        return None
+
+    def _swap_credentials(self, creds):
+        access_key, secret_key, security_token, expires_at = creds
+        # I'm assuming there's only one role on the instance profile.
+        expiry_time = datetime.strptime(expires_at, "%Y-%m-%dT%H:%M:%SZ")
+        self._credentials = (access_key, secret_key, security_token)
+        self._credential_expiry_time = expiry_time
+        boto.log.debug("Retrieved credentials will expire in %s at: %s",
+                       expiry_time - datetime.utcnow(), expires_at)
 
     def _get_credentials_from_metadata(self, metadata):
         # Given metadata, return a tuple of (access, secret, token, expiration)
@@ -486,6 +580,48 @@ class Provider(object):
         return self.ChunkedTransferSupport[self.name]
 
 
+class CredentialRefresher(threading.Thread):
+    """
+    Renews a provider's instance metadata credentials in the background.
+
+    Only a weak reference to the provider is kept, so the thread exits once
+    the provider is garbage collected.
+    """
+
+    def __init__(self, provider, lead_time=15 * 60, interval=30):
+        super(CredentialRefresher, self).__init__()
+        self.daemon = True
+        self._provider = weakref.ref(provider)
+        self.lead_time = lead_time
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        while True:
+            # Event.wait() only returns the flag from Python 2.7 on.
+            self._stopped.wait(self.interval)
+            if self._stopped.is_set():
+                break
+            provider = self._provider()
+            if provider is None:
+                return
+            if (provider._credential_expiry_time is None or
+                    provider._seconds_until_expiry() > self.lead_time):
+                continue
+            try:
+                creds = provider._fetch_credentials_from_metadata_server()
+            except Exception:
+                boto.log.exception("Failed to refresh credentials.")
+                creds = None
+            if creds is not None:
+                with provider._credential_lock:
+                    provider._swap_credentials(creds)
+            del provider
+
+
 # Static utility method for getting default Provider.
 def get_default():
     return Provider('aws')
@@ -25,11 +25,15 @@ import os
 import boto
 from boto.compat import json
 from boto.exception import BotoClientError
-from boto.endpoints import BotoEndpointResolver
-from boto.endpoints import StaticEndpointBuilder
 
 
 _endpoints_cache = {}
+# The merged endpoints, keyed by the user's endpoints file and its
+# modification time, so that changing either is picked up.
+_merged_endpoints_cache = {}
+# RegionInfo objects indexed by name, keyed by
+# (service_name, region_cls, connection_cls).
+_regions_cache = {}
 
 
 def load_endpoint_json(path):
@@ -96,8 +100,6 @@ def load_regions():
     :returns: The endpoints data
     :rtype: dict
     """
-    # Load the defaults first.
-    endpoints = _load_builtin_endpoints()
     additional_path = None
 
     # Try the ENV var. If not, check the config file.
@@ -106,12 +108,21 @@ def load_regions():
     elif boto.config.get('Boto', 'endpoints_path'):
         additional_path = boto.config.get('Boto', 'endpoints_path')
 
-    # If there's a file provided, we'll load it & additively merge it into
-    # the endpoints.
-    if additional_path:
+    if not additional_path:
+        return _load_builtin_endpoints()
+
+    key = (additional_path, os.path.getmtime(additional_path))
+    endpoints = _merged_endpoints_cache.get(key)
+    if endpoints is None:
+        # Merge the user's endpoints into a copy of the defaults, so that
+        # they don't leak into the defaults if the file is changed or
+        # removed.
+        endpoints = dict((service, dict(regions)) for service, regions
+                         in _load_builtin_endpoints().items())
         additional = load_endpoint_json(additional_path)
         endpoints = merge_endpoints(endpoints, additional)
-
+        _merged_endpoints_cache.clear()
+        _merged_endpoints_cache[key] = endpoints
     return endpoints
 
 
@@ -121,6 +132,10 @@ def _load_builtin_endpoints(_cache=_endpoints_cache):
     if _cache:
         return _cache
 
+    # boto.endpoints is imported here so that importing boto doesn't pay
+    # for it until endpoints are actually needed.
+    from boto.endpoints import BotoEndpointResolver, StaticEndpointBuilder
+
     # Load the endpoints file
     endpoints = _load_json_file(boto.ENDPOINTS_PATH)
 
@@ -142,6 +157,9 @@ def get_regions(service_name, region_cls=None, connection_cls=None):
     This leverages the ``endpoints.json`` file (+ optional user overrides) to
     configure/construct all the objects.
 
+    The objects are built once and then shared by all callers (until the
+    endpoints change), so they shouldn't be modified.
+
     :param service_name: The name of the service to construct the ``RegionInfo``
         objects for. Ex: ``ec2``, ``s3``, ``sns``, etc.
     :type service_name: string
@@ -158,28 +176,40 @@ def get_regions(service_name, region_cls=None, connection_cls=None):
     :returns: A list of configured ``RegionInfo`` objects
     :rtype: list
     """
-    endpoints = load_regions()
+    return list(_get_region_index(service_name, region_cls,
+                                  connection_cls).values())
 
-    if service_name not in endpoints:
-        raise BotoClientError(
-            "Service '%s' not found in endpoints." % service_name
-        )
 
+def _get_region_index(service_name, region_cls=None, connection_cls=None):
+    """
+    Returns the ``RegionInfo`` objects for a service, keyed by region name.
+
+    The objects are built once and shared by every caller until the
+    endpoints change.
+    """
     if region_cls is None:
         region_cls = RegionInfo
 
-    region_objs = []
+    endpoints = load_regions()
+    key = (service_name, region_cls, connection_cls)
+    cached = _regions_cache.get(key)
+    if cached is not None and cached[0] is endpoints:
+        return cached[1]
 
-    for region_name, endpoint in endpoints.get(service_name, {}).items():
-        region_objs.append(
-            region_cls(
-                name=region_name,
-                endpoint=endpoint,
-                connection_cls=connection_cls
-            )
+    if service_name not in endpoints:
+        raise BotoClientError(
+            "Service '%s' not found in endpoints." % service_name
         )
 
-    return region_objs
+    index = {}
+    for region_name, endpoint in endpoints[service_name].items():
+        index[region_name] = region_cls(
+            name=region_name,
+            endpoint=endpoint,
+            connection_cls=connection_cls
+        )
+    _regions_cache[key] = (endpoints, index)
+    return index
 
 
 def connect(service_name, region_name, region_cls=None,
@@ -222,16 +252,15 @@ def connect(service_name, region_name, region_cls=None,
 
 def _get_region(service_name, region_name, region_cls=None,
                 connection_cls=None):
-    """Finds the region by searching through the known regions."""
-    for region in get_regions(service_name, region_cls, connection_cls):
-        if region.name == region_name:
-            return region
-    return None
+    """Finds the region by looking it up in the known regions."""
+    return _get_region_index(
+        service_name, region_cls, connection_cls).get(region_name)
 
 
 def _get_region_with_heuristics(service_name, region_name, region_cls=None,
                                 connection_cls=None):
     """Finds the region using known regions and heuristics."""
+    from boto.endpoints import BotoEndpointResolver
     endpoints = load_endpoint_json(boto.ENDPOINTS_PATH)
     resolver = BotoEndpointResolver(endpoints)
     hostname = resolver.resolve_hostname(service_name, region_name)
@@ -19,8 +19,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from boto.s3.user import User
-
 
 class ResultSet(list):
     """
@@ -71,6 +69,9 @@ class ResultSet(list):
             # Makes owner available for get_service and
             # perhaps other lists where not handled by
             # another element.
+            # Imported here so that importing boto.exception (and so boto)
+            # doesn't import boto.s3.
+            from boto.s3.user import User
             self.owner = User()
             return self.owner
         return None
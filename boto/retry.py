@@ -0,0 +1,227 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+"""
+Decides how long to wait before retrying a failed request, and whether
+to retry it at all.
+
+Every connection has a :class:`RetryPolicy` as its ``retry_policy``
+attribute. It is used by ``AWSAuthConnection._mexe`` for server errors and
+connection errors, and by the services' own retry handlers for throttling
+errors, so that all of them back off the same way and draw on the same
+retry budget.
+
+Failures are grouped into error classes, each with its own
+:class:`RetryRule`:
+
+* ``'server'`` - 5xx responses.
+* ``'connection'`` - errors raised while sending the request or reading
+  the response.
+* ``'throttling'`` - a service asking for fewer requests, e.g. DynamoDB's
+  ``ProvisionedThroughputExceededException``.
+* ``'checksum'`` - a response that didn't match its checksum.
+
+A policy can be shared by several connections (e.g. all of those used by
+the worker threads of a process) by assigning the same object to their
+``retry_policy`` attributes; it is thread safe.
+"""
+import random
+import threading
+
+import boto
+
+
+class RetryRule(object):
+    """
+    How the retries of one class of errors are handled.
+
+    :type base_delay: float
+    :param base_delay: The seconds to wait before the first retry. Later
+        retries wait exponentially longer.
+
+    :type cost: int
+    :param cost: The number of tokens taken from the retry budget by each
+        retry.
+    """
+
+    def __init__(self, base_delay=1.0, cost=5):
+        self.base_delay = base_delay
+        self.cost = cost
+
+    def __repr__(self):
+        return 'RetryRule(base_delay=%r, cost=%r)' % (self.base_delay,
+                                                      self.cost)
+
+
+DEFAULT_RULES = {
+    'server': RetryRule(base_delay=1.0, cost=5),
+    'connection': RetryRule(base_delay=1.0, cost=10),
+    'throttling': RetryRule(base_delay=0.05, cost=5),
+    'checksum': RetryRule(base_delay=0.05, cost=0),
+}
+
+
+class RetryPolicy(object):
+    """
+    Computes backoff delays, keeps a retry budget and counts retries.
+
+    :type jitter: str
+    :param jitter: How delays are randomized. With ``'full'``, the delay
+        before retry ``n`` is picked between 0 and ``base_delay * 2 ** n``.
+        With ``'decorrelated'``, it is picked between ``base_delay`` and
+        three times the previous delay, which spreads the retries of many
+        clients further apart. Defaults to the ``retry_jitter`` option of
+        the ``Boto`` config section, or ``'full'``.
+
+    :type max_delay: float
+    :param max_delay: The longest delay in seconds. Defaults to the
+        ``max_retry_delay`` option of the ``Boto`` config section, or 60.
+
+    :type budget: int
+    :param budget: The number of tokens in the retry budget. Each retry
+        takes its rule's ``cost`` from the budget and each request that
+        succeeds without a retry puts one token back, up to this number.
+        Once the budget is spent, failed requests are no longer retried,
+        so that a struggling service isn't sent even more requests.
+        Defaults to the ``retry_budget`` option of the ``Boto`` config
+        section, or no budget at all.
+
+    :type rules: dict
+    :param rules: The :class:`RetryRule` of each error class, overriding
+        those of ``DEFAULT_RULES``.
+    """
+
+    def __init__(self, jitter=None, max_delay=None, budget=None, rules=None):
+        if jitter is None:
+            jitter = boto.config.get('Boto', 'retry_jitter') or 'full'
+        if jitter not in ('full', 'decorrelated'):
+            raise ValueError('Unknown retry jitter: %r' % jitter)
+        if budget is None and boto.config.has_option('Boto', 'retry_budget'):
+            budget = boto.config.getint('Boto', 'retry_budget')
+        self.jitter = jitter
+        self.max_delay = max_delay
+        self.budget = budget
+        self.rules = dict(DEFAULT_RULES)
+        if rules:
+            self.rules.update(rules)
+        self._tokens = budget
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def __repr__(self):
+        return 'RetryPolicy(jitter=%r, budget=%r)' % (self.jitter, self.budget)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        """
+        The tokens left in the retry budget, or None if there's no budget.
+        """
+        return self._tokens
+
+    def rule(self, error_class):
+        return self.rules.get(error_class) or RetryRule()
+
+    def delay(self, attempt, error_class='server', previous=None):
+        """
+        Returns the seconds to wait before retrying a request.
+
+        :type attempt: int
+        :param attempt: The number of times the request has been retried
+            so far.
+
+        :type error_class: str
+        :param error_class: The class of the error being retried.
+
+        :type previous: float
+        :param previous: The previous delay of this request, if any. Only
+            used with ``'decorrelated'`` jitter.
+        """
+        base = self.rule(error_class).base_delay
+        if self.jitter == 'decorrelated':
+            if previous is None:
+                upper = base * (3 ** attempt)
+            else:
+                upper = previous * 3
+            delay = base + random.random() * max(upper - base, 0)
+        else:
+            delay = random.random() * base * (2 ** attempt)
+        max_delay = self.max_delay
+        if max_delay is None:
+            max_delay = boto.config.get('Boto', 'max_retry_delay') or 60
+        return min(delay, float(max_delay))
+
+    def acquire(self, error_class):
+        """
+        Takes the cost of a retry from the budget. Returns False, without
+        taking anything, if there aren't enough tokens left, in which case
+        the request should not be retried.
+        """
+        cost = self.rule(error_class).cost
+        with self._lock:
+            if self._tokens is not None:
+                if cost > self._tokens:
+                    self.stats['denied'] += 1
+                    boto.log.debug('Retry budget exhausted, not retrying '
+                                   '%s error' % error_class)
+                    return False
+                self._tokens -= cost
+            self.stats['retries'] += 1
+            by_class = self.stats['retries_by_class']
+            by_class[error_class] = by_class.get(error_class, 0) + 1
+        return True
+
+    def record_success(self):
+        """
+        Records a request that succeeded, putting a token back into the
+        budget.
+        """
+        if self._tokens is None:
+            return
+        with self._lock:
+            self._tokens = min(self._tokens + 1, self.budget)
+
+    def record_sleep(self, seconds):
+        """
+        Records the time spent waiting before a retry.
+        """
+        with self._lock:
+            self.stats['sleep_time'] += seconds
+
+    def reset_stats(self):
+        """
+        Resets the counters in ``stats``:
+
+        * ``retries`` - the number of retries.
+        * ``retries_by_class`` - the number of retries of each error class.
+        * ``denied`` - the number of retries refused for lack of budget.
+        * ``sleep_time`` - the seconds spent waiting before retries.
+        """
+        self.stats = {'retries': 0, 'retries_by_class': {}, 'denied': 0,
+                      'sleep_time': 0.0}
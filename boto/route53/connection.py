@@ -25,12 +25,12 @@
 #
 
 from boto.route53 import exception
-import random
 import uuid
 import xml.sax
 
 import boto
 from boto.connection import AWSAuthConnection
+from boto.retry import RetryRule
 from boto import handler
 import boto.jsonresponse
 from boto.route53.record import ResourceRecordSets
@@ -73,6 +73,10 @@ class Route53Connection(AWSAuthConnection):
     XMLNameSpace = 'https://route53.amazonaws.com/doc/2013-04-01/'
     """XML schema for this Route53 API version."""
 
+    # Prior requests and throttling take a while to clear up, so back off
+    # from a second rather than the default 50ms.
+    RetryRules = {'throttling': RetryRule(base_delay=1.0)}
+
     def __init__(self, aws_access_key_id=None, aws_secret_access_key=None,
                  port=None, proxy=None, proxy_port=None,
                  host=DefaultHost, debug=0, security_token=None,
@@ -601,12 +605,13 @@ class Route53Connection(AWSAuthConnection):
                         'ServiceUnavailable',
                         'RequestExpired'):
                     return status
+                if not self.retry_policy.acquire('throttling'):
+                    return status
                 msg = "%s, retry attempt %s" % (
                     err.error_code,
                     i
                 )
-                next_sleep = min(random.random() * (2 ** i),
-                                 boto.config.get('Boto', 'max_retry_delay', 60))
+                next_sleep = self.retry_policy.delay(i, 'throttling')
                 i += 1
                 status = (msg, i, next_sleep)
 
@@ -39,6 +39,7 @@ class Zone(object):
     """
     def __init__(self, route53connection, zone_dict):
         self.route53connection = route53connection
+        self._records = None
         for key in zone_dict:
             if key == 'Id':
                 self.id = zone_dict['Id'].replace('/hostedzone/', '')
@@ -57,8 +58,53 @@ class Zone(object):
         :param changes: changes to be committed
         """
         response = changes.commit()
+        if self._records is not None:
+            for action, record in changes.changes:
+                self._index_change(action, record)
         return response['ChangeResourceRecordSetsResponse']['ChangeInfo']
 
+    def _index_change(self, action, record):
+        """
+        Apply a committed change to the local record index.
+
+        :type action: str
+        :param action: The action performed ('CREATE'|'DELETE'|'UPSERT')
+
+        :type record: Record
+        :param record: The record the action was performed on
+        """
+        key = (self.route53connection._make_qualified(record.name),
+               record.type)
+        records = [r for r in self._records.get(key, [])
+                   if r.identifier != record.identifier]
+        if action in ('CREATE', 'UPSERT'):
+            records.append(record)
+        if records:
+            self._records[key] = records
+        else:
+            self._records.pop(key, None)
+
+    def cache_records(self):
+        """
+        Load every record in this Zone into a local index keyed by name
+        and type. Until :func:`clear_record_cache` is called,
+        :func:`find_records` and the ``get_*``, ``update_*`` and
+        ``delete_*`` helpers answer from the index instead of calling
+        Route53, and changes committed through this Zone are applied to
+        it. Changes made by other means are not seen until this is
+        called again.
+        """
+        records = {}
+        for record in self.route53connection.get_all_rrsets(self.id):
+            records.setdefault((record.name, record.type), []).append(record)
+        self._records = records
+
+    def clear_record_cache(self):
+        """
+        Drop the local record index created by :func:`cache_records`.
+        """
+        self._records = None
+
     def _new_record(self, changes, resource_type, name, value, ttl, identifier,
                     comment=""):
         """
@@ -228,19 +274,10 @@ class Zone(object):
 
         """
         name = self.route53connection._make_qualified(name)
-        returned = self.route53connection.get_all_rrsets(self.id, name=name,
-                                                         type=type)
-
-        # name/type for get_all_rrsets sets the starting record; they
-        # are not a filter
-        results = []
-        for r in returned:
-            if r.name == name and r.type == type:
-                results.append(r)
-            # Is at the end of the list of matched records. No need to continue
-            # since the records are sorted by name and type.
-            else:
-                break
+        if self._records is not None:
+            results = list(self._records.get((name, type), []))
+        else:
+            results = self._fetch_records(name, type)
 
         weight = None
         region = None
@@ -271,6 +308,22 @@ class Zone(object):
         else:
             return None
 
+    def _fetch_records(self, name, type):
+        returned = self.route53connection.get_all_rrsets(self.id, name=name,
+                                                         type=type)
+
+        # name/type for get_all_rrsets sets the starting record; they
+        # are not a filter
+        results = []
+        for r in returned:
+            if r.name == name and r.type == type:
+                results.append(r)
+            # Is at the end of the list of matched records. No need to continue
+            # since the records are sorted by name and type.
+            else:
+                break
+        return results
+
     def get_cname(self, name, all=False):
         """
         Search this Zone for CNAME records that match name.
@@ -26,7 +26,7 @@ import xml.sax
 import base64
 import time
 
-from boto.compat import six, urllib
+from boto.compat import six, urllib, encodebytes
 from boto.auth import detect_potential_s3sigv4
 import boto.utils
 from boto.connection import AWSAuthConnection
@@ -453,6 +453,125 @@ class S3Connection(AWSAuthConnection):
                                                   self.server_name(port),
                                                   bucket, key) + query_part
 
+    def generate_urls(self, expires_in, method, bucket, keys,
+                      force_http=False, response_headers=None,
+                      expires_in_absolute=False, iso_date=None):
+        """
+        Generate presigned URLs for many keys in a bucket.
+
+        This returns the same URLs as calling :func:`generate_url` for
+        each key, but the parts of the signature that do not depend on
+        the key (the expiry, credential scope, signing key and query
+        parameters) are only computed once, which makes signing large
+        numbers of keys much faster.
+
+        :type expires_in: int
+        :param expires_in: The number of seconds the URLs are valid for,
+            or the absolute expiry time if ``expires_in_absolute`` is set
+            (SigV2 only).
+
+        :type method: str
+        :param method: The HTTP method the URLs are signed for.
+
+        :type bucket: str
+        :param bucket: The name of the bucket.
+
+        :type keys: iterable
+        :param keys: The names of the keys to generate URLs for.
+
+        :type response_headers: dict
+        :param response_headers: Response header overrides to add to
+            every URL.
+
+        :type iso_date: str
+        :param iso_date: The signing time to use for SigV4 URLs.
+
+        :rtype: generator
+        :return: The URLs, in the same order as ``keys``.
+        """
+        if self.anon or self.use_proxy:
+            return (self.generate_url(expires_in, method, bucket=bucket,
+                                      key=key, force_http=force_http,
+                                      response_headers=response_headers,
+                                      expires_in_absolute=expires_in_absolute)
+                    for key in keys)
+        if self._auth_handler.capability[0] == 'hmac-v4-s3':
+            return self._generate_urls_sigv4(expires_in, method, bucket, keys,
+                                             response_headers, iso_date)
+        return self._generate_urls_sigv2(expires_in, method, bucket, keys,
+                                         force_http, response_headers,
+                                         expires_in_absolute)
+
+    def _generate_urls_sigv4(self, expires_in, method, bucket, keys,
+                             response_headers, iso_date):
+        host = self.calling_format.build_host(self.server_name(), bucket)
+        # For presigned URLs we should ignore the port if it's HTTPS
+        if host.endswith(':443'):
+            host = host[:-4]
+        params = {}
+        if response_headers is not None:
+            params.update(response_headers)
+        http_request = self.build_base_http_request(
+            method, self.calling_format.build_path_base(bucket, ''),
+            self.calling_format.build_auth_path(bucket, ''), host=host,
+            params=params)
+        paths = (self.get_path(self.calling_format.build_path_base(bucket, key))
+                 for key in keys)
+        return self._auth_handler.presign_paths(http_request, expires_in,
+                                                paths, iso_date=iso_date)
+
+    def _generate_urls_sigv2(self, expires_in, method, bucket, keys,
+                             force_http, response_headers,
+                             expires_in_absolute):
+        headers = {}
+        if expires_in_absolute:
+            expires = int(expires_in)
+        else:
+            expires = int(time.time() + expires_in)
+        extra_qp = []
+        if response_headers:
+            for k, v in response_headers.items():
+                extra_qp.append("%s=%s" % (k, urllib.parse.quote(v)))
+        if self.provider.security_token:
+            headers['x-amz-security-token'] = self.provider.security_token
+        # The canonical string is the headers, followed by the key's
+        # auth path, followed by the sub-resources of the query string.
+        # Only the auth path differs between keys, so the HMAC of the
+        # headers is computed once and copied for every key.
+        c_prefix = boto.utils.canonical_string(method, '', headers, expires,
+                                               self.provider)
+        c_suffix = ''
+        if extra_qp:
+            c_suffix = boto.utils.canonical_string(
+                method, '?' + '&'.join(extra_qp), headers, expires,
+                self.provider)[len(c_prefix):]
+        base_hmac = self._auth_handler._get_hmac()
+        base_hmac.update(c_prefix.encode('utf-8'))
+        query_tail = list(extra_qp)
+        hdr_prefix = self.provider.header_prefix
+        for k, v in headers.items():
+            if k.startswith(hdr_prefix):
+                query_tail.append("%s=%s" % (k, urllib.parse.quote(v)))
+        query_tail = ''.join('&' + qp for qp in query_tail)
+        if force_http:
+            protocol = 'http'
+            port = 80
+        else:
+            protocol = self.protocol
+            port = self.port
+        server = self.server_name(port)
+        for key in keys:
+            auth_path = self.get_path(
+                self.calling_format.build_auth_path(bucket, key))
+            new_hmac = base_hmac.copy()
+            new_hmac.update((auth_path + c_suffix).encode('utf-8'))
+            b64_hmac = encodebytes(new_hmac.digest()).decode('utf-8').strip()
+            encoded_canonical = urllib.parse.quote(b64_hmac, safe='')
+            query_part = '?' + self.QueryString % (encoded_canonical, expires,
+                                                   self.aws_access_key_id)
+            yield self.calling_format.build_url_base(
+                self, protocol, server, bucket, key) + query_part + query_tail
+
     def get_all_buckets(self, headers=None):
         response = self.make_request('GET', headers=headers)
         body = response.read()
@@ -661,9 +780,9 @@ class S3Connection(AWSAuthConnection):
             raise self.provider.storage_response_error(
                 response.status, response.reason, body)
 
-    def make_request(self, method, bucket='', key='', headers=None, data='',
-                     query_args=None, sender=None, override_num_retries=None,
-                     retry_handler=None):
+    def build_request(self, method, bucket='', key='', headers=None, data='',
+                      query_args=None, sender=None, override_num_retries=None,
+                      retry_handler=None):
         if isinstance(bucket, self.bucket_class):
             bucket = bucket.name
         if isinstance(key, Key):
@@ -678,9 +797,17 @@ class S3Connection(AWSAuthConnection):
             boto.log.debug('path=%s' % path)
             auth_path += '?' + query_args
             boto.log.debug('auth_path=%s' % auth_path)
-        return super(S3Connection, self).make_request(
+        return super(S3Connection, self).build_request(
             method, path, headers,
             data, host, auth_path, sender,
             override_num_retries=override_num_retries,
             retry_handler=retry_handler
         )
+
+    def make_request(self, method, bucket='', key='', headers=None, data='',
+                     query_args=None, sender=None, override_num_retries=None,
+                     retry_handler=None):
+        http_request, kwargs = S3Connection.build_request(
+            self, method, bucket, key, headers, data, query_args, sender,
+            override_num_retries, retry_handler)
+        return self._mexe(http_request, **kwargs)
@@ -27,6 +27,7 @@ from boto.sdb.domain import Domain, DomainMetaData
 from boto.sdb.item import Item
 from boto.sdb.regioninfo import SDBRegionInfo
 from boto.exception import SDBResponseError
+from boto.compat import Queue, Empty
 
 class ItemThread(threading.Thread):
     """
@@ -36,6 +37,9 @@ class ItemThread(threading.Thread):
 
     .. tip:: The item retrieval will not start until
         the :func:`run() <boto.sdb.connection.ItemThread.run>` method is called.
+
+    .. tip:: :py:meth:`SDBConnection.get_items` fetches many items at once
+        with a bounded number of threads sharing one connection.
     """
     def __init__(self, name, domain_name, item_names):
         """
@@ -50,7 +54,7 @@ class ItemThread(threading.Thread):
         super(ItemThread, self).__init__(name=name)
         #print 'starting %s with %d items' % (name, len(item_names))
         self.domain_name = domain_name
-        self.conn = SDBConnection()
+        self.conn = boto.shared_connection(SDBConnection)
         self.item_names = item_names
         self.items = []
 
@@ -502,6 +506,67 @@ class SDBConnection(AWSQueryConnection):
         else:
             raise SDBResponseError(response.status, response.reason, body)
 
+    def get_items(self, domain_or_name, item_names, attribute_names=None,
+                  consistent_read=False, max_workers=10):
+        """
+        Retrieve the attributes of many items in a domain, with up to
+        ``max_workers`` GetAttributes requests in flight at once. The
+        requests are made by threads sharing this connection and its pool
+        of HTTP connections.
+
+        :type domain_or_name: string or :class:`boto.sdb.domain.Domain` object.
+        :param domain_or_name: Either the name of a domain or a Domain object
+
+        :type item_names: list of strings
+        :param item_names: The names of the items to retrieve.
+
+        :type attribute_names: string or list of strings
+        :param attribute_names: An attribute name or list of attribute names.
+            This parameter is optional.  If not supplied, all attributes will
+            be retrieved for each item.
+
+        :type consistent_read: bool
+        :param consistent_read: When set to true, ensures that the most recent
+            data is returned.
+
+        :type max_workers: int
+        :param max_workers: The most requests made at once.
+
+        :rtype: list of :class:`boto.sdb.item.Item`
+        :return: The items, in the same order as ``item_names``. Items
+            that don't exist are empty.
+        """
+        domain, domain_name = self.get_domain_and_name(domain_or_name)
+        item_names = list(item_names)
+        items = [None] * len(item_names)
+        errors = []
+        queue = Queue()
+        for index, item_name in enumerate(item_names):
+            queue.put((index, item_name))
+
+        def fetch():
+            while not errors:
+                try:
+                    index, item_name = queue.get_nowait()
+                except Empty:
+                    return
+                try:
+                    items[index] = self.get_attributes(
+                        domain, item_name, attribute_names, consistent_read)
+                except Exception as e:
+                    errors.append(e)
+
+        workers = [threading.Thread(target=fetch)
+                   for _ in range(min(max_workers, len(item_names)))]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        for worker in workers:
+            worker.join()
+        if errors:
+            raise errors[0]
+        return items
+
     def delete_attributes(self, domain_or_name, item_name, attr_names=None,
                           expected_value=None):
         """
@@ -146,6 +146,7 @@ class SDBConverter(object):
                         k = v
                     dec_val[k] = v
             value = dec_val.values()
+            self.batch_references(value)
         return value
 
     def decode_map(self, prop, value):
@@ -156,8 +157,20 @@ class SDBConverter(object):
         for val in value:
             k, v = self.decode_map_element(item_type, val)
             ret_value[k] = v
+        self.batch_references(ret_value.values())
         return ret_value
 
+    def batch_references(self, values):
+        """
+        Makes the referenced objects among ``values`` load together, with
+        as few requests as possible, when the first of them is loaded.
+        """
+        batch = [value for value in values
+                 if isinstance(value, self.model_class)]
+        if len(batch) > 1:
+            for obj in batch:
+                obj._load_batch = batch
+
     def decode_map_element(self, item_type, value):
         """Decode a single element for a map"""
         import urllib
@@ -400,6 +413,9 @@ class SDBConverter(object):
 
 class SDBManager(object):
 
+    # SimpleDB allows at most 20 comparisons in one predicate.
+    select_batch_size = 20
+
     def __init__(self, cls, db_name, db_user, db_passwd,
                  db_host, db_port, db_table, ddl_dir, enable_ssl,
                  consistent=None):
@@ -482,19 +498,60 @@ class SDBManager(object):
             self.bucket = s3.create_bucket(bucket_name)
         return self.bucket
 
+    def _load_attributes(self, obj, a):
+        if '__type__' in a:
+            for prop in obj.properties(hidden=False):
+                if prop.name in a:
+                    value = self.decode_value(prop, a[prop.name])
+                    value = prop.make_value_from_datastore(value)
+                    try:
+                        setattr(obj, prop.name, value)
+                    except Exception as e:
+                        boto.log.exception(e)
+        obj._loaded = True
+
     def load_object(self, obj):
         if not obj._loaded:
-            a = self.domain.get_attributes(obj.id, consistent_read=self.consistent)
-            if '__type__' in a:
-                for prop in obj.properties(hidden=False):
-                    if prop.name in a:
-                        value = self.decode_value(prop, a[prop.name])
-                        value = prop.make_value_from_datastore(value)
-                        try:
-                            setattr(obj, prop.name, value)
-                        except Exception as e:
-                            boto.log.exception(e)
-            obj._loaded = True
+            batch = getattr(obj, '_load_batch', None)
+            if batch:
+                self.load_objects(batch)
+            else:
+                a = self.domain.get_attributes(obj.id, consistent_read=self.consistent)
+                self._load_attributes(obj, a)
+
+    def load_objects(self, objs):
+        """
+        Loads the objects that aren't loaded yet with as few Select
+        requests as possible, instead of one GetAttributes request each.
+        """
+        pending = {}
+        for obj in objs:
+            if obj.id and not obj._loaded:
+                pending.setdefault(obj.id, []).append(obj)
+        for item in self._select_items(pending):
+            for obj in pending[item.name]:
+                self._load_attributes(obj, item)
+        for same_id in pending.values():
+            for obj in same_id:
+                obj._loaded = True
+                obj._load_batch = None
+
+    def _select_items(self, ids):
+        """
+        Yields the items with the given ids, selecting up to
+        ``select_batch_size`` of them with each ``itemName() in (...)``
+        query.
+        """
+        ids = sorted(ids)
+        size = self.select_batch_size
+        for start in range(0, len(ids), size):
+            names = ', '.join("'%s'" % id.replace("'", "''")
+                              for id in ids[start:start + size])
+            query = "select * from `%s` where itemName() in (%s)" % (
+                self.domain.name, names)
+            for item in self.domain.select(query,
+                                           consistent_read=self.consistent):
+                yield item
 
     def get_object(self, cls, id, a=None):
         obj = None
@@ -517,6 +574,22 @@ class SDBManager(object):
                 boto.log.info('sdbmanager: %s' % s)
         return obj
 
+    def get_objects(self, cls, ids):
+        """
+        Returns the objects with the given ids, in the same order, with
+        None for those that don't exist. The objects are selected in
+        batches rather than fetched one at a time.
+        """
+        items = dict((item.name, item) for item in self._select_items(set(ids)))
+        objs = []
+        for id in ids:
+            item = items.get(id)
+            if item is None:
+                objs.append(None)
+            else:
+                objs.append(self.get_object(cls, id, item))
+        return objs
+
     def get_object_from_id(self, id):
         return self.get_object(None, id)
 
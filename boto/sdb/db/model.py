@@ -81,6 +81,8 @@ class Model(object):
     @classmethod
     def get_by_id(cls, ids=None, parent=None):
         if isinstance(ids, list):
+            if hasattr(cls._manager, 'get_objects'):
+                return cls._manager.get_objects(cls, ids)
             objs = [cls._get_by_id(id) for id in ids]
             return objs
         else:
@@ -25,7 +25,7 @@ Represents an SDB Domain
 """
 
 from boto.sdb.queryresultset import SelectResultSet
-from boto.compat import six
+from boto.sdb.transfer import DomainDumpParser, export_domain
 
 class Domain(object):
 
@@ -133,6 +133,29 @@ class Domain(object):
         return self.connection.get_attributes(self, item_name, attribute_name,
                                               consistent_read, item)
 
+    def get_items(self, item_names, attribute_names=None,
+                  consistent_read=False, max_workers=10):
+        """
+        Retrieve the attributes of many items, with up to ``max_workers``
+        requests in flight at once.
+
+        :type item_names: list of strings
+        :param item_names: The names of the items to retrieve.
+
+        :type attribute_names: string or list of strings
+        :param attribute_names: An attribute name or list of attribute names.
+            This parameter is optional.  If not supplied, all attributes will
+            be retrieved for each item.
+
+        :type max_workers: int
+        :param max_workers: The most requests made at once.
+
+        :rtype: list of :class:`boto.sdb.item.Item`
+        :return: The items, in the same order as ``item_names``
+        """
+        return self.connection.get_items(self, item_names, attribute_names,
+                                         consistent_read, max_workers)
+
     def delete_attributes(self, item_name, attributes=None,
                           expected_values=None):
         """
@@ -242,37 +265,22 @@ class Domain(object):
         """
         if not f:
             from tempfile import TemporaryFile
-            f = TemporaryFile()
-        print('<?xml version="1.0" encoding="UTF-8"?>', file=f)
-        print('<Domain id="%s">' % self.name, file=f)
-        for item in self:
-            print('\t<Item id="%s">' % item.name, file=f)
-            for k in item:
-                print('\t\t<attribute id="%s">' % k, file=f)
-                values = item[k]
-                if not isinstance(values, list):
-                    values = [values]
-                for value in values:
-                    print('\t\t\t<value><![CDATA[', end=' ', file=f)
-                    if isinstance(value, six.text_type):
-                        value = value.encode('utf-8', 'replace')
-                    else:
-                        value = six.text_type(value, errors='replace').encode('utf-8', 'replace')
-                    f.write(value)
-                    print(']]></value>', file=f)
-                print('\t\t</attribute>', file=f)
-            print('\t</Item>', file=f)
-        print('</Domain>', file=f)
-        f.flush()
+            f = TemporaryFile(mode='w+')
+        export_domain(self, f, format='xml')
         f.seek(0)
         return f
 
-
     def from_xml(self, doc):
-        """Load this domain based on an XML document"""
+        """Load this domain based on an XML document. The items are put
+        in batches by a :class:`boto.sdb.transfer.DomainLoader`, whose
+        ``stats`` and ``failed`` attributes are available as the
+        ``loader`` of the returned handler."""
         import xml.sax
         handler = DomainDumpParser(self)
-        xml.sax.parse(doc, handler)
+        try:
+            xml.sax.parse(doc, handler)
+        finally:
+            handler.loader.close()
         return handler
 
     def delete(self):
@@ -315,51 +323,6 @@ class DomainMetaData(object):
             setattr(self, name, value)
 
 import sys
-from xml.sax.handler import ContentHandler
-class DomainDumpParser(ContentHandler):
-    """
-    SAX parser for a domain that has been dumped
-    """
-
-    def __init__(self, domain):
-        self.uploader = UploaderThread(domain)
-        self.item_id = None
-        self.attrs = {}
-        self.attribute = None
-        self.value = ""
-        self.domain = domain
-
-    def startElement(self, name, attrs):
-        if name == "Item":
-            self.item_id = attrs['id']
-            self.attrs = {}
-        elif name == "attribute":
-            self.attribute = attrs['id']
-        elif name == "value":
-            self.value = ""
-
-    def characters(self, ch):
-        self.value += ch
-
-    def endElement(self, name):
-        if name == "value":
-            if self.value and self.attribute:
-                value = self.value.strip()
-                attr_name = self.attribute.strip()
-                if attr_name in self.attrs:
-                    self.attrs[attr_name].append(value)
-                else:
-                    self.attrs[attr_name] = [value]
-        elif name == "Item":
-            self.uploader.items[self.item_id] = self.attrs
-            # Every 20 items we spawn off the uploader
-            if len(self.uploader.items) >= 20:
-                self.uploader.start()
-                self.uploader = UploaderThread(self.domain)
-        elif name == "Domain":
-            # If we're done, spawn off our last Uploader Thread
-            self.uploader.start()
-
 from threading import Thread
 class UploaderThread(Thread):
     """Uploader Thread"""
@@ -0,0 +1,311 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+
+"""
+Exports the items of a SimpleDB domain to a file and loads them back,
+e.g. to copy a domain to another region::
+
+    with open('mydomain.jsonl', 'w') as fp:
+        export_domain(domain, fp, format='jsonl')
+    with open('mydomain.jsonl') as fp:
+        stats = load_domain(other_domain, fp, format='jsonl', max_workers=8)
+
+Both ends stream: items are written as they are selected, and read one
+at a time. The ``'xml'`` format is that of
+:meth:`boto.sdb.domain.Domain.to_xml`. The ``'jsonl'`` format has one JSON
+object per line, ``{"name": ..., "attributes": {name: [values]}}``, and
+keeps values exactly as they are, including surrounding whitespace.
+"""
+import threading
+import xml.sax
+from xml.sax.handler import ContentHandler
+from xml.sax.saxutils import quoteattr
+
+import boto
+from boto.compat import json, six, Queue
+from boto.exception import BotoServerError
+
+FORMATS = ('xml', 'jsonl')
+
+# Error codes of requests refused because too many are being made.
+THROTTLING_ERRORS = ('RequestThrottled', 'Throttling', 'ServiceUnavailable')
+
+
+def _write(fp, text):
+    if six.PY2 and isinstance(text, six.text_type):
+        text = text.encode('utf-8')
+    fp.write(text)
+
+
+def _as_list(values):
+    if not isinstance(values, list):
+        values = [values]
+    return values
+
+
+def export_domain(domain, fp, format='xml', query=None,
+                  consistent_read=False):
+    """
+    Writes the items of a domain to a file object opened for text.
+
+    :type domain: :class:`boto.sdb.domain.Domain`
+    :param domain: The domain to export.
+
+    :type fp: file
+    :param fp: The file object to write to.
+
+    :type format: str
+    :param format: ``'xml'`` or ``'jsonl'``.
+
+    :type query: str
+    :param query: A select expression choosing the items to export.
+        Defaults to all of them.
+
+    :rtype: int
+    :return: The number of items written.
+    """
+    if format not in FORMATS:
+        raise ValueError('Unknown export format: %r' % format)
+    if query is None:
+        query = "SELECT * FROM `%s`" % domain.name
+    items = domain.select(query, consistent_read=consistent_read)
+    count = 0
+    if format == 'xml':
+        _write(fp, u'<?xml version="1.0" encoding="UTF-8"?>\n')
+        _write(fp, u'<Domain id=%s>\n' % quoteattr(domain.name))
+    for item in items:
+        if format == 'jsonl':
+            attributes = dict((name, _as_list(item[name])) for name in item)
+            _write(fp, json.dumps({'name': item.name,
+                                   'attributes': attributes}) + u'\n')
+        else:
+            _write(fp, u'\t<Item id=%s>\n' % quoteattr(item.name))
+            for name in item:
+                _write(fp, u'\t\t<attribute id=%s>\n' % quoteattr(name))
+                for value in _as_list(item[name]):
+                    value = six.text_type(value).replace(
+                        u']]>', u']]]]><![CDATA[>')
+                    _write(fp, u'\t\t\t<value><![CDATA[ %s]]></value>\n' %
+                           value)
+                _write(fp, u'\t\t</attribute>\n')
+            _write(fp, u'\t</Item>\n')
+        count += 1
+    if format == 'xml':
+        _write(fp, u'</Domain>\n')
+    fp.flush()
+    return count
+
+
+class DomainLoader(object):
+    """
+    Puts items into a domain with BatchPutAttributes requests made by a
+    fixed number of worker threads.
+
+    Items are collected into batches as they are added. Full batches wait
+    in a queue of limited length, so :meth:`put` blocks while the workers
+    are behind instead of reading the whole input into memory.
+
+    Server errors are retried by the connection, as for any other
+    request. A batch rejected by a client error is put again one item at a
+    time, so that only the items that were rejected fail. A batch that
+    still fails with a server error, or is throttled, is not: that would
+    only send more requests to a service that can't keep up. The names of
+    the items that failed are collected in ``failed``.
+
+    :type domain: :class:`boto.sdb.domain.Domain`
+    :param domain: The domain to put the items into.
+
+    :type max_workers: int
+    :param max_workers: The number of worker threads.
+
+    :type batch_size: int
+    :param batch_size: The most items in one request. SimpleDB allows 25.
+
+    :type replace: bool
+    :param replace: Whether the values replace existing ones.
+    """
+
+    def __init__(self, domain, max_workers=4, batch_size=25, replace=True):
+        self.domain = domain
+        self.batch_size = batch_size
+        self.replace = replace
+        self.failed = []
+        self.stats = {'items': 0, 'batches': 0, 'single_puts': 0}
+        self._batch = {}
+        self._lock = threading.Lock()
+        self._queue = Queue(maxsize=max_workers * 2)
+        self._workers = []
+        for _ in range(max_workers):
+            worker = threading.Thread(target=self._work)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def put(self, item_name, attributes):
+        """
+        Adds an item, given as a dict of attribute names to a value or a
+        list of values.
+        """
+        if item_name in self._batch:
+            # A batch can't name the same item twice.
+            self.flush()
+        self._batch[item_name] = attributes
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Queues the items added so far, waiting if the queue is full.
+        """
+        if self._batch:
+            self._queue.put(self._batch)
+            self._batch = {}
+
+    def close(self):
+        """
+        Waits until every item has been put, and stops the workers.
+        """
+        self.flush()
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        return self.stats
+
+    def _work(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            try:
+                self._put_batch(batch)
+            except Exception:
+                boto.log.exception('Error putting %d items' % len(batch))
+                self._record(failed=list(batch))
+
+    def _record(self, failed=(), **counts):
+        with self._lock:
+            for name, count in counts.items():
+                self.stats[name] += count
+            self.failed.extend(failed)
+
+    def _put_batch(self, batch):
+        # A 5xx response has already been retried by the connection, and
+        # then comes back as a plain BotoServerError rather than an
+        # SDBResponseError.
+        try:
+            self.domain.batch_put_attributes(batch, self.replace)
+        except BotoServerError as e:
+            if e.status >= 500 or e.error_code in THROTTLING_ERRORS:
+                boto.log.error('Batch of %d items failed (%s %s)' %
+                               (len(batch), e.status, e.reason))
+                self._record(failed=list(batch))
+                return
+            boto.log.debug('Batch of %d items failed (%s %s), putting them '
+                           'one at a time' % (len(batch), e.status, e.reason))
+            self._put_items(batch)
+        else:
+            self._record(items=len(batch), batches=1)
+
+    def _put_items(self, batch):
+        for item_name, attributes in batch.items():
+            try:
+                self.domain.put_attributes(item_name, attributes, self.replace)
+            except BotoServerError as e:
+                boto.log.error('Could not put %s: %s' % (item_name, e))
+                self._record(single_puts=1, failed=[item_name])
+            else:
+                self._record(items=1, single_puts=1)
+
+
+class DomainDumpParser(ContentHandler):
+    """
+    SAX parser for a domain that has been dumped, passing each item to a
+    :class:`DomainLoader`.
+    """
+
+    def __init__(self, domain, loader=None):
+        if loader is None:
+            loader = DomainLoader(domain)
+        self.loader = loader
+        self.item_id = None
+        self.attrs = {}
+        self.attribute = None
+        self.value = []
+        self.domain = domain
+
+    def startElement(self, name, attrs):
+        if name == "Item":
+            self.item_id = attrs['id']
+            self.attrs = {}
+        elif name == "attribute":
+            self.attribute = attrs['id']
+        elif name == "value":
+            self.value = []
+
+    def characters(self, ch):
+        self.value.append(ch)
+
+    def endElement(self, name):
+        if name == "value":
+            value = ''.join(self.value)
+            if value and self.attribute:
+                value = value.strip()
+                attr_name = self.attribute.strip()
+                self.attrs.setdefault(attr_name, []).append(value)
+        elif name == "Item":
+            self.loader.put(self.item_id, self.attrs)
+        elif name == "Domain":
+            self.loader.flush()
+
+
+def load_domain(domain, fp, format='xml', **kwargs):
+    """
+    Puts the items of a file written by :func:`export_domain` into a
+    domain, with a :class:`DomainLoader` made with ``kwargs``.
+
+    :rtype: :class:`DomainLoader`
+    :return: The loader, once it has finished; see its ``stats`` and
+        ``failed`` attributes.
+    """
+    if format not in FORMATS:
+        raise ValueError('Unknown load format: %r' % format)
+    loader = DomainLoader(domain, **kwargs)
+    try:
+        if format == 'jsonl':
+            for line in fp:
+                line = line.strip()
+                if line:
+                    item = json.loads(line)
+                    loader.put(item['name'], item['attributes'])
+        else:
+            xml.sax.parse(fp, DomainDumpParser(domain, loader))
+    finally:
+        loader.close()
+    return loader
@@ -87,7 +87,7 @@ class BigMessage(RawMessage):
         if bucket_name and key_name:
             return self.s3_url
         key_name = uuid.uuid4()
-        s3_conn = boto.connect_s3()
+        s3_conn = boto.shared_connection('s3')
         s3_bucket = s3_conn.get_bucket(bucket_name)
         key = s3_bucket.new_key(key_name)
         key.set_contents_from_file(value)
@@ -97,7 +97,7 @@ class BigMessage(RawMessage):
     def _get_s3_object(self, s3_url):
         bucket_name, key_name = self._get_bucket_key(s3_url)
         if bucket_name and key_name:
-            s3_conn = boto.connect_s3()
+            s3_conn = boto.shared_connection('s3')
             s3_bucket = s3_conn.get_bucket(bucket_name)
             key = s3_bucket.get_key(key_name)
             return key
@@ -24,7 +24,6 @@ import boto
 import os
 import sys
 import textwrap
-from boto.s3.deletemarker import DeleteMarker
 from boto.exception import BotoClientError
 from boto.exception import InvalidUriError
 
@@ -165,6 +164,8 @@ class StorageUri(object):
         self._check_bucket_uri('list_bucket')
         bucket = self.get_bucket(headers=headers)
         if all_versions:
+            # Imported here so that importing boto doesn't import boto.s3.
+            from boto.s3.deletemarker import DeleteMarker
             return (v for v in bucket.list_versions(
                 prefix=prefix, delimiter=delimiter, headers=headers)
                 if not isinstance(v, DeleteMarker))
@@ -730,6 +730,18 @@ class LRUCache(dict):
             self._update_item(item)
             self._manage_size()
 
+    def __delitem__(self, key):
+        item = self._dict.pop(key)
+        if item.previous is not None:
+            item.previous.next = item.next
+        else:
+            self.head = item.next
+        if item.next is not None:
+            item.next.previous = item.previous
+        else:
+            self.tail = item.previous
+        item.previous = item.next = None
+
     def __repr__(self):
         return repr(self._dict)
 
@@ -1063,6 +1075,13 @@ class RequestHook(object):
     def handle_request_data(self, request, response, error=False):
         pass
 
+    def handle_request_metrics(self, metrics):
+        """
+        Called with the :class:`boto.metrics.RequestMetrics` of each
+        request, once its response body has been read.
+        """
+        pass
+
 
 def host_is_ipv6(hostname):
     """
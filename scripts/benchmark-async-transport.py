@@ -0,0 +1,156 @@
+"""Benchmark sending many requests with threads against the asyncio transport.
+
+A stub DynamoDB endpoint is started in a separate process on localhost. It
+answers every request with a small JSON document after a fixed delay, which
+stands in for the service's latency. The same number of GetItem requests
+is then sent:
+
+* by a pool of threads, each with its own blocking
+  ``boto.dynamodb2.layer1.DynamoDBConnection``, and
+* by a single ``boto.async_connection.AsyncConnection`` running all of the
+  requests at once on one event loop.
+
+This script requires Python 3.5 or later.
+
+Usage
+=====
+
+To send 1000 requests with 50 threads and 50 requests in flight on the
+event loop, against a stub with 20ms of latency::
+
+    python benchmark-async-transport.py
+
+To change the number of requests, the concurrency or the latency::
+
+    python benchmark-async-transport.py --requests 5000 --concurrency 200 \\
+        --latency 0.05
+
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import threading
+import time
+
+from boto.async_connection import AsyncConnection
+from boto.dynamodb2.layer1 import DynamoDBConnection
+
+
+RESPONSE_BODY = json.dumps({'Item': {'username': {'S': 'johndoe'}}})
+RESPONSE = ('HTTP/1.1 200 OK\r\n'
+            'Content-Type: application/x-amz-json-1.0\r\n'
+            'Content-Length: %d\r\n'
+            '\r\n%s' % (len(RESPONSE_BODY), RESPONSE_BODY)).encode('utf-8')
+
+
+class StubProtocol(asyncio.Protocol):
+    latency = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.buffer = b''
+
+    def data_received(self, data):
+        self.buffer += data
+        while b'\r\n\r\n' in self.buffer:
+            head, rest = self.buffer.split(b'\r\n\r\n', 1)
+            length = 0
+            for line in head.split(b'\r\n')[1:]:
+                name, value = line.split(b':', 1)
+                if name.strip().lower() == b'content-length':
+                    length = int(value)
+            if len(rest) < length:
+                return
+            self.buffer = rest[length:]
+            asyncio.get_event_loop().call_later(
+                self.latency, self.transport.write, RESPONSE)
+
+
+def serve(sock, latency):
+    StubProtocol.latency = latency
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(loop.create_server(StubProtocol, sock=sock))
+    loop.run_forever()
+
+
+def make_connection(port):
+    return DynamoDBConnection(aws_access_key_id='access_key',
+                              aws_secret_access_key='secret_key',
+                              host='127.0.0.1', port=port, is_secure=False)
+
+
+def request_body(i):
+    return json.dumps({'TableName': 'users',
+                       'Key': {'username': {'S': 'user%d' % i}}})
+
+
+def run_threads(port, requests, concurrency):
+    remaining = list(range(requests))
+    lock = threading.Lock()
+
+    def worker():
+        conn = make_connection(port)
+        while True:
+            with lock:
+                if not remaining:
+                    return
+                i = remaining.pop()
+            conn.make_request('GetItem', request_body(i))
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.time() - start
+
+
+def run_async(port, requests, concurrency):
+    conn = AsyncConnection(make_connection(port),
+                           max_connections=concurrency)
+    loop = asyncio.new_event_loop()
+    try:
+        start = time.time()
+        loop.run_until_complete(asyncio.gather(*[
+            loop.create_task(conn.make_json_request('GetItem',
+                                                    request_body(i)))
+            for i in range(requests)]))
+        return time.time() - start
+    finally:
+        conn.close()
+        loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=1000,
+                        help='The number of requests to send.')
+    parser.add_argument('--concurrency', type=int, default=50,
+                        help='The number of threads, and the number of '
+                             'requests in flight on the event loop.')
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help='The seconds the stub waits before answering.')
+    args = parser.parse_args()
+
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    server = multiprocessing.Process(target=serve, args=(sock, args.latency))
+    server.daemon = True
+    server.start()
+    try:
+        # Warm up, e.g. so that credentials and endpoints are loaded.
+        make_connection(port).make_request('GetItem', request_body(0))
+        for name, run in [('threads', run_threads), ('asyncio', run_async)]:
+            elapsed = run(port, args.requests, args.concurrency)
+            print('%-8s %d requests in %.2fs (%.0f requests/s)' % (
+                name, args.requests, elapsed, args.requests / elapsed))
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark encoding and decoding DynamoDB items with the Dynamizer.
+
+Items shaped like those of a typical user table (strings, integers,
+decimals, booleans, string and number sets, and a nested map and list)
+are encoded to the DynamoDB wire format and decoded back, using
+``boto.dynamodb.types.Dynamizer`` and its subclasses. No requests are
+sent.
+
+Usage
+=====
+
+To encode and decode 10,000 items::
+
+    python benchmark-dynamizer.py
+
+To change the number of items or the number of times they're processed::
+
+    python benchmark-dynamizer.py --num-items 50000 --repeat 5
+
+"""
+import argparse
+import time
+from decimal import Decimal
+
+from boto.dynamodb.types import (Dynamizer, NonBooleanDynamizer,
+                                 LossyFloatDynamizer)
+
+
+def make_item(i):
+    return {
+        'username': 'user%08d' % i,
+        'email': 'user%08d@example.com' % i,
+        'created_at': 1452525162 + i,
+        'balance': Decimal('%d.%02d' % (i, i % 100)),
+        'logins': i % 1000,
+        'verified': i % 2 == 0,
+        'roles': set(['reader', 'writer']),
+        'scores': set([i % 7, i % 11, i % 13]),
+        'address': {'street': '%d Main St' % i, 'city': 'Seattle',
+                    'zip': 98101 + i % 100},
+        'tags': ['alpha', 'beta', i % 5],
+    }
+
+
+def benchmark(dynamizer, items, repeat):
+    encode = dynamizer.encode
+    decode = dynamizer.decode
+    start = time.time()
+    for _ in range(repeat):
+        encoded = [dict((k, encode(v)) for k, v in item.items())
+                   for item in items]
+    encoding = time.time() - start
+
+    start = time.time()
+    for _ in range(repeat):
+        for item in encoded:
+            dict((k, decode(v)) for k, v in item.items())
+    decoding = time.time() - start
+    return encoding, decoding
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num-items', type=int, default=10000,
+                        help='The number of items to encode and decode.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='The number of times to process the items.')
+    args = parser.parse_args()
+
+    items = [make_item(i) for i in range(args.num_items)]
+    count = args.num_items * args.repeat
+    for cls in (Dynamizer, NonBooleanDynamizer, LossyFloatDynamizer):
+        encoding, decoding = benchmark(cls(), items, args.repeat)
+        print('%-20s encode %.3fs (%d items/s), decode %.3fs (%d items/s)' % (
+            cls.__name__, encoding, count / encoding, decoding,
+            count / decoding))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark how long it takes to start Python and import boto.
+
+Each run starts a new interpreter executing::
+
+    python -c "import boto; boto.connect_s3"
+
+and its wall clock time is compared with starting an interpreter that does
+nothing, so the difference is the time spent importing boto.
+
+Usage
+=====
+
+To time 20 runs of each::
+
+    python benchmark-import.py
+
+To change the number of runs, or to time a different statement::
+
+    python benchmark-import.py --runs 50 --statement "import boto.ec2"
+
+To see which modules are taking the time, use Python's own import
+profiling (Python 3.7+)::
+
+    python -X importtime -c "import boto" 2> import.log
+
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+
+def time_runs(statement, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', statement])
+        timings.append(time.time() - start)
+    return sorted(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=20,
+                        help='The number of interpreters to start.')
+    parser.add_argument('--statement',
+                        default='import boto; boto.connect_s3',
+                        help='The statement to time.')
+    args = parser.parse_args()
+
+    # Warm up any bytecode caches first.
+    subprocess.check_call([sys.executable, '-c', args.statement])
+    baseline = time_runs('pass', args.runs)
+    timings = time_runs(args.statement, args.runs)
+    median = timings[len(timings) // 2]
+    baseline_median = baseline[len(baseline) // 2]
+    print('python -c "pass": median %.1fms' % (baseline_median * 1000))
+    print('python -c "%s": median %.1fms, min %.1fms' % (
+        args.statement, median * 1000, timings[0] * 1000))
+    print('Import overhead: %.1fms' % ((median - baseline_median) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark parsing a large MWS ListOrders response.
+
+A ``ListOrdersResponse`` document with many orders, each with an address,
+an order total and payment details, is generated and parsed the way
+``MWSConnection.list_orders`` parses it: a response object is made by the
+connection's ``ResponseFactory`` and filled in by ``boto.handler``'s
+``XmlHandler``. No requests are sent.
+
+Usage
+=====
+
+To parse a response with 1,000 orders::
+
+    python benchmark-mws-list-orders.py
+
+To change the number of orders or the number of times it is parsed::
+
+    python benchmark-mws-list-orders.py --num-orders 5000 --repeat 10
+
+"""
+import argparse
+import time
+
+from boto.mws.connection import MWSConnection
+
+
+ORDER = """
+    <Order>
+      <AmazonOrderId>058-%(i)07d-0000000</AmazonOrderId>
+      <PurchaseDate>2014-09-05T00:06:07.000Z</PurchaseDate>
+      <LastUpdateDate>2014-09-05T12:43:16.000Z</LastUpdateDate>
+      <OrderStatus>Shipped</OrderStatus>
+      <FulfillmentChannel>MFN</FulfillmentChannel>
+      <SalesChannel>Amazon.com</SalesChannel>
+      <ShipServiceLevel>Std US D2D Dom</ShipServiceLevel>
+      <ShippingAddress>
+        <Name>Buyer %(i)d</Name>
+        <AddressLine1>%(i)d Main St</AddressLine1>
+        <City>Seattle</City>
+        <StateOrRegion>WA</StateOrRegion>
+        <PostalCode>98101</PostalCode>
+        <CountryCode>US</CountryCode>
+      </ShippingAddress>
+      <OrderTotal>
+        <CurrencyCode>USD</CurrencyCode>
+        <Amount>%(i)d.99</Amount>
+      </OrderTotal>
+      <NumberOfItemsShipped>1</NumberOfItemsShipped>
+      <NumberOfItemsUnshipped>0</NumberOfItemsUnshipped>
+      <PaymentExecutionDetail>
+        <PaymentExecutionDetailItem>
+          <Payment>
+            <CurrencyCode>USD</CurrencyCode>
+            <Amount>%(i)d.99</Amount>
+          </Payment>
+          <PaymentMethod>GC</PaymentMethod>
+        </PaymentExecutionDetailItem>
+      </PaymentExecutionDetail>
+      <MarketplaceId>ATVPDKIKX0DER</MarketplaceId>
+      <BuyerEmail>buyer%(i)d@marketplace.amazon.com</BuyerEmail>
+    </Order>"""
+
+
+def make_response(num_orders):
+    orders = ''.join(ORDER % {'i': i} for i in range(num_orders))
+    return ('<?xml version="1.0"?>\n'
+            '<ListOrdersResponse '
+            'xmlns="https://mws.amazonservices.com/Orders/2013-09-01">'
+            '<ListOrdersResult><NextToken>token</NextToken>'
+            '<Orders>%s</Orders></ListOrdersResult>'
+            '<ResponseMetadata><RequestId>id</RequestId></ResponseMetadata>'
+            '</ListOrdersResponse>' % orders).encode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num-orders', type=int, default=1000,
+                        help='The number of orders in the response.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of times to parse the response.')
+    args = parser.parse_args()
+
+    conn = MWSConnection(aws_access_key_id='access_key',
+                         aws_secret_access_key='secret',
+                         Merchant='merchant')
+    body = make_response(args.num_orders)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.time()
+        response = conn._response_factory('ListOrders', connection=conn)
+        conn._parse_response(response, 'text/xml', body)
+        timings.append(time.time() - start)
+    orders = response.ListOrdersResult.Orders.Order
+    assert len(orders) == args.num_orders
+    best = min(timings)
+    print('%d orders: best %.3fs (%d orders/s), mean %.3fs' % (
+        args.num_orders, best, args.num_orders / best,
+        sum(timings) / len(timings)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark bulk S3 presigned URL generation.
+
+This compares calling ``S3Connection.generate_url`` once per key with
+generating the same URLs with ``S3Connection.generate_urls``. No requests
+are sent; dummy credentials are used for signing.
+
+Usage
+=====
+
+To benchmark SigV2 and SigV4 signing of 10,000 keys::
+
+    python benchmark-s3-presign.py
+
+To change the number of keys::
+
+    python benchmark-s3-presign.py --num-keys 100000
+
+"""
+import argparse
+import time
+
+from boto.s3.connection import S3Connection
+
+
+def benchmark(conn, keys):
+    start = time.time()
+    for key in keys:
+        conn.generate_url(3600, 'GET', bucket='examplebucket', key=key)
+    per_call = time.time() - start
+
+    start = time.time()
+    for url in conn.generate_urls(3600, 'GET', 'examplebucket', keys):
+        pass
+    bulk = time.time() - start
+    return per_call, bulk
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num-keys', type=int, default=10000,
+                        help='The number of keys to presign.')
+    args = parser.parse_args()
+
+    keys = ['path/to/object-%08d.jpg' % i for i in range(args.num_keys)]
+    connections = [
+        ('SigV2', S3Connection('access', 'secret', host='s3.amazonaws.com')),
+        ('SigV4', S3Connection('access', 'secret',
+                               host='s3.eu-central-1.amazonaws.com')),
+    ]
+    for name, conn in connections:
+        per_call, bulk = benchmark(conn, keys)
+        print('%s: generate_url %.3fs (%d/s), generate_urls %.3fs (%d/s), '
+              '%.1fx' % (name, per_call, len(keys) / per_call, bulk,
+                         len(keys) / bulk, per_call / bulk))
+
+
+if __name__ == '__main__':
+    main()
@@ -27,9 +27,11 @@ from __future__ import print_function
 
 try:
     from setuptools import setup
+    from setuptools.command.build_py import build_py
     extra = dict(test_suite="tests.test.suite", include_package_data=True)
 except ImportError:
     from distutils.core import setup
+    from distutils.command.build_py import build_py
     extra = {}
 
 import sys
@@ -45,6 +47,16 @@ def readme():
     with open("README.rst") as f:
         return f.read()
 
+class BuildPy(build_py):
+    # boto.async_connection uses async/await, which Pythons before 3.5
+    # can't even byte-compile, so it's left out of their builds.
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info < (3, 5):
+            modules = [module for module in modules
+                       if module[:2] != ("boto", "async_connection")]
+        return modules
+
 setup(name = "boto",
       version = __version__,
       description = "Amazon Web Services Library",
@@ -87,6 +99,7 @@ setup(name = "boto",
           "boto.cacerts": ["cacerts.txt"],
           "boto": ["endpoints.json"],
       },
+      cmdclass = {"build_py": BuildPy},
       license = "MIT",
       platforms = "Posix; MacOS X; Windows",
       classifiers = ["Development Status :: 5 - Production/Stable",
@@ -99,6 +112,7 @@ setup(name = "boto",
                      "Programming Language :: Python :: 2.7",
                      "Programming Language :: Python :: 3",
                      "Programming Language :: Python :: 3.3",
-                     "Programming Language :: Python :: 3.4"],
+                     "Programming Language :: Python :: 3.4",
+                     "Programming Language :: Python :: 3.5"],
       **extra
       )
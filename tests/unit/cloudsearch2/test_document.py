@@ -10,7 +10,7 @@ import json
 
 from boto.cloudsearch2.document import DocumentServiceConnection
 from boto.cloudsearch2.document import CommitMismatchError, EncodingError, \
-        ContentTooLongError, DocumentServiceConnection
+        ContentTooLongError, DocumentServiceConnection, BulkDocumentUploader
 
 import boto
 from tests.unit.cloudsearch2 import DEMO_DOMAIN_DATA
@@ -118,6 +118,67 @@ class CloudSearchDocumentSingleTest(CloudSearchDocumentTest):
 
         self.assertEqual(doc.doc_service, document)
 
+    def test_cloudsearch_session_is_reused(self):
+        document = DocumentServiceConnection(
+            endpoint="doc-demo-userdomain.us-east-1.cloudsearch.amazonaws.com")
+        document.add("1234", {"id": "1234", "title": "Title 1"})
+        document.commit()
+        session = document._session
+        document.commit()
+        self.assertIs(document._session, session)
+
+
+class CloudSearchBulkUploaderTest(CloudSearchDocumentTest):
+
+    response = {
+        'status': 'success',
+        'adds': 1,
+        'deletes': 0,
+    }
+
+    def setUp(self):
+        super(CloudSearchBulkUploaderTest, self).setUp()
+        self.document = DocumentServiceConnection(
+            endpoint="doc-demo-userdomain.us-east-1.cloudsearch.amazonaws.com")
+
+    def test_batches_are_split_by_size(self):
+        # Each document is around 50 bytes, so only one fits per batch.
+        uploader = BulkDocumentUploader(self.document, max_batch_size=80,
+                                        num_threads=1)
+        for _id in ['1234', '1235', '1236']:
+            uploader.add(_id, {"id": _id, "title": "Title"})
+        uploader.close()
+
+        self.assertEqual(uploader.adds, 3)
+        self.assertEqual(uploader.deletes, 0)
+        self.assertEqual(uploader.errors, [])
+        args = json.loads(HTTPretty.last_request.body.decode('utf-8'))
+        self.assertEqual(len(args), 1)
+        self.assertEqual(args[0]['id'], '1236')
+
+    def test_errors_are_collected(self):
+        uploader = BulkDocumentUploader(self.document, num_threads=1)
+        uploader.add('1234', {"id": '1234'})
+        uploader.add('1235', {"id": '1235'})
+        uploader.close()
+
+        # The response only reports one add for a batch of two.
+        self.assertEqual(uploader.adds, 0)
+        self.assertEqual(len(uploader.errors), 1)
+        self.assertIsInstance(uploader.errors[0], CommitMismatchError)
+
+    def test_document_too_large(self):
+        uploader = BulkDocumentUploader(self.document, max_batch_size=10,
+                                        num_threads=1)
+        self.assertRaises(ContentTooLongError, uploader.add, '1234',
+                          {"id": '1234'})
+        uploader.close()
+
+    def test_add_after_close(self):
+        uploader = BulkDocumentUploader(self.document, num_threads=1)
+        uploader.close()
+        self.assertRaises(ValueError, uploader.delete, '1234')
+
 
 class CloudSearchDocumentMultipleAddTest(CloudSearchDocumentTest):
 
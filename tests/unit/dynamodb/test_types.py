@@ -102,6 +102,106 @@ class TestDynamizer(unittest.TestCase):
         output_doc = {'provider_categories': ['F', 'GM', 'TSLA'], '__type__': 'Story', 'company_tickers': set(['NASDAQ-TSLA', 'NYSE-GM', 'NYSE-F']), 'modified_at': Decimal('1452525162'), 'version': Decimal('1'), 'received_at': '2016-01-11T11:26:31Z', 'created_at': Decimal('1452525162'), 'categories': set(['LTRTR', 'TAXE', 'MANUFCTU', 'TL', 'TJ', 'AUTOMTVE', 'PRHYPE', 'PN'])}
         self.assertEqual(json.loads(doc, object_hook=dynamizer.decode), output_doc)
 
+    def test_number_edge_cases(self):
+        dynamizer = types.Dynamizer()
+        self.assertEqual(dynamizer.encode(-(10 ** 37)),
+                         {'N': '-1' + '0' * 37})
+        self.assertEqual(dynamizer.encode(10 ** 38 - 1), {'N': '9' * 38})
+        with self.assertRaises(DynamoDBNumberError):
+            dynamizer.encode(10 ** 38 + 1)
+        with self.assertRaises(DynamoDBNumberError):
+            dynamizer.encode(float('nan'))
+        with self.assertRaises(DynamoDBNumberError):
+            dynamizer.encode(Decimal('-Infinity'))
+
+    def test_subclasses_of_python_types(self):
+        class Name(six.text_type):
+            pass
+
+        class Count(int):
+            pass
+
+        dynamizer = types.Dynamizer()
+        self.assertEqual(dynamizer.encode(Name('foo')), {'S': 'foo'})
+        self.assertEqual(dynamizer.encode(Count(3)), {'N': '3'})
+        with self.assertRaises(TypeError):
+            dynamizer.encode(object())
+
+    def test_overridden_methods(self):
+        class UpperDynamizer(types.Dynamizer):
+            def _encode_s(self, attr):
+                return attr.upper()
+
+            def _decode_s(self, attr):
+                return attr.lower()
+
+        class StringDynamizer(types.Dynamizer):
+            def _get_dynamodb_type(self, attr):
+                return 'S'
+
+        self.assertEqual(UpperDynamizer().encode('foo'), {'S': 'FOO'})
+        self.assertEqual(UpperDynamizer().decode({'S': 'FOO'}), 'foo')
+        self.assertEqual(StringDynamizer().encode(1), {'S': '1'})
+
+    def test_json_object_hook(self):
+        dynamizer = types.Dynamizer()
+        response = {
+            'Items': [
+                {'id': {'N': '1'}, 'name': {'S': 'foo'},
+                 'tags': {'SS': ['a']}, 'deleted': {'BOOL': False},
+                 'parent': {'NULL': True}, 'data': {'B': 'AQ=='},
+                 'attrs': {'M': {'S': {'S': 'x'}, 'empty': {'M': {}}}},
+                 'list': {'L': [{'N': '2'}, {'L': []}, {'M': {}}]}},
+                {'S': {'S': 'only'}},
+            ],
+            'LastEvaluatedKey': {'id': {'N': '1'}},
+            'Count': 2,
+        }
+        decoded = json.loads(json.dumps(response),
+                             object_hook=dynamizer.json_object_hook)
+        self.assertEqual(decoded, {
+            'Items': [
+                {'id': Decimal('1'), 'name': 'foo', 'tags': set(['a']),
+                 'deleted': False, 'parent': None,
+                 'data': types.Binary(b'\x01'),
+                 'attrs': {'S': 'x', 'empty': {}},
+                 'list': [Decimal('2'), [], {}]},
+                {'S': 'only'},
+            ],
+            'LastEvaluatedKey': {'id': Decimal('1')},
+            'Count': 2,
+        })
+        for raw_item, item in zip(response['Items'], decoded['Items']):
+            self.assertEqual(
+                dict((k, dynamizer.decode(v)) for k, v in raw_item.items()),
+                item)
+
+    def test_json_object_hook_leaves_other_objects(self):
+        dynamizer = types.Dynamizer()
+        response = {'Responses': {'L': [{'id': {'S': 'a'}}],
+                                  'SS': [{'id': {'S': 'b'}}],
+                                  'M': []}}
+        decoded = json.loads(json.dumps(response),
+                             object_hook=dynamizer.json_object_hook)
+        self.assertEqual(decoded, {'Responses': {'L': [{'id': 'a'}],
+                                                 'SS': [{'id': 'b'}],
+                                                 'M': []}})
+
+    def test_json_object_hook_subclasses(self):
+        doc = '{"n": {"N": "1.5"}, "ns": {"NS": ["1"]}}'
+        self.assertEqual(
+            json.loads(doc, object_hook=types.LossyFloatDynamizer()
+                       .json_object_hook),
+            {'n': 1.5, 'ns': set([1])})
+
+    def test_decoding_non_types(self):
+        dynamizer = types.Dynamizer()
+        self.assertEqual(dynamizer.decode({'s': 'foo'}), {'s': 'foo'})
+        self.assertEqual(dynamizer.decode({'X': 'foo'}), {'X': 'foo'})
+        self.assertEqual(dynamizer.decode({}), {})
+        self.assertEqual(dynamizer.decode({'S': 'a', 'N': '1'}),
+                         {'S': 'a', 'N': '1'})
+
 
 class TestBinary(unittest.TestCase):
     def test_good_input(self):
@@ -23,9 +23,14 @@
 """
 Tests for Layer1 of DynamoDB v2
 """
+from tests.compat import mock
 from tests.unit import unittest
+from boto.compat import json
+from boto.dynamodb2.exceptions import ProvisionedThroughputExceededException
 from boto.dynamodb2.layer1 import DynamoDBConnection
+from boto.exception import JSONResponseError
 from boto.regioninfo import RegionInfo
+from boto.retry import RetryPolicy, RetryRule
 
 
 class DynamoDBv2Layer1UnitTest(unittest.TestCase):
@@ -51,3 +56,38 @@ class DynamoDBv2Layer1UnitTest(unittest.TestCase):
             host='localhost', port=8000)
         self.assertEqual(dynamodb.host, 'localhost')
         self.assertEqual(dynamodb.port, 8000)
+
+    def test_throttling_uses_retry_budget(self):
+        dynamodb = DynamoDBConnection(
+            aws_access_key_id='aws_access_key_id',
+            aws_secret_access_key='aws_secret_access_key')
+        dynamodb.set_retry_policy(RetryPolicy(budget=5))
+        response = mock.Mock(status=400)
+        response.getheader.return_value = None
+        response.read.return_value = json.dumps({
+            '__type': 'com.amazonaws.dynamodb.v20120810#'
+                      'ProvisionedThroughputExceededException'}).encode('utf-8')
+
+        status = dynamodb._retry_handler(response, 0, 0)
+        self.assertEqual(status[1], 1)
+        self.assertEqual(dynamodb.retry_policy.stats['retries_by_class'],
+                         {'throttling': 1})
+        with self.assertRaises(ProvisionedThroughputExceededException):
+            dynamodb._retry_handler(response, 1, 0)
+        self.assertEqual(dynamodb.throughput_exceeded_events, 2)
+
+    def test_checksum_error_respects_retry_budget(self):
+        dynamodb = DynamoDBConnection(
+            aws_access_key_id='aws_access_key_id',
+            aws_secret_access_key='aws_secret_access_key')
+        dynamodb.set_retry_policy(RetryPolicy(
+            budget=5, rules={'checksum': RetryRule(base_delay=0, cost=5)}))
+        response = mock.Mock(status=200)
+        response.getheader.return_value = '1'
+        response.read.return_value = b'{}'
+
+        status = dynamodb._retry_handler(response, 0, 0)
+        self.assertEqual(status[1], 1)
+        with self.assertRaises(JSONResponseError):
+            dynamodb._retry_handler(response, 1, 0)
+        self.assertEqual(dynamodb.retry_policy.stats['denied'], 1)
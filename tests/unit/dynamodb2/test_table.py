@@ -11,12 +11,23 @@ from boto.dynamodb2.table import Table
 from boto.dynamodb2.types import (STRING, NUMBER, BINARY,
                                   FILTER_OPERATORS, QUERY_OPERATORS)
 from boto.exception import JSONResponseError
-from boto.compat import six, long_type
+from boto.compat import six, long_type, json
 
 
 FakeDynamoDBConnection = mock.create_autospec(DynamoDBConnection)
 
 
+def parsed(response):
+    """
+    A side effect for a mocked low-level call, returning ``response`` as if
+    it had been parsed with the object hook the call was given.
+    """
+    def side_effect(*args, **kwargs):
+        return json.loads(json.dumps(response),
+                          object_hook=kwargs.get('object_hook'))
+    return side_effect
+
+
 class SchemaFieldsTestCase(unittest.TestCase):
     def test_hash_key(self):
         hash_key = HashKey('hello')
@@ -475,6 +486,22 @@ class ItemTestCase(unittest.TestCase):
             'jane'
         ]))
 
+    def test_load_decoded(self):
+        item = Item(self.table)
+        item.load_decoded({
+            'username': 'johndoe',
+            'friends': set(['alice']),
+            'address': {'city': 'Seattle'},
+        })
+        self.assertEqual(item['username'], 'johndoe')
+        self.assertFalse(item.needs_save())
+        item['friends'].add('bob')
+        item['address']['city'] = 'Portland'
+        self.assertEqual(item._determine_alterations()['changes'], {
+            'friends': set(['alice', 'bob']),
+            'address': {'city': 'Portland'},
+        })
+
     def test_get_keys(self):
         # Setup the data.
         self.table.schema = [
@@ -2368,7 +2395,7 @@ class TableTestCase(unittest.TestCase):
         with mock.patch.object(
                 self.users.connection,
                 'query',
-                return_value=expected) as mock_query:
+                side_effect=parsed(expected)) as mock_query:
             results = self.users._query(
                 limit=4,
                 reverse=True,
@@ -2379,7 +2406,7 @@ class TableTestCase(unittest.TestCase):
             self.assertEqual(len(results['results']), 4)
             self.assertEqual(results['last_key'], None)
 
-        mock_query.assert_called_once_with('users',
+        mock_query.assert_called_once_with('users', object_hook=mock.ANY,
             consistent_read=False,
             scan_index_forward=False,
             index_name=None,
@@ -2406,7 +2433,7 @@ class TableTestCase(unittest.TestCase):
         with mock.patch.object(
                 self.users.connection,
                 'query',
-                return_value=expected) as mock_query_2:
+                side_effect=parsed(expected)) as mock_query_2:
             results = self.users._query(
                 limit=4,
                 reverse=True,
@@ -2423,7 +2450,7 @@ class TableTestCase(unittest.TestCase):
             self.assertEqual(len(results['results']), 4)
             self.assertEqual(results['last_key'], {'username': 'johndoe'})
 
-        mock_query_2.assert_called_once_with('users',
+        mock_query_2.assert_called_once_with('users', object_hook=mock.ANY,
             key_conditions={
                 'username': {
                     'AttributeValueList': [{'S': 'aaa'}, {'S': 'mmm'}],
@@ -2484,7 +2511,7 @@ class TableTestCase(unittest.TestCase):
         with mock.patch.object(
                 self.users.connection,
                 'scan',
-                return_value=expected) as mock_scan:
+                side_effect=parsed(expected)) as mock_scan:
             results = self.users._scan(
                 limit=2,
                 friend_count__lte=2
@@ -2494,7 +2521,7 @@ class TableTestCase(unittest.TestCase):
             self.assertEqual(len(results['results']), 3)
             self.assertEqual(results['last_key'], None)
 
-        mock_scan.assert_called_once_with('users',
+        mock_scan.assert_called_once_with('users', object_hook=mock.ANY,
             scan_filter={
                 'friend_count': {
                     'AttributeValueList': [{'N': '2'}],
@@ -2518,7 +2545,7 @@ class TableTestCase(unittest.TestCase):
         with mock.patch.object(
                 self.users.connection,
                 'scan',
-                return_value=expected) as mock_scan_2:
+                side_effect=parsed(expected)) as mock_scan_2:
             results = self.users._scan(
                 limit=3,
                 friend_count__lte=2,
@@ -2533,7 +2560,7 @@ class TableTestCase(unittest.TestCase):
             self.assertEqual(len(results['results']), 3)
             self.assertEqual(results['last_key'], {'username': 'jane'})
 
-        mock_scan_2.assert_called_once_with('users',
+        mock_scan_2.assert_called_once_with('users', object_hook=mock.ANY,
             scan_filter={
                 'friend_count': {
                     'AttributeValueList': [{'N': '2'}],
@@ -2881,7 +2908,7 @@ class TableTestCase(unittest.TestCase):
         with mock.patch.object(
                 self.users.connection,
                 'batch_get_item',
-                return_value=expected) as mock_batch_get:
+                side_effect=parsed(expected)) as mock_batch_get:
             results = self.users._batch_get(keys=[
                 {'username': 'alice', 'friend_count': 1},
                 {'username': 'bob', 'friend_count': 1},
@@ -2893,7 +2920,7 @@ class TableTestCase(unittest.TestCase):
             self.assertEqual(results['last_key'], None)
             self.assertEqual(results['unprocessed_keys'], [])
 
-        mock_batch_get.assert_called_once_with(request_items={
+        mock_batch_get.assert_called_once_with(object_hook=mock.ANY, request_items={
             'users': {
                 'Keys': [
                     {
@@ -2923,7 +2950,7 @@ class TableTestCase(unittest.TestCase):
         with mock.patch.object(
                 self.users.connection,
                 'batch_get_item',
-                return_value=expected) as mock_batch_get_2:
+                side_effect=parsed(expected)) as mock_batch_get_2:
             results = self.users._batch_get(keys=[
                 {'username': 'alice', 'friend_count': 1},
                 {'username': 'bob', 'friend_count': 1},
@@ -2937,7 +2964,7 @@ class TableTestCase(unittest.TestCase):
                 {'username': 'jane'}
             ])
 
-        mock_batch_get_2.assert_called_once_with(request_items={
+        mock_batch_get_2.assert_called_once_with(object_hook=mock.ANY, request_items={
             'users': {
                 'Keys': [
                     {
@@ -2979,7 +3006,7 @@ class TableTestCase(unittest.TestCase):
         with mock.patch.object(
                 self.users.connection,
                 'batch_get_item',
-                return_value=expected) as mock_batch_get_attr:
+                side_effect=parsed(expected)) as mock_batch_get_attr:
             results = self.users._batch_get(keys=[
                     {'username': 'alice'},
                     {'username': 'bob'},
@@ -2992,7 +3019,7 @@ class TableTestCase(unittest.TestCase):
             self.assertEqual(results['last_key'], None)
             self.assertEqual(results['unprocessed_keys'], [])
 
-        mock_batch_get_attr.assert_called_once_with(request_items={
+        mock_batch_get_attr.assert_called_once_with(object_hook=mock.ANY, request_items={
             'users': {
                 'Keys': [ { 'username': {'S': 'alice'} },
                           { 'username': {'S': 'bob'} }, ],
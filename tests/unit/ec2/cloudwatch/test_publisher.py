@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+from tests.compat import mock, unittest
+
+from boto.ec2.cloudwatch.publisher import MetricPublisher
+
+
+class TestMetricPublisher(unittest.TestCase):
+    def setUp(self):
+        self.connection = mock.Mock()
+        self.publisher = MetricPublisher(self.connection, 'MyService',
+                                         interval=3600)
+
+    def tearDown(self):
+        self.publisher.close()
+
+    def test_values_are_aggregated(self):
+        self.publisher.put('Latency', 10, unit='Milliseconds')
+        self.publisher.put('Latency', 30, unit='Milliseconds')
+        self.publisher.put('Latency', 20, unit='Milliseconds')
+        self.publisher.flush()
+
+        self.assertEqual(self.connection.put_metric_data.call_count, 1)
+        args, kwargs = self.connection.put_metric_data.call_args
+        self.assertEqual(args, ('MyService', ['Latency']))
+        self.assertEqual(kwargs['unit'], ['Milliseconds'])
+        self.assertEqual(kwargs['statistics'], [
+            {'maximum': 30, 'minimum': 10, 'samplecount': 3, 'sum': 60}])
+        self.assertEqual(self.publisher.sent, 1)
+
+    def test_dimensions_are_separate_series(self):
+        self.publisher.put('Latency', 10, dimensions={'Op': 'Get'})
+        self.publisher.put('Latency', 20, dimensions={'Op': 'Put'})
+        self.publisher.put('Latency', 30, dimensions={'Op': 'Get'})
+        self.publisher.flush()
+
+        args, kwargs = self.connection.put_metric_data.call_args
+        series = dict((d['Op'], s) for d, s in
+                      zip(kwargs['dimensions'], kwargs['statistics']))
+        self.assertEqual(series['Get']['samplecount'], 2)
+        self.assertEqual(series['Put']['samplecount'], 1)
+
+    def test_datums_are_sent_in_batches_of_twenty(self):
+        for i in range(45):
+            self.publisher.put('Metric%d' % i, i)
+        self.publisher.flush()
+
+        self.assertEqual(self.connection.put_metric_data.call_count, 3)
+        sizes = [len(call[0][1]) for call in
+                 self.connection.put_metric_data.call_args_list]
+        self.assertEqual(sizes, [20, 20, 5])
+
+    def test_flush_clears_pending_values(self):
+        self.publisher.put('Latency', 10)
+        self.publisher.flush()
+        self.publisher.flush()
+        self.assertEqual(self.connection.put_metric_data.call_count, 1)
+
+    def test_new_series_dropped_when_full(self):
+        self.publisher.max_series = 1
+        self.publisher.put('Latency', 10)
+        self.publisher.put('Errors', 1)
+        self.publisher.put('Latency', 20)
+        self.publisher.flush()
+
+        args, kwargs = self.connection.put_metric_data.call_args
+        self.assertEqual(args[1], ['Latency'])
+        self.assertEqual(self.publisher.dropped, 1)
+
+    def test_failed_flush_drops_values(self):
+        self.connection.put_metric_data.side_effect = Exception('throttled')
+        self.publisher.put('Latency', 10)
+        self.publisher.put('Latency', 20)
+        self.publisher.flush()
+        self.assertEqual(self.publisher.dropped, 2)
+        self.assertEqual(self.publisher.sent, 0)
+
+    def test_close_flushes(self):
+        self.publisher.put('Latency', 10)
+        self.publisher.close()
+        self.assertEqual(self.connection.put_metric_data.call_count, 1)
+
+    def test_background_flush_until_stopped(self):
+        stopped = mock.Mock()
+        # Event.wait() returns None on Python 2.6.
+        stopped.wait.return_value = None
+        stopped.is_set.side_effect = [False, False, True]
+        publisher = MetricPublisher(self.connection, 'MyService',
+                                    interval=3600)
+        publisher.close()
+        publisher._stopped = stopped
+        with mock.patch.object(publisher, 'flush') as flush:
+            publisher._run()
+        self.assertEqual(flush.call_count, 2)
+        stopped.wait.assert_called_with(3600)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+from tests.compat import mock, unittest
+from tests.unit import AWSMockServiceTestCase
+
+from boto.ec2.cache import DescribeCache
+from boto.ec2.connection import EC2Connection
+from boto.exception import EC2ResponseError
+from boto.resultset import ResultSet
+
+
+DESCRIBE_IMAGES = b"""<?xml version="1.0" encoding="UTF-8"?>
+<DescribeImagesResponse xmlns="http://ec2.amazonaws.com/doc/2014-10-01/">
+  <requestId>59dbff89-35bd-4eac-99ed-be587EXAMPLE</requestId>
+  <imagesSet>
+    <item>
+      <imageId>ami-1a2b3c4d</imageId>
+      <imageState>available</imageState>
+    </item>
+  </imagesSet>
+</DescribeImagesResponse>
+"""
+
+DESCRIBE_ZONES = b"""<?xml version="1.0" encoding="UTF-8"?>
+<DescribeAvailabilityZonesResponse xmlns="http://ec2.amazonaws.com/doc/2014-10-01/">
+  <requestId>59dbff89-35bd-4eac-99ed-be587EXAMPLE</requestId>
+  <availabilityZoneInfo>
+    <item>
+      <zoneName>us-east-1a</zoneName>
+      <zoneState>available</zoneState>
+    </item>
+  </availabilityZoneInfo>
+</DescribeAvailabilityZonesResponse>
+"""
+
+STATUS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<DeregisterImageResponse xmlns="http://ec2.amazonaws.com/doc/2014-10-01/">
+  <requestId>59dbff89-35bd-4eac-99ed-be587EXAMPLE</requestId>
+  <return>true</return>
+</DeregisterImageResponse>
+"""
+
+
+def make_result(*items):
+    result = ResultSet()
+    result.extend(items)
+    return result
+
+
+class TestDescribeCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = DescribeCache(max_entries=2)
+        self.key = self.cache.key('DescribeImages', {'Owner.1': 'self'},
+                                  '/', 'POST')
+
+    def test_key_ignores_param_order(self):
+        self.assertEqual(
+            self.cache.key('DescribeImages', {'A': '1', 'B': '2'}, '/', 'GET'),
+            self.cache.key('DescribeImages', {'B': '2', 'A': '1'}, '/', 'GET'))
+
+    def test_returns_copies(self):
+        self.cache.put(self.key, make_result('a', 'b'))
+        first = self.cache.get(self.key)
+        first.pop()
+        self.assertEqual(self.cache.get(self.key), ['a', 'b'])
+        self.assertEqual(self.cache.hits, 2)
+
+    @mock.patch('time.time')
+    def test_expiry(self, time_mock):
+        time_mock.return_value = 100
+        self.cache.put(self.key, make_result('a'))
+        time_mock.return_value = 159
+        self.assertEqual(self.cache.get(self.key), ['a'])
+        time_mock.return_value = 160
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_eviction(self):
+        keys = [self.cache.key('DescribeImages', {'ImageId.1': str(i)},
+                               '/', 'POST') for i in range(3)]
+        for key in keys:
+            self.cache.put(key, make_result(key))
+        self.assertIsNone(self.cache.get(keys[0]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+
+    def test_invalidate(self):
+        zones = self.cache.key('DescribeAvailabilityZones', {}, '/', 'POST')
+        self.cache.put(self.key, make_result('a'))
+        self.cache.put(zones, make_result('b'))
+        self.cache.invalidate('DeregisterImage')
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertEqual(self.cache.get(zones), ['b'])
+
+    def test_ttl_overrides(self):
+        cache = DescribeCache({'DescribeImages': 0, 'DescribeVolumes': 5})
+        self.assertFalse(cache.caches('DescribeImages'))
+        self.assertTrue(cache.caches('DescribeVolumes'))
+        self.assertFalse(cache.caches('DescribeInstances'))
+
+
+class TestEC2DescribeCache(AWSMockServiceTestCase):
+    connection_class = EC2Connection
+
+    def setUp(self):
+        super(TestEC2DescribeCache, self).setUp()
+        self.cache = self.service_connection.enable_describe_cache()
+
+    def test_repeated_calls_are_cached(self):
+        self.set_http_response(status_code=200, body=DESCRIBE_IMAGES)
+        first = self.service_connection.get_all_images(owners=['self'])
+        second = self.service_connection.get_all_images(owners=['self'])
+        self.assertEqual(self.https_connection.request.call_count, 1)
+        self.assertEqual([image.id for image in second], ['ami-1a2b3c4d'])
+        self.assertIsNot(first, second)
+
+        self.service_connection.get_all_images(owners=['amazon'])
+        self.assertEqual(self.https_connection.request.call_count, 2)
+
+    def test_uncached_actions(self):
+        self.set_http_response(status_code=200, body=DESCRIBE_IMAGES)
+        self.service_connection.get_all_images()
+        self.service_connection.disable_describe_cache()
+        self.service_connection.get_all_images()
+        self.assertEqual(self.https_connection.request.call_count, 2)
+
+    def test_mutating_call_invalidates(self):
+        self.set_http_response(status_code=200, body=DESCRIBE_ZONES)
+        self.service_connection.get_all_zones()
+        self.set_http_response(status_code=200, body=DESCRIBE_IMAGES)
+        self.service_connection.get_all_images()
+
+        self.set_http_response(status_code=200, body=STATUS)
+        self.service_connection.deregister_image('ami-1a2b3c4d')
+        self.set_http_response(status_code=200, body=DESCRIBE_IMAGES)
+        self.service_connection.get_all_images()
+        self.service_connection.get_all_zones()
+        self.assertEqual(self.https_connection.request.call_count, 4)
+
+    def test_failed_mutating_call_invalidates(self):
+        self.set_http_response(status_code=200, body=DESCRIBE_IMAGES)
+        self.service_connection.get_all_images()
+        self.set_http_response(status_code=400, body=b'<Response/>')
+        with self.assertRaises(EC2ResponseError):
+            self.service_connection.deregister_image('ami-1a2b3c4d')
+        self.set_http_response(status_code=200, body=DESCRIBE_IMAGES)
+        self.service_connection.get_all_images()
+        self.assertEqual(self.https_connection.request.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import threading
+
+from tests.compat import mock, unittest
+from tests.unit import AWSMockServiceTestCase
+
+from boto.ec2.connection import EC2Connection
+from boto.ec2.paginator import item_lister, page_lister
+from boto.exception import EC2ResponseError
+from boto.resultset import ResultSet
+
+
+DESCRIBE_TAGS = """<?xml version="1.0" encoding="UTF-8"?>
+<DescribeTagsResponse xmlns="http://ec2.amazonaws.com/doc/2014-10-01/">
+  <requestId>7a62c49f-347e-4fc4-9331-6e8eEXAMPLE</requestId>
+  <tagSet>
+    <item>
+      <resourceId>%s</resourceId>
+      <resourceType>instance</resourceType>
+      <key>Name</key>
+      <value>web</value>
+    </item>
+  </tagSet>
+  %s
+</DescribeTagsResponse>
+"""
+
+
+def make_page(items, next_token=None):
+    page = ResultSet()
+    page.extend(items)
+    page.next_token = next_token
+    return page
+
+
+class FakeDescribe(object):
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+        self.threads = []
+
+    def __call__(self, next_token=None, **kwargs):
+        self.calls.append((next_token, kwargs))
+        self.threads.append(threading.current_thread())
+        page = self.pages[next_token]
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+
+class TestPaginator(unittest.TestCase):
+    def setUp(self):
+        self.describe = FakeDescribe({
+            None: make_page([1, 2], 'b'),
+            'b': make_page([3], 'c'),
+            'c': make_page([4]),
+        })
+
+    def test_item_lister(self):
+        items = list(item_lister(self.describe, max_results=2))
+        self.assertEqual(items, [1, 2, 3, 4])
+        self.assertEqual(self.describe.calls, [
+            (None, {'max_results': 2}), ('b', {'max_results': 2}),
+            ('c', {'max_results': 2})])
+
+    def test_prefetch(self):
+        pages = page_lister(self.describe)
+        self.assertEqual(next(pages), [1, 2])
+        self.assertEqual(len(self.describe.calls), 2)
+        self.assertIsNot(self.describe.threads[1], threading.current_thread())
+
+    def test_no_prefetch(self):
+        pages = page_lister(self.describe, prefetch=False)
+        self.assertEqual(next(pages), [1, 2])
+        self.assertEqual(len(self.describe.calls), 1)
+        self.assertEqual(list(pages), [[3], [4]])
+        self.assertEqual(set(self.describe.threads),
+                         set([threading.current_thread()]))
+
+    def test_starting_token(self):
+        self.assertEqual(list(item_lister(self.describe, 'c')), [4])
+
+    def test_prefetch_error(self):
+        self.describe.pages['c'] = EC2ResponseError(500, 'Internal Error')
+        items = item_lister(self.describe)
+        self.assertEqual([next(items) for i in range(3)], [1, 2, 3])
+        with self.assertRaises(EC2ResponseError):
+            next(items)
+
+
+class TestEC2Iterators(AWSMockServiceTestCase):
+    connection_class = EC2Connection
+
+    def test_iter_tags(self):
+        self.https_connection.getresponse.side_effect = [
+            self.create_response(200, body=DESCRIBE_TAGS % (
+                'i-1', '<nextToken>page2</nextToken>')),
+            self.create_response(200, body=DESCRIBE_TAGS % ('i-2', '')),
+        ]
+        tags = list(self.service_connection.iter_tags(
+            filters={'key': 'Name'}, page_size=1))
+        self.assertEqual([tag.res_id for tag in tags], ['i-1', 'i-2'])
+        self.assert_request_parameters({
+            'Action': 'DescribeTags',
+            'Filter.1.Name': 'key',
+            'Filter.1.Value.1': 'Name',
+            'MaxResults': 1,
+            'NextToken': 'page2'},
+            ignore_params_values=['AWSAccessKeyId', 'SignatureMethod',
+                                  'SignatureVersion', 'Timestamp',
+                                  'Version'])
+
+    def test_iter_instances(self):
+        reservations = [mock.Mock(instances=['i-1', 'i-2']),
+                        mock.Mock(instances=['i-3'])]
+        pages = {None: make_page(reservations[:1], 'b'),
+                 'b': make_page(reservations[1:])}
+        with mock.patch.object(self.service_connection,
+                               'get_all_reservations',
+                               side_effect=lambda **kwargs:
+                               pages[kwargs['next_token']]) as describe:
+            instances = list(self.service_connection.iter_instances(
+                filters={'instance-state-name': 'running'},
+                prefetch=False))
+        self.assertEqual(instances, ['i-1', 'i-2', 'i-3'])
+        describe.assert_called_with(
+            filters={'instance-state-name': 'running'}, instance_ids=None,
+            dry_run=False, max_results=None, next_token='b')
+
+
+if __name__ == '__main__':
+    unittest.main()
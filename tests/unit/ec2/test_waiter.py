@@ -0,0 +1,159 @@
+from tests.compat import mock, unittest
+
+from boto.ec2.connection import EC2Connection
+from boto.ec2.image import Image
+from boto.ec2.instance import Instance
+from boto.ec2.volume import Volume
+from boto.ec2.waiter import ResourceWaiter
+from boto.exception import WaiterError
+
+
+def make_instance(instance_id, state='pending'):
+    instance = Instance()
+    instance.id = instance_id
+    instance._state.name = state
+    return instance
+
+
+def make_volume(volume_id, status='creating'):
+    volume = Volume()
+    volume.id = volume_id
+    volume.status = status
+    return volume
+
+
+def make_image(image_id, state='pending'):
+    image = Image()
+    image.id = image_id
+    image.state = state
+    return image
+
+
+class TestResourceWaiter(unittest.TestCase):
+    def setUp(self):
+        self.connection = mock.Mock()
+        self.waiter = ResourceWaiter(self.connection, interval=1,
+                                     max_interval=4, backoff=2,
+                                     chunk_size=2)
+
+    def test_polls_resources_together(self):
+        instances = [make_instance('i-%d' % i) for i in range(3)]
+        waits = [self.waiter.add(instance, 'running')
+                 for instance in instances]
+        self.connection.get_only_instances.side_effect = [
+            [make_instance('i-0', 'running'), make_instance('i-1')],
+            [make_instance('i-2', 'running')],
+        ]
+
+        self.assertEqual(self.waiter.poll(), 1)
+        self.connection.get_only_instances.assert_has_calls([
+            mock.call(filters={'instance-id': ['i-0', 'i-1']}),
+            mock.call(filters={'instance-id': ['i-2']}),
+        ])
+        self.assertTrue(waits[0].done)
+        self.assertFalse(waits[1].done)
+        self.assertTrue(waits[2].done)
+        self.assertEqual(instances[0].state, 'running')
+        self.assertEqual(waits[0].result(), instances[0])
+
+    def test_resource_types_are_polled_separately(self):
+        self.waiter.add(make_instance('i-1'), 'running')
+        self.waiter.add(make_volume('vol-1'), 'available')
+        self.connection.get_only_instances.return_value = [
+            make_instance('i-1', 'running')]
+        self.connection.get_all_volumes.return_value = [
+            make_volume('vol-1', 'available')]
+        self.assertEqual(self.waiter.poll(), 0)
+        self.connection.get_all_volumes.assert_called_once_with(
+            filters={'volume-id': ['vol-1']})
+
+    def test_failure_state(self):
+        wait = self.waiter.add(make_instance('i-1'), 'running')
+        self.connection.get_only_instances.return_value = [
+            make_instance('i-1', 'terminated')]
+        self.waiter.poll()
+        self.assertTrue(wait.done)
+        with self.assertRaises(WaiterError):
+            wait.result()
+
+    def test_missing_resources(self):
+        running = self.waiter.add(make_instance('i-1'), 'running')
+        deleted = self.waiter.add(make_volume('vol-1', 'deleting'), 'deleted')
+        self.connection.get_only_instances.return_value = []
+        self.connection.get_all_volumes.return_value = []
+        self.assertEqual(self.waiter.poll(), 1)
+        self.assertFalse(running.done)
+        self.assertTrue(deleted.done)
+
+    def test_intermediate_states_before_gone(self):
+        wait = self.waiter.add(make_instance('i-1', 'running'), 'terminated')
+        self.connection.get_only_instances.return_value = [
+            make_instance('i-1', 'shutting-down')]
+        self.waiter.poll()
+        self.assertFalse(wait.done)
+
+    def test_callback(self):
+        callback = mock.Mock()
+        wait = self.waiter.add(make_volume('vol-1'), 'available', callback)
+        self.connection.get_all_volumes.return_value = [
+            make_volume('vol-1', 'available')]
+        self.waiter.poll()
+        callback.assert_called_once_with(wait)
+
+    def test_unknown_resource(self):
+        with self.assertRaises(TypeError):
+            self.waiter.add(object(), 'running')
+
+    @mock.patch('time.sleep')
+    def test_wait_backs_off(self, sleep_mock):
+        wait = self.waiter.add(make_image('ami-1'), 'available')
+        self.connection.get_all_images.side_effect = (
+            [[make_image('ami-1', 'pending')]] * 4 +
+            [[make_image('ami-1', 'available')]])
+        self.waiter.wait()
+        self.assertEqual([call[0][0] for call in sleep_mock.call_args_list],
+                         [1, 2, 4, 4])
+        self.assertTrue(wait.done)
+
+    @mock.patch('time.sleep')
+    @mock.patch('time.time')
+    def test_wait_timeout(self, time_mock, sleep_mock):
+        time_mock.side_effect = [0, 0, 1, 3, 7]
+        wait = self.waiter.add(make_instance('i-1'), 'running')
+        self.connection.get_only_instances.return_value = [
+            make_instance('i-1')]
+        self.waiter.wait(timeout=5)
+        self.assertEqual(sleep_mock.call_count, 2)
+        self.assertTrue(wait.done)
+        self.assertIsInstance(wait.error, WaiterError)
+        self.assertEqual(self.waiter.pending, [])
+
+
+class TestWaitForState(unittest.TestCase):
+    @mock.patch('time.sleep')
+    def test_wait_for_state(self, sleep_mock):
+        conn = EC2Connection(aws_access_key_id='aws_access_key_id',
+                             aws_secret_access_key='aws_secret_access_key')
+        instances = [make_instance('i-1'), make_instance('i-2')]
+        with mock.patch.object(conn, 'get_only_instances') as describe:
+            describe.side_effect = [
+                [make_instance('i-1', 'running'), make_instance('i-2')],
+                [make_instance('i-2', 'running')],
+            ]
+            result = conn.wait_for_state(instances, 'running')
+        self.assertEqual(result, instances)
+        self.assertEqual(describe.call_count, 2)
+        self.assertEqual(instances[1].state, 'running')
+
+    @mock.patch('time.sleep')
+    def test_wait_for_state_failure(self, sleep_mock):
+        conn = EC2Connection(aws_access_key_id='aws_access_key_id',
+                             aws_secret_access_key='aws_secret_access_key')
+        with mock.patch.object(conn, 'get_all_volumes') as describe:
+            describe.return_value = [make_volume('vol-1', 'error')]
+            with self.assertRaises(WaiterError):
+                conn.wait_for_state([make_volume('vol-1')], 'available')
+
+
+if __name__ == '__main__':
+    unittest.main()
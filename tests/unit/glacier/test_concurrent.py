@@ -21,13 +21,15 @@
 # IN THE SOFTWARE.
 #
 import tempfile
-from boto.compat import Queue
+from boto.compat import Queue, BytesIO
 
 from tests.compat import mock, unittest
 from tests.unit import AWSMockServiceTestCase
 
 from boto.glacier.concurrent import ConcurrentUploader, ConcurrentDownloader
 from boto.glacier.concurrent import UploadWorkerThread
+from boto.glacier.concurrent import DownloadWorkerThread
+from boto.glacier.utils import chunk_hashes, tree_hash, bytes_to_hex
 from boto.glacier.concurrent import _END_SENTINEL
 
 
@@ -44,7 +46,8 @@ class FakeThreadedConcurrentUploader(ConcurrentUploader):
 
 
 class FakeThreadedConcurrentDownloader(ConcurrentDownloader):
-    def _start_download_threads(self, results_queue, worker_queue):
+    def _start_download_threads(self, results_queue, worker_queue,
+                                filename):
         self.results_queue = results_queue
         self.worker_queue = worker_queue
 
@@ -114,7 +117,8 @@ class TestConcurrentUploader(unittest.TestCase):
         job = mock.MagicMock()
         job.archive_size = 8 * 1024 * 1024
         downloader = FakeThreadedConcurrentDownloader(job)
-        downloader.download('foofile')
+        with tempfile.NamedTemporaryFile() as f:
+            downloader.download(f.name)
         q = downloader.worker_queue
         items = [q.get() for i in range(q.qsize())]
         self.assertEqual(items[0], (0, 4 * 1024 * 1024))
@@ -175,5 +179,53 @@ class TestUploaderThread(unittest.TestCase):
         self.assertEqual(api.upload_part.call_count, 3)
 
 
+class TestDownloaderThread(unittest.TestCase):
+    def setUp(self):
+        self.fileobj = tempfile.NamedTemporaryFile()
+        self.filename = self.fileobj.name
+        self.fileobj.truncate(1024 * 1024 * 3)
+        self.fileobj.flush()
+
+    def tearDown(self):
+        self.fileobj.close()
+
+    def create_response(self, data):
+        body = mock.Mock()
+        body.read.side_effect = BytesIO(data).read
+        body.__getitem__ = mock.Mock(
+            return_value=bytes_to_hex(tree_hash(chunk_hashes(data))))
+        return body
+
+    def test_part_is_written_to_its_offset(self):
+        data = b'a' * (1024 * 1024 + 10)
+        job = mock.Mock()
+        job.get_output.return_value = self.create_response(data)
+        result_queue = Queue()
+        job_queue = Queue()
+        thread = DownloadWorkerThread(job, job_queue, result_queue,
+                                      self.filename)
+        job_queue.put((1, 1024 * 1024 * 2))
+        job_queue.put(_END_SENTINEL)
+
+        thread.run()
+        part_number, part_size, part_hash = result_queue.get(timeout=1)
+        self.assertEqual(part_number, 1)
+        self.assertEqual(part_hash, tree_hash(chunk_hashes(data)))
+        job.get_output.assert_called_with(
+            (1024 * 1024 * 2, 1024 * 1024 * 4 - 1))
+        with open(self.filename, 'rb') as f:
+            f.seek(1024 * 1024 * 2)
+            self.assertEqual(f.read(), data)
+
+    def test_fileobj_closed_when_thread_shuts_down(self):
+        thread = DownloadWorkerThread(mock.Mock(), Queue(), Queue(),
+                                      self.filename)
+        fileobj = thread._fileobj
+        self.assertFalse(fileobj.closed)
+        thread.should_continue = False
+        thread.run()
+        self.assertTrue(fileobj.closed)
+
+
 if __name__ == '__main__':
     unittest.main()
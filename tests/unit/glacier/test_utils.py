@@ -24,11 +24,12 @@ import os
 import tempfile
 import time
 from hashlib import sha256
+from tests.compat import mock
 from tests.unit import unittest
 
 from boto.compat import BytesIO, six, StringIO
 from boto.glacier.utils import minimum_part_size, chunk_hashes, tree_hash, \
-        bytes_to_hex, compute_hashes_from_fileobj
+        bytes_to_hex, compute_hashes_from_fileobj, compute_hashes_from_filename
 
 
 class TestPartSizeCalculations(unittest.TestCase):
@@ -81,6 +82,16 @@ class TestChunking(unittest.TestCase):
         self.assertEqual(len(chunks), 1)
         self.assertEqual(chunks[0], sha256(b'aaaa').digest())
 
+    def test_chunk_hashes_with_threads(self):
+        bytestring = os.urandom(5 * 1024 + 20)
+        self.assertEqual(chunk_hashes(bytestring, 1024, num_threads=4),
+                         chunk_hashes(bytestring, 1024))
+
+    def test_chunk_hashes_memoryview(self):
+        bytestring = b'a' * (2 * 1024 * 1024 + 20)
+        self.assertEqual(chunk_hashes(memoryview(bytestring)),
+                         chunk_hashes(bytestring))
+
 
 class TestTreeHash(unittest.TestCase):
     # For these tests, a set of reference tree hashes were computed.
@@ -159,6 +170,30 @@ class TestFileHash(unittest.TestCase):
         f = StringIO(self._gen_data())
         compute_hashes_from_fileobj(f, chunk_size=512)
 
+    def test_compute_hash_filename(self):
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(os.urandom(5 * 1024 + 20))
+            f.flush()
+            f.seek(0)
+            self.assertEqual(
+                compute_hashes_from_filename(f.name, chunk_size=512,
+                                             num_threads=3),
+                compute_hashes_from_fileobj(f, chunk_size=512))
+
+    def test_compute_hash_filename_error_is_not_masked(self):
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(os.urandom(1024))
+            f.flush()
+            with mock.patch('boto.glacier.utils.chunk_hashes',
+                            side_effect=ValueError('boom')):
+                with self.assertRaisesRegexp(ValueError, 'boom'):
+                    compute_hashes_from_filename(f.name)
+
+    def test_compute_hash_empty_filename(self):
+        with tempfile.NamedTemporaryFile() as f:
+            self.assertEqual(compute_hashes_from_filename(f.name),
+                             compute_hashes_from_fileobj(f))
+
     def test_compute_hash_bytesio(self):
         # Compute a hash from a file-like BytesIO object.
         f = BytesIO(self._gen_data())
@@ -44,7 +44,7 @@ class TestVault(unittest.TestCase):
     def tearDown(self):
         self.size_patch.stop()
 
-    @mock.patch('boto.glacier.vault.compute_hashes_from_fileobj',
+    @mock.patch('boto.glacier.vault.compute_hashes_from_filename',
                 return_value=[b'abc', b'123'])
     def test_upload_archive_small_file(self, compute_hashes):
         self.getsize.return_value = 1
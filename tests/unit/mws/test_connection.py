@@ -20,10 +20,16 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 #
+import threading
+
 from boto.mws.connection import MWSConnection, api_call_map, destructure_object
+from boto.mws.connection import content_md5
+from boto.mws.connection import _NextTokenFetch
+from boto.mws.quota import QuotaScheduler
 from boto.mws.response import (ResponseElement, GetFeedSubmissionListResult,
                                ResponseFactory)
 from boto.exception import BotoServerError
+from boto.compat import BytesIO
 
 from tests.compat import unittest
 
@@ -193,6 +199,121 @@ doc/2009-01-01/">
             self.assertTrue('throttled' in str(err.reason))
             self.assertEqual(int(err.status), 200)
             
+    def feed_submission_list_response(self, token, has_next):
+        body = self.default_body().replace(
+            b'2YgYW55IGNhcm5hbCBwbGVhc3VyZS4=', token).replace(
+            b'<HasNext>true', b'<HasNext>' + has_next)
+        if token != b'2YgYW55IGNhcm5hbCBwbGVhc3VyZS4=':
+            body = body.replace(b'GetFeedSubmissionList',
+                                b'GetFeedSubmissionListByNextToken')
+        return self.create_response(200, header=[('Content-Type', 'text/xml')],
+                                    body=body)
+
+    def check_iter_call(self, prefetch):
+        self.service_connection.Merchant = '1234'
+        self.https_connection.getresponse.side_effect = [
+            self.feed_submission_list_response(
+                b'2YgYW55IGNhcm5hbCBwbGVhc3VyZS4=', b'true'),
+            self.feed_submission_list_response(b'token2', b'true'),
+            self.feed_submission_list_response(b'token3', b'false'),
+        ]
+        responses = list(self.service_connection.iter_call(
+            'GetFeedSubmissionList', prefetch=prefetch))
+        self.assertEqual([r._action for r in responses],
+                         ['GetFeedSubmissionList'] +
+                         ['GetFeedSubmissionListByNextToken'] * 2)
+        self.assertEqual(responses[-1]._result.NextToken, 'token3')
+        self.assert_request_parameters({
+            'Action': 'GetFeedSubmissionListByNextToken',
+            'NextToken': 'token2',
+            'Merchant': '1234',
+        }, ignore_params_values=['AWSAccessKeyId', 'SignatureMethod',
+                                 'SignatureVersion', 'Timestamp', 'Version'])
+
+    def test_iter_call(self):
+        self.check_iter_call(prefetch=False)
+
+    def test_iter_call_prefetches(self):
+        self.check_iter_call(prefetch=True)
+
+    def test_iter_call_prefetch_error(self):
+        self.service_connection.Merchant = '1234'
+        self.https_connection.getresponse.side_effect = [
+            self.feed_submission_list_response(
+                b'2YgYW55IGNhcm5hbCBwbGVhc3VyZS4=', b'true'),
+            self.create_response(400, body=self.default_body_error()),
+        ]
+        responses = self.service_connection.iter_call(
+            'GetFeedSubmissionList')
+        next(responses)
+        with self.assertRaises(BotoServerError):
+            next(responses)
+
+    def test_iter_call_early_break_cancels_prefetch(self):
+        scheduler = MagicMock(spec=QuotaScheduler)
+        # The next page would have to wait a minute for quota.
+        scheduler.wait_time.return_value = 60.0
+        self.service_connection.quota_scheduler = scheduler
+        self.service_connection.Merchant = '1234'
+        self.https_connection.getresponse.side_effect = [
+            self.feed_submission_list_response(
+                b'2YgYW55IGNhcm5hbCBwbGVhc3VyZS4=', b'true'),
+        ]
+        responses = self.service_connection.iter_call(
+            'GetFeedSubmissionList')
+        for response in responses:
+            break
+        responses.close()
+        scheduler.wait_time.assert_called_once_with(
+            '1234', 'GetFeedSubmissionListByNextToken', 0, 0.0)
+        self.assertEqual(scheduler.acquire.call_count, 1)
+        self.assertEqual(self.https_connection.getresponse.call_count, 1)
+        self.assertFalse([thread for thread in threading.enumerate()
+                          if isinstance(thread, _NextTokenFetch)])
+
+    def test_next_token_without_has_next(self):
+        connection = self.service_connection
+        result = ResponseElement()
+        result.NextToken = 'token'
+        self.assertEqual(connection._next_token(result), 'token')
+        result.HasNext = 'false'
+        self.assertEqual(connection._next_token(result), None)
+        self.assertEqual(connection._next_token(ResponseElement()), None)
+
+    def report_response(self, chunks, digest):
+        body = b''.join(chunks)
+        response = self.create_response(200, header=[
+            ('Content-Type', 'text/plain'),
+            ('Content-MD5', digest or content_md5(body).decode('utf-8'))])
+        response.read.side_effect = list(chunks) + [b'']
+        return response
+
+    def test_get_report_to_file(self):
+        chunks = [b'order-id\tsku\n', b'1\tA\n', b'2\tB\n']
+        self.https_connection.getresponse.return_value = \
+            self.report_response(chunks, None)
+        fp = BytesIO()
+        size = self.service_connection.get_report(ReportId='42',
+                                                  Merchant='1234', fp=fp)
+        self.assertEqual(size, len(b''.join(chunks)))
+        self.assertEqual(fp.getvalue(), b''.join(chunks))
+        self.assertNotIn('fp', self.actual_request.params)
+
+    def test_get_report_to_file_bad_digest(self):
+        self.https_connection.getresponse.return_value = \
+            self.report_response([b'a', b'b'], 'bm90IHRoZSBkaWdlc3Q=')
+        with self.assertRaises(AssertionError):
+            self.service_connection.get_report(ReportId='42', Merchant='1234',
+                                               fp=BytesIO())
+
+    def test_get_report(self):
+        body = b'order-id\tsku\n'
+        self.set_http_response(200, header=[
+            ('Content-Type', 'text/plain'),
+            ('Content-MD5', content_md5(body).decode('utf-8'))], body=body)
+        self.assertEqual(self.service_connection.get_report(
+            ReportId='42', Merchant='1234'), body)
+
     def test_sandboxify(self):
         # Create one-off connection class that has self._sandboxed = True
         conn = MWSConnection(https_connection_factory=self.https_connection_factory,
@@ -0,0 +1,184 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+from tests.compat import mock, unittest
+from tests.unit import AWSMockServiceTestCase
+
+from boto.exception import BotoServerError
+from boto.mws.connection import MWSConnection
+from boto.mws.quota import QuotaBucket, QuotaScheduler
+
+
+THROTTLED = b"""<?xml version="1.0"?>
+<ErrorResponse xmlns="http://mws.amazonaws.com/doc/2009-01-01/">
+  <Error>
+    <Type>Sender</Type>
+    <Code>RequestThrottled</Code>
+    <Message>Request is throttled</Message>
+  </Error>
+  <RequestID>6e7ad2fa-0d8a-4c2c-a6d6-EXAMPLE</RequestID>
+</ErrorResponse>"""
+
+INTERNAL_ERROR = b"""<?xml version="1.0"?>
+<ErrorResponse xmlns="http://mws.amazonaws.com/doc/2009-01-01/">
+  <Error>
+    <Type>Receiver</Type>
+    <Code>InternalError</Code>
+    <Message>We encountered an internal error</Message>
+  </Error>
+  <RequestID>6e7ad2fa-0d8a-4c2c-a6d6-EXAMPLE</RequestID>
+</ErrorResponse>"""
+
+
+class TestQuotaBucket(unittest.TestCase):
+    def test_burst_then_restore_rate(self):
+        bucket = QuotaBucket(quota=2, restore=10, now=0)
+        self.assertEqual(bucket.reserve(0), 0)
+        self.assertEqual(bucket.reserve(0), 0)
+        self.assertEqual(bucket.reserve(0), 10)
+        self.assertEqual(bucket.reserve(0), 20)
+        # Tokens are restored from the debt first.
+        self.assertEqual(bucket.reserve(25), 5)
+        self.assertEqual(bucket.reserve(100), 0)
+
+    def test_never_above_quota(self):
+        bucket = QuotaBucket(quota=1, restore=1, now=0)
+        self.assertEqual(bucket.reserve(1000), 0)
+        self.assertEqual(bucket.reserve(1000), 1)
+
+    def test_drain(self):
+        bucket = QuotaBucket(quota=5, restore=2, now=0)
+        bucket.drain(0)
+        self.assertEqual(bucket.reserve(0), 2)
+
+    def test_wait_time(self):
+        bucket = QuotaBucket(quota=1, restore=10, now=0)
+        self.assertEqual(bucket.wait_time(0), 0)
+        bucket.reserve(0)
+        self.assertEqual(bucket.wait_time(4), 6)
+        # Looking doesn't take the token.
+        self.assertEqual(bucket.wait_time(4), 6)
+        self.assertEqual(bucket.reserve(10), 0)
+
+
+class TestQuotaScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = QuotaScheduler()
+
+    @mock.patch('time.sleep')
+    @mock.patch('time.time', return_value=0)
+    def test_acquire(self, time_mock, sleep_mock):
+        for _ in range(3):
+            self.scheduler.acquire('A1', 'ListOrders', 2, 60)
+        self.scheduler.acquire('A2', 'ListOrders', 2, 60)
+        self.scheduler.acquire('A1', 'GetOrder', 6, 60)
+        sleep_mock.assert_called_once_with(60)
+        self.assertEqual(self.scheduler.stats[('A1', 'ListOrders')], {
+            'calls': 3, 'delayed': 1, 'wait_time': 60, 'throttled': 0})
+        self.assertEqual(self.scheduler.stats[('A2', 'ListOrders')]['delayed'],
+                         0)
+
+    @mock.patch('time.time', return_value=0)
+    def test_unthrottled_actions(self, time_mock):
+        for _ in range(10):
+            self.assertEqual(self.scheduler.delay(
+                'A1', 'GetReportListByNextToken', 0, 0), 0)
+
+    @mock.patch('time.time', return_value=0)
+    def test_throttled(self, time_mock):
+        self.scheduler.delay('A1', 'ListOrders', 6, 60)
+        self.scheduler.throttled('A1', 'ListOrders')
+        self.assertEqual(self.scheduler.delay('A1', 'ListOrders', 6, 60), 60)
+        self.assertEqual(
+            self.scheduler.stats[('A1', 'ListOrders')]['throttled'], 1)
+
+
+class TestMWSConnectionQuota(AWSMockServiceTestCase):
+    connection_class = MWSConnection
+    mws = True
+
+    def setUp(self):
+        super(TestMWSConnectionQuota, self).setUp()
+        self.scheduler = mock.Mock(spec=QuotaScheduler)
+        self.service_connection.quota_scheduler = self.scheduler
+
+    def test_calls_wait_for_quota(self):
+        self.set_http_response(
+            status_code=200, header=[('Content-Type', 'text/xml')],
+            body=b"""<?xml version="1.0"?>
+<GetServiceStatusResponse xmlns="https://mws.amazonservices.com/Orders/2013-09-01">
+  <GetServiceStatusResult><Status>GREEN</Status></GetServiceStatusResult>
+</GetServiceStatusResponse>""")
+        self.service_connection.get_orders_service_status(SellerId='A1')
+        self.scheduler.acquire.assert_called_once_with(
+            'A1', 'GetServiceStatus', 2, 300.0)
+
+    def list_orders(self):
+        return self.service_connection.list_orders(
+            SellerId='A1', MarketplaceId=['ATVPDKIKX0DER'],
+            CreatedAfter='2014-01-01T00:00:00Z')
+
+    @mock.patch('time.sleep')
+    def test_throttled_calls_wait_for_quota(self, sleep_mock):
+        self.scheduler.delay.return_value = 10.0
+        throttled = self.create_response(503, 'Service Unavailable',
+                                          body=THROTTLED)
+        self.https_connection.getresponse.side_effect = [
+            throttled, throttled,
+            self.create_response(200, header=[('Content-Type', 'text/xml')],
+                                 body=b"""<?xml version="1.0"?>
+<ListOrdersResponse xmlns="https://mws.amazonservices.com/Orders/2013-09-01">
+  <ListOrdersResult><Orders/></ListOrdersResult>
+</ListOrdersResponse>""")]
+        response = self.list_orders()
+        self.assertEqual(response._action, 'ListOrders')
+        self.assertEqual(self.scheduler.throttled.call_args_list,
+                         [mock.call('A1', 'ListOrders')] * 2)
+        self.assertEqual(self.scheduler.delay.call_args_list,
+                         [mock.call('A1', 'ListOrders', 6, 60)] * 2)
+        self.assertEqual(sleep_mock.call_args_list, [mock.call(10.0)] * 2)
+
+    @mock.patch('time.sleep')
+    def test_throttled_calls_are_reported(self, sleep_mock):
+        self.scheduler.delay.return_value = 10.0
+        self.service_connection.num_retries = 1
+        self.set_http_response(503, 'Service Unavailable', body=THROTTLED)
+        with self.assertRaises(BotoServerError) as cm:
+            self.list_orders()
+        self.assertEqual(cm.exception.error_code, 'RequestThrottled')
+        self.assertEqual(self.https_connection.getresponse.call_count, 2)
+        self.assertEqual(self.scheduler.throttled.call_count, 2)
+        self.assertEqual(self.scheduler.delay.call_count, 1)
+
+    @mock.patch('time.sleep')
+    def test_other_server_errors_are_retried(self, sleep_mock):
+        self.service_connection.num_retries = 1
+        self.set_http_response(500, 'Internal Server Error',
+                               body=INTERNAL_ERROR)
+        with self.assertRaises(BotoServerError) as cm:
+            self.list_orders()
+        self.assertEqual(cm.exception.error_code, 'InternalError')
+        self.assertEqual(self.https_connection.getresponse.call_count, 2)
+        self.assertFalse(self.scheduler.throttled.called)
+        self.assertFalse(self.scheduler.delay.called)
+
+if __name__ == '__main__':
+    unittest.main()
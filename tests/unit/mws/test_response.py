@@ -218,6 +218,48 @@ class TestMWSResponse(AWSMockServiceTestCase):
         obj = self.check_issue(Test3Result, text)
         self.assertSequenceEqual(obj._result.Item, ['Bar', 'Bif', 'Baz'])
 
+    def test_response_classes_are_reused(self):
+        class Test10Result(ResponseElement):
+            Item = SimpleList()
+            Nest = Element(Zip=SimpleList())
+
+        factory = ResponseFactory(scopes=[{'Test10Result': Test10Result}])
+        text = b"""<Test10Response><Test10Result>
+            <Item>%s</Item><Nest><Zip>%s</Zip></Nest>
+        </Test10Result></Test10Response>"""
+        parsed = []
+        for value in (b'Bar', b'Baz'):
+            parser = factory('Test10', connection=self.service_connection)
+            parsed.append(self.service_connection._parse_response(
+                parser, 'text/xml', text % (value, value)))
+        first, second = parsed
+        self.assertIs(first.__class__, second.__class__)
+        self.assertIs(first._result.Nest.__class__,
+                      second._result.Nest.__class__)
+        self.assertEqual(first._result.Item, ['Bar'])
+        self.assertEqual(first._result.Nest.Zip, ['Bar'])
+        self.assertEqual(second._result.Item, ['Baz'])
+        self.assertEqual(second._result.Nest.Zip, ['Baz'])
+        self.assertEqual(Test10Result.Item._value, [])
+
+        factory.clear()
+        parser = factory('Test10', connection=self.service_connection)
+        self.assertIsNot(parser.__class__, first.__class__)
+
+    def test_declarations_are_looked_up_once(self):
+        class Test11Result(ResponseElement):
+            Item = SimpleList()
+
+        class Test11Subclass(Test11Result):
+            Extra = Element()
+
+        self.assertEqual(sorted(dict(Test11Subclass._declarations())),
+                         ['Extra', 'Item'])
+        self.assertIs(Test11Subclass._declarations(),
+                      Test11Subclass._declarations())
+        self.assertEqual(dict(Test11Result._declarations()),
+                         {'Item': Test11Result.Item})
+
     def check_issue(self, klass, text):
         action = klass.__name__[:-len('Result')]
         factory = ResponseFactory(scopes=[{klass.__name__: klass}])
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 from tests.compat import mock, unittest
 import os
+import pickle
 
 from boto import provider
 from boto.compat import expanduser
@@ -404,6 +405,149 @@ class TestProvider(unittest.TestCase):
         self.assertEqual(p.secret_key, 'second_secret_key')
         self.assertEqual(p.security_token, 'second_token')
 
+    def _expiring_instance_config(self, seconds, prefix):
+        expiration = (datetime.utcnow() + timedelta(seconds=seconds))
+        return {
+            'allowall': {
+                u'AccessKeyId': prefix + u'_access_key',
+                u'Code': u'Success',
+                u'Expiration': expiration.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                u'LastUpdated': u'2012-08-31T21:43:40Z',
+                u'SecretAccessKey': prefix + u'_secret_key',
+                u'Token': prefix + u'_token',
+                u'Type': u'AWS-HMAC'
+            }
+        }
+
+    def test_refresh_credentials_fetches_once(self):
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(10, u'first')
+        p = provider.Provider('aws')
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(3600, u'second')
+        self.get_instance_metadata.reset_mock()
+
+        self.assertEqual(p.access_key, 'second_access_key')
+        self.assertEqual(p.secret_key, 'second_secret_key')
+        self.assertEqual(p.security_token, 'second_token')
+        self.assertEqual(self.get_instance_metadata.call_count, 1)
+
+    def test_refresher_does_not_block_unexpired_credentials(self):
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(60, u'first')
+        p = provider.Provider('aws')
+        p._credential_refresher = mock.Mock()
+        p._credential_refresher.is_alive.return_value = True
+        self.get_instance_metadata.reset_mock()
+
+        # The credentials are within the foreground refresh window, but
+        # have not expired, so they are left to the refresher.
+        self.assertEqual(p.access_key, 'first_access_key')
+        self.assertFalse(self.get_instance_metadata.called)
+
+        # Once they have expired, the request refreshes them itself.
+        p._credential_expiry_time = datetime.utcnow() - timedelta(seconds=1)
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(3600, u'second')
+        self.assertEqual(p.access_key, 'second_access_key')
+        self.assertEqual(self.get_instance_metadata.call_count, 1)
+
+    def test_credential_refresher_renews_before_expiry(self):
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(600, u'first')
+        p = provider.Provider('aws')
+        renewed = self._expiring_instance_config(3600, u'second')
+        self.get_instance_metadata.return_value = renewed
+
+        refresher = provider.CredentialRefresher(p, lead_time=900,
+                                                 interval=0.01)
+        refresher._stopped = mock.Mock()
+        # Event.wait() returns None on Python 2.6, so the loop checks the
+        # flag itself. Run a single iteration of the loop.
+        refresher._stopped.wait.return_value = None
+        refresher._stopped.is_set.side_effect = [False, True]
+        refresher.run()
+
+        # The keys and token are swapped together, as one tuple.
+        self.assertEqual(p._credentials, ('second_access_key',
+                                          'second_secret_key',
+                                          'second_token'))
+        self.assertEqual(p.access_key, 'second_access_key')
+        self.assertEqual(p.secret_key, 'second_secret_key')
+        self.assertEqual(p.security_token, 'second_token')
+
+    def test_credential_refresher_waits_until_lead_time(self):
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(3600, u'first')
+        p = provider.Provider('aws')
+        self.get_instance_metadata.reset_mock()
+
+        refresher = provider.CredentialRefresher(p, lead_time=900,
+                                                 interval=0.01)
+        refresher._stopped = mock.Mock()
+        refresher._stopped.is_set.side_effect = [False, True]
+        refresher.run()
+
+        self.assertFalse(self.get_instance_metadata.called)
+        self.assertEqual(p.access_key, 'first_access_key')
+
+    def test_credential_refresher_survives_errors(self):
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(600, u'first')
+        p = provider.Provider('aws')
+        self.get_instance_metadata.side_effect = [
+            Exception('metadata service unavailable'),
+            self._expiring_instance_config(3600, u'second'),
+        ]
+
+        refresher = provider.CredentialRefresher(p, lead_time=900,
+                                                 interval=0.01)
+        refresher._stopped = mock.Mock()
+        refresher._stopped.is_set.side_effect = [False, False, True]
+        refresher.run()
+
+        self.assertEqual(p.access_key, 'second_access_key')
+
+    def test_start_and_stop_credential_refresher(self):
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(3600, u'first')
+        p = provider.Provider('aws')
+        p.start_credential_refresher(interval=0.01)
+        refresher = p._credential_refresher
+        self.assertTrue(refresher.is_alive())
+        self.assertTrue(refresher.daemon)
+
+        # Starting it again reuses the running thread.
+        p.start_credential_refresher(interval=0.01)
+        self.assertIs(p._credential_refresher, refresher)
+
+        p.stop_credential_refresher()
+        refresher.join(1)
+        self.assertFalse(refresher.is_alive())
+        self.assertIsNone(p._credential_refresher)
+
+    def test_background_credential_refresh_config(self):
+        self.config = {
+            'Boto': {'background_credential_refresh': 'true'}
+        }
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(3600, u'first')
+        with mock.patch.object(provider.Provider,
+                               'start_credential_refresher') as start:
+            provider.Provider('aws')
+        start.assert_called_once_with()
+
+    def test_pickle_with_credential_refresher(self):
+        self.get_instance_metadata.return_value = \
+            self._expiring_instance_config(3600, u'first')
+        p = provider.Provider('aws')
+        p.start_credential_refresher(interval=0.01)
+        self.addCleanup(p.stop_credential_refresher)
+
+        unpickled = pickle.loads(pickle.dumps(p))
+        self.assertEqual(unpickled.access_key, 'first_access_key')
+        self.assertIsNone(unpickled._credential_refresher)
+
     @mock.patch('boto.provider.config.getint')
     @mock.patch('boto.provider.config.getfloat')
     def test_metadata_config_params(self, config_float, config_int):
@@ -29,6 +29,7 @@ from boto.route53.exception import DNSServerError
 from boto.route53.healthcheck import HealthCheck
 from boto.route53.record import ResourceRecordSets, Record
 from boto.route53.zone import Zone
+from boto.retry import RetryPolicy, RetryRule
 
 from nose.plugins.attrib import attr
 from tests.unit import AWSMockServiceTestCase
@@ -101,6 +102,17 @@ class TestRoute53Connection(AWSMockServiceTestCase):
         # Unpatch.
         self.service_connection._retry_handler = orig_retry
 
+    def test_throttling_backoff_survives_set_retry_policy(self):
+        conn = self.service_connection
+        self.assertEqual(conn.retry_policy.rule('throttling').base_delay, 1.0)
+        conn.set_retry_policy(RetryPolicy())
+        self.assertEqual(conn.retry_policy.rule('throttling').base_delay, 1.0)
+
+        # A rule given to the policy itself is kept.
+        rule = RetryRule(base_delay=2.0)
+        conn.set_retry_policy(RetryPolicy(rules={'throttling': rule}))
+        self.assertIs(conn.retry_policy.rule('throttling'), rule)
+
     def test_private_zone_invalid_vpc_400(self):
         self.set_http_response(status_code=400, header=[
             ['Code', 'InvalidVPCId'],
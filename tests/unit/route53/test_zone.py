@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 #
+from boto.route53.record import Record
 from boto.route53.zone import Zone
 from tests.compat import mock, unittest
 
@@ -59,5 +60,57 @@ class TestZone(unittest.TestCase):
         self.assertEqual(result_rrs, [mock_rrs[0], mock_rrs[1]])
 
 
+class TestZoneRecordCache(unittest.TestCase):
+    def setUp(self):
+        self.connection = mock.Mock()
+        self.connection._make_qualified.side_effect = (
+            lambda name: name if name.endswith('.') else name + '.')
+        self.connection.change_rrsets.return_value = {
+            'ChangeResourceRecordSetsResponse': {
+                'ChangeInfo': {'Id': '/change/1', 'Status': 'PENDING'}}}
+        self.zone = Zone(self.connection, {'Id': '/hostedzone/Z1',
+                                           'Name': 'example.com.'})
+        self.connection.get_all_rrsets.return_value = [
+            Record('a.example.com.', 'A', resource_records=['10.0.0.1']),
+            Record('b.example.com.', 'A', resource_records=['10.0.0.2'],
+                   identifier='one', region='us-east-1'),
+            Record('b.example.com.', 'A', resource_records=['10.0.0.3'],
+                   identifier='two', region='us-west-2'),
+        ]
+        self.zone.cache_records()
+        self.connection.get_all_rrsets.reset_mock()
+
+    def test_lookups_use_cache(self):
+        record = self.zone.get_a('a.example.com')
+        self.assertEqual(record.resource_records, ['10.0.0.1'])
+        records = self.zone.find_records('b.example.com', 'A', all=True)
+        self.assertEqual(len(records), 2)
+        record = self.zone.find_records('b.example.com', 'A',
+                                        identifier=('two', 'us-west-2'))
+        self.assertEqual(record.resource_records, ['10.0.0.3'])
+        self.assertIsNone(self.zone.get_cname('a.example.com'))
+        self.assertFalse(self.connection.get_all_rrsets.called)
+
+    def test_committed_changes_update_cache(self):
+        self.zone.add_a('c.example.com', '10.0.0.4')
+        self.assertEqual(self.zone.get_a('c.example.com').resource_records,
+                         ['10.0.0.4'])
+
+        self.zone.update_a('a.example.com', '10.0.0.5')
+        self.assertEqual(self.zone.get_a('a.example.com').resource_records,
+                         ['10.0.0.5'])
+
+        self.zone.delete_a('b.example.com', identifier=('one', 'us-east-1'))
+        records = self.zone.find_records('b.example.com', 'A', all=True)
+        self.assertEqual(records.resource_records, ['10.0.0.3'])
+        self.assertFalse(self.connection.get_all_rrsets.called)
+
+    def test_clear_record_cache(self):
+        self.zone.clear_record_cache()
+        self.connection.get_all_rrsets.return_value = []
+        self.assertIsNone(self.zone.get_a('a.example.com'))
+        self.assertTrue(self.connection.get_all_rrsets.called)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -326,6 +326,61 @@ class TestSigV4Presigned(MockServiceWithConfigTestCase):
         self.assertIn('response-content-disposition', url)
 
 
+class TestBulkPresigned(MockServiceWithConfigTestCase):
+    connection_class = S3Connection
+
+    keys = ['test.txt', 'dir/with space.txt', u'unicod\u00e9.txt']
+
+    def test_sigv2_urls_match_generate_url(self):
+        conn = self.connection_class(
+            aws_access_key_id='less',
+            aws_secret_access_key='more',
+            host='s3.amazonaws.com'
+        )
+        response_headers = {'response-content-type': 'text/plain'}
+        urls = list(conn.generate_urls(
+            1400000000, 'GET', 'examplebucket', self.keys,
+            response_headers=response_headers, expires_in_absolute=True))
+        expected = [conn.generate_url(1400000000, 'GET', bucket='examplebucket',
+                                      key=key, expires_in_absolute=True,
+                                      response_headers=response_headers)
+                    for key in self.keys]
+        self.assertEqual(urls, expected)
+
+    def test_sigv4_urls_match_generate_url_sigv4(self):
+        self.config = {
+            's3': {
+                'use-sigv4': True,
+            }
+        }
+        conn = self.connection_class(
+            aws_access_key_id='less',
+            aws_secret_access_key='more',
+            host='s3.amazonaws.com'
+        )
+        urls = list(conn.generate_urls(86400, 'GET', 'examplebucket',
+                                       self.keys,
+                                       iso_date='20140625T000000Z'))
+        expected = [conn.generate_url_sigv4(86400, 'GET',
+                                            bucket='examplebucket', key=key,
+                                            iso_date='20140625T000000Z')
+                    for key in self.keys]
+        self.assertEqual(urls, expected)
+        self.assertIn(
+            'a937f5fbc125d98ac8f04c49e0204ea1526a7b8ca058000a54c192457be05b7d',
+            urls[0])
+
+    def test_anon_urls_are_not_signed(self):
+        conn = self.connection_class(
+            anon=True,
+            host='s3.amazonaws.com'
+        )
+        urls = list(conn.generate_urls(0, 'GET', 'examplebucket', self.keys))
+        self.assertEqual(len(urls), 3)
+        for url in urls:
+            self.assertNotIn('Signature=', url)
+
+
 class TestUnicodeCallingFormat(AWSMockServiceTestCase):
     connection_class = S3Connection
 
@@ -0,0 +1,79 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+import threading
+import time
+
+from tests.compat import mock, unittest
+
+from boto.exception import SDBResponseError
+from boto.sdb.connection import SDBConnection
+from boto.sdb.domain import Domain
+from boto.sdb.item import Item
+
+
+class TestGetItems(unittest.TestCase):
+    def setUp(self):
+        self.conn = SDBConnection(aws_access_key_id='aws_access_key_id',
+                                  aws_secret_access_key='secret')
+        self.domain = Domain(self.conn, 'mydomain')
+        self.lock = threading.Lock()
+        self.running = 0
+        self.most_running = 0
+
+    def get_attributes(self, domain, item_name, attribute_names,
+                       consistent_read):
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        if item_name == 'missing':
+            raise SDBResponseError(400, 'Bad Request')
+        item = Item(domain, item_name)
+        item['consistent'] = consistent_read
+        return item
+
+    def test_items_in_order(self):
+        names = ['item%d' % i for i in range(20)]
+        with mock.patch.object(self.conn, 'get_attributes',
+                               side_effect=self.get_attributes):
+            items = self.domain.get_items(names, consistent_read=True,
+                                          max_workers=4)
+        self.assertEqual([item.name for item in items], names)
+        self.assertTrue(all(item['consistent'] for item in items))
+        self.assertTrue(all(item.domain is self.domain for item in items))
+        self.assertLessEqual(self.most_running, 4)
+        self.assertGreater(self.most_running, 1)
+
+    def test_error(self):
+        with mock.patch.object(self.conn, 'get_attributes',
+                               side_effect=self.get_attributes):
+            with self.assertRaises(SDBResponseError):
+                self.conn.get_items(self.domain, ['a', 'missing', 'b'])
+
+    def test_no_items(self):
+        self.assertEqual(self.conn.get_items(self.domain, []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
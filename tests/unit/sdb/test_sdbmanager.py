@@ -0,0 +1,87 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+from tests.compat import mock, unittest
+
+from boto.sdb.db.manager.sdbmanager import SDBManager
+from boto.sdb.db.model import Model
+from boto.sdb.item import Item
+
+
+class Referenced(Model):
+    pass
+
+
+def make_item(name, cls=Referenced):
+    item = Item(mock.Mock(), name)
+    item['__type__'] = cls.__name__
+    item['__module__'] = cls.__module__
+    return item
+
+
+class TestBatchedLoading(unittest.TestCase):
+    def setUp(self):
+        self.manager = SDBManager(Referenced, 'mydomain', None, None, None,
+                                  None, None, None, True)
+        self.manager._domain = mock.Mock()
+        self.manager._domain.name = 'mydomain'
+        self.select = self.manager._domain.select
+
+    def test_get_objects(self):
+        self.select.return_value = [make_item('b'), make_item('a')]
+        objs = self.manager.get_objects(Referenced, ['a', 'missing', 'b', 'a'])
+        self.assertEqual([obj and obj.id for obj in objs],
+                         ['a', None, 'b', 'a'])
+        self.assertTrue(objs[0]._loaded)
+        self.select.assert_called_once_with(
+            "select * from `mydomain` where itemName() in "
+            "('a', 'b', 'missing')", consistent_read=False)
+
+    def test_selects_in_batches(self):
+        self.select.return_value = []
+        ids = ["id'%02d" % i for i in range(45)]
+        self.manager.get_objects(Referenced, ids)
+        self.assertEqual(self.select.call_count, 3)
+        query = self.select.call_args_list[0][0][0]
+        self.assertEqual(query.count("'id''"), 20)
+        self.assertIn("'id''19'", query)
+
+    def test_referenced_objects_load_together(self):
+        objs = [Referenced('a'), Referenced('b'), Referenced('c')]
+        self.manager.converter.batch_references(objs + ['not a model'])
+        self.select.return_value = [make_item('a'), make_item('c')]
+        self.manager.load_object(objs[1])
+        self.assertEqual(self.select.call_count, 1)
+        self.assertTrue(all(obj._loaded for obj in objs))
+        self.manager.load_object(objs[0])
+        self.assertEqual(self.select.call_count, 1)
+        self.assertFalse(self.manager._domain.get_attributes.called)
+
+    def test_single_object_loads_alone(self):
+        obj = Referenced('a')
+        self.manager._domain.get_attributes.return_value = make_item('a')
+        self.manager.load_object(obj)
+        self.assertTrue(obj._loaded)
+        self.assertFalse(self.select.called)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+import threading
+
+from tests.compat import mock, unittest
+from tests.unit import AWSMockServiceTestCase
+
+from boto.compat import StringIO, json
+from boto.exception import SDBResponseError
+from boto.sdb.connection import SDBConnection
+from boto.sdb.domain import Domain
+from boto.sdb.item import Item
+from boto.sdb.transfer import DomainLoader, export_domain, load_domain
+
+
+def make_domain(items=()):
+    domain = mock.Mock(spec=Domain(mock.Mock()))
+    domain.name = 'mydomain'
+    domain.select.return_value = list(items)
+    return domain
+
+
+def make_item(domain, name, **attributes):
+    item = Item(domain, name)
+    item.update(attributes)
+    return item
+
+
+class TestExportAndLoad(unittest.TestCase):
+    def setUp(self):
+        self.source = make_domain()
+        self.source.select.return_value = [
+            make_item(self.source, 'a', color=['red', ' blue'], size='1'),
+            make_item(self.source, 'b', text=u'caf\xe9 ]]> '),
+        ]
+
+    def check_round_trip(self, format, expected):
+        fp = StringIO()
+        self.assertEqual(export_domain(self.source, fp, format=format), 2)
+        text = fp.getvalue()
+        fp.seek(0)
+        target = make_domain()
+        loader = load_domain(target, fp, format=format)
+        self.assertEqual(loader.stats['items'], 2)
+        self.assertEqual(loader.stats['batches'], 1)
+        target.batch_put_attributes.assert_called_once_with(expected, True)
+        return text
+
+    def test_jsonl(self):
+        text = self.check_round_trip('jsonl', {
+            'a': {'color': ['red', ' blue'], 'size': ['1']},
+            'b': {'text': [u'caf\xe9 ]]> ']},
+        })
+        line = json.loads(text.splitlines()[0])
+        self.assertEqual(line['name'], 'a')
+
+    def test_xml(self):
+        text = self.check_round_trip('xml', {
+            'a': {'color': ['red', 'blue'], 'size': ['1']},
+            'b': {'text': [u'caf\xe9 ]]>']},
+        })
+        self.assertTrue(text.startswith('<?xml'))
+
+    def test_domain_to_and_from_xml(self):
+        fp = Domain.to_xml(self.source)
+        target = Domain(mock.Mock(), 'target')
+        handler = target.from_xml(fp)
+        self.assertEqual(handler.loader.stats['items'], 2)
+        target.connection.batch_put_attributes.assert_called_once_with(
+            target, mock.ANY, True)
+
+    def test_xml_names_are_escaped(self):
+        source = make_domain()
+        source.name = 'a"b'
+        source.select.return_value = [
+            make_item(source, '<x & "y">', **{'a"<b': 'v'})]
+        fp = StringIO()
+        export_domain(source, fp)
+        text = fp.getvalue()
+        self.assertIn('<Domain id=\'a"b\'>', text)
+        fp.seek(0)
+        target = make_domain()
+        load_domain(target, fp)
+        target.batch_put_attributes.assert_called_once_with(
+            {'<x & "y">': {'a"<b': ['v']}}, True)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export_domain(self.source, StringIO(), format='csv')
+
+
+class TestDomainLoader(unittest.TestCase):
+    def test_batches(self):
+        domain = make_domain()
+        with DomainLoader(domain, max_workers=3, batch_size=25) as loader:
+            for i in range(60):
+                loader.put('item%02d' % i, {'n': str(i)})
+        self.assertEqual(domain.batch_put_attributes.call_count, 3)
+        sizes = sorted(len(call[0][0]) for call in
+                       domain.batch_put_attributes.call_args_list)
+        self.assertEqual(sizes, [10, 25, 25])
+        self.assertEqual(loader.stats['items'], 60)
+        self.assertEqual(loader.failed, [])
+
+    def test_same_item_twice_starts_a_new_batch(self):
+        domain = make_domain()
+        with DomainLoader(domain, max_workers=1) as loader:
+            loader.put('a', {'n': '1'})
+            loader.put('a', {'n': '2'})
+        self.assertEqual(domain.batch_put_attributes.call_count, 2)
+
+    def test_only_rejected_items_fail(self):
+        domain = make_domain()
+        domain.batch_put_attributes.side_effect = SDBResponseError(
+            400, 'Bad Request')
+
+        def put_attributes(item_name, attributes, replace):
+            if item_name == 'bad':
+                raise SDBResponseError(400, 'Bad Request')
+            return True
+        domain.put_attributes.side_effect = put_attributes
+        loader = DomainLoader(domain, max_workers=2)
+        for name in ['a', 'bad', 'c']:
+            loader.put(name, {'n': '1'})
+        stats = loader.close()
+        self.assertEqual(loader.failed, ['bad'])
+        self.assertEqual(stats['items'], 2)
+        self.assertEqual(stats['single_puts'], 3)
+
+    def test_throttled_batch_fails(self):
+        domain = make_domain()
+        error = SDBResponseError(400, 'Bad Request')
+        error.error_code = 'RequestThrottled'
+        domain.batch_put_attributes.side_effect = error
+        loader = DomainLoader(domain, max_workers=1)
+        for name in ['a', 'b']:
+            loader.put(name, {'n': '1'})
+        stats = loader.close()
+        self.assertEqual(sorted(loader.failed), ['a', 'b'])
+        self.assertEqual(stats['single_puts'], 0)
+        self.assertFalse(domain.put_attributes.called)
+
+    def test_put_blocks_when_workers_are_behind(self):
+        domain = make_domain()
+        release = threading.Event()
+        domain.batch_put_attributes.side_effect = \
+            lambda batch, replace: release.wait(5)
+        loader = DomainLoader(domain, max_workers=1, batch_size=1)
+        done = threading.Event()
+
+        def produce():
+            for i in range(10):
+                loader.put('item%d' % i, {'n': '1'})
+            done.set()
+        producer = threading.Thread(target=produce)
+        producer.daemon = True
+        producer.start()
+        # One batch being put and two queued; the producer has to wait.
+        self.assertFalse(done.wait(0.2))
+        release.set()
+        self.assertTrue(done.wait(5))
+        loader.close()
+        self.assertEqual(loader.stats['items'], 10)
+
+
+class TestDomainLoaderServerErrors(AWSMockServiceTestCase):
+    connection_class = SDBConnection
+
+    def default_body(self):
+        return b"""<?xml version="1.0"?>
+            <PutAttributesResponse>
+              <ResponseMetadata>
+                <RequestId>id</RequestId>
+                <BoxUsage>0.0000219907</BoxUsage>
+              </ResponseMetadata>
+            </PutAttributesResponse>"""
+
+    @mock.patch('time.sleep')
+    def test_batch_fails_after_server_errors(self, sleep_mock):
+        self.service_connection.num_retries = 1
+        unavailable = self.create_response(503, 'Service Unavailable',
+                                           body=b'<Error/>')
+        self.https_connection.getresponse.side_effect = [
+            unavailable, unavailable]
+        domain = Domain(self.service_connection, 'mydomain')
+        loader = DomainLoader(domain, max_workers=1)
+        loader.put('a', {'n': '1'})
+        loader.put('b', {'n': '2'})
+        stats = loader.close()
+        # The connection retries the batch once, and the items are not
+        # put one at a time.
+        self.assertEqual(self.https_connection.getresponse.call_count, 2)
+        self.assertEqual(sleep_mock.call_count, 1)
+        self.assertEqual(sorted(loader.failed), ['a', 'b'])
+        self.assertEqual(stats, {'items': 0, 'batches': 0,
+                                 'single_puts': 0})
+        self.assertEqual(self.actual_request.params['Action'],
+                         'BatchPutAttributes')
+
+
+if __name__ == '__main__':
+    unittest.main()
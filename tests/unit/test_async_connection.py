@@ -0,0 +1,258 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+import sys
+
+from tests.compat import mock, unittest
+
+from boto.compat import json
+from boto.connection import AWSQueryConnection
+from boto.dynamodb2.layer1 import DynamoDBConnection
+from boto.exception import BotoClientError
+from boto.kinesis.exceptions import ResourceNotFoundException
+from boto.kinesis.layer1 import KinesisConnection
+from boto.route53.connection import Route53Connection
+from boto.s3.connection import S3Connection, OrdinaryCallingFormat
+
+if sys.version_info >= (3, 5):
+    import asyncio
+else:
+    asyncio = None
+
+
+class StubServer(object):
+    """Answers HTTP requests with canned responses, in order."""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+        self.connections = 0
+
+
+def stub_protocol(server):
+    class StubProtocol(asyncio.Protocol):
+        def connection_made(self, transport):
+            server.connections += 1
+            self.transport = transport
+            self.buffer = b''
+
+        def data_received(self, data):
+            self.buffer += data
+            while b'\r\n\r\n' in self.buffer:
+                head, rest = self.buffer.split(b'\r\n\r\n', 1)
+                lines = head.decode('utf-8').split('\r\n')
+                headers = dict(line.split(': ', 1) for line in lines[1:])
+                length = int(headers.get('Content-Length', 0))
+                if len(rest) < length:
+                    return
+                self.buffer = rest[length:]
+                server.requests.append((lines[0], headers, rest[:length]))
+                self.transport.write(server.responses.pop(0))
+    return StubProtocol
+
+
+def http_response(body=b'', status='200 OK', headers=None):
+    lines = ['HTTP/1.1 %s' % status]
+    headers = headers or {}
+    if 'Transfer-Encoding' not in headers:
+        headers['Content-Length'] = str(len(body))
+    for name, value in headers.items():
+        lines.append('%s: %s' % (name, value))
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8') + body
+
+
+class FakeQueryConnection(AWSQueryConnection):
+    APIVersion = '2012-01-01'
+
+    def _required_auth_capability(self):
+        return ['sign-v2']
+
+
+@unittest.skipIf(asyncio is None, 'asyncio requires Python 3.5 or later')
+class TestAsyncConnection(unittest.TestCase):
+    def setUp(self):
+        from boto.async_connection import AsyncConnection
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.server = StubServer()
+        stub = self.loop.run_until_complete(self.loop.create_server(
+            stub_protocol(self.server), '127.0.0.1', 0))
+        self.addCleanup(stub.close)
+        self.port = stub.sockets[0].getsockname()[1]
+        # Retry immediately.
+        random_patch = mock.patch('random.random', return_value=0)
+        random_patch.start()
+        self.addCleanup(random_patch.stop)
+        self.conn = AsyncConnection(DynamoDBConnection(
+            aws_access_key_id='access_key',
+            aws_secret_access_key='secret_key',
+            host='127.0.0.1', port=self.port, is_secure=False))
+        self.addCleanup(self.conn.close)
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_json_request(self):
+        self.server.responses.append(http_response(b'{"Item": {}}'))
+        result = self.run_async(self.conn.make_json_request(
+            'GetItem', json.dumps({'TableName': 'users'})))
+        self.assertEqual(result, {'Item': {}})
+
+        request_line, headers, body = self.server.requests[0]
+        self.assertEqual(request_line, 'POST / HTTP/1.1')
+        self.assertEqual(headers['X-Amz-Target'],
+                         'DynamoDB_20120810.GetItem')
+        self.assertIn('Signature=', headers['Authorization'])
+        self.assertEqual(json.loads(body.decode('utf-8')),
+                         {'TableName': 'users'})
+
+    def test_json_request_fault(self):
+        from boto.async_connection import AsyncConnection
+        conn = AsyncConnection(KinesisConnection(
+            aws_access_key_id='access_key',
+            aws_secret_access_key='secret_key',
+            host='127.0.0.1', port=self.port, is_secure=False))
+        self.addCleanup(conn.close)
+        self.server.responses.append(http_response(
+            b'{"__type": "ResourceNotFoundException", '
+            b'"message": "Stream not found"}',
+            status='400 Bad Request'))
+        with self.assertRaises(ResourceNotFoundException):
+            self.run_async(conn.make_json_request(
+                'DescribeStream', '{"StreamName": "missing"}'))
+
+    def test_connections_are_reused(self):
+        for i in range(3):
+            self.server.responses.append(http_response(b'{}'))
+            self.run_async(self.conn.make_json_request('ListTables', '{}'))
+        self.assertEqual(self.server.connections, 1)
+
+    def test_concurrent_requests(self):
+        for i in range(10):
+            self.server.responses.append(http_response(b'{}'))
+        results = self.run_async(asyncio.gather(*[
+            self.loop.create_task(
+                self.conn.make_json_request('ListTables', '{}'))
+            for i in range(10)]))
+        self.assertEqual(results, [{}] * 10)
+        self.assertEqual(len(self.server.requests), 10)
+
+    def test_server_errors_are_retried(self):
+        self.server.responses.append(http_response(
+            b'{}', status='503 Service Unavailable'))
+        self.server.responses.append(http_response(b'{"TableNames": []}'))
+        result = self.run_async(
+            self.conn.make_json_request('ListTables', '{}'))
+        self.assertEqual(result, {'TableNames': []})
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_retry_handler_runs_against_connection(self):
+        self.server.responses.append(http_response(
+            b'{"__type": "com.amazonaws.dynamodb.v20120810#'
+            b'ProvisionedThroughputExceededException"}',
+            status='400 Bad Request'))
+        self.server.responses.append(http_response(b'{}'))
+        self.run_async(self.conn.make_json_request('GetItem', '{}'))
+        self.assertEqual(self.conn.connection.throughput_exceeded_events, 1)
+
+    def test_chunked_response(self):
+        self.server.responses.append(http_response(
+            b'5\r\n{"Ite\r\n7\r\nm": {}}\r\n0\r\n\r\n',
+            headers={'Transfer-Encoding': 'chunked'}))
+        result = self.run_async(self.conn.make_json_request('GetItem', '{}'))
+        self.assertEqual(result, {'Item': {}})
+
+    def test_redirect(self):
+        self.server.responses.append(http_response(
+            status='307 Temporary Redirect',
+            headers={'Location': 'http://127.0.0.1:%d/mybucket/mykey'
+                     % self.port}))
+        self.server.responses.append(http_response(b'hello'))
+        conn = self.make_s3_connection()
+        response = self.run_async(conn.make_request('GET', 'mybucket', 'key'))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.read(), b'hello')
+        self.assertEqual(self.server.requests[1][0],
+                         'GET /mybucket/mykey HTTP/1.1')
+
+    def test_s3_put_and_get(self):
+        conn = self.make_s3_connection()
+        self.server.responses.append(http_response(
+            headers={'ETag': '"abc"'}))
+        self.server.responses.append(http_response(b'hello'))
+        response = self.run_async(conn.make_request(
+            'PUT', 'mybucket', 'mykey', data=b'hello'))
+        self.assertEqual(response.getheader('etag'), '"abc"')
+        response = self.run_async(conn.make_request(
+            'GET', 'mybucket', 'mykey'))
+        self.assertEqual(response.read(), b'hello')
+
+        request_line, headers, body = self.server.requests[0]
+        self.assertEqual(request_line, 'PUT /mybucket/mykey HTTP/1.1')
+        self.assertEqual(body, b'hello')
+        self.assertTrue(headers['Authorization'].startswith('AWS access_key:'))
+
+    def test_query_request(self):
+        from boto.async_connection import AsyncConnection
+        conn = AsyncConnection(FakeQueryConnection(
+            aws_access_key_id='access_key',
+            aws_secret_access_key='secret_key',
+            host='127.0.0.1', port=self.port, is_secure=False))
+        self.addCleanup(conn.close)
+        self.server.responses.append(http_response(
+            b'<DeleteQueueResponse><ResponseMetadata><RequestId>1'
+            b'</RequestId></ResponseMetadata></DeleteQueueResponse>'))
+        status = self.run_async(conn.get_status('DeleteQueue', {}, '/queue'))
+        self.assertTrue(status)
+        request_line = self.server.requests[0][0]
+        self.assertTrue(request_line.startswith('GET /queue?'))
+        self.assertIn('Action=DeleteQueue', request_line)
+
+    def test_requests_are_built_by_the_connection(self):
+        # Whatever the connection keeps track of while building a request
+        # stays on it, rather than on a copy.
+        conn = self.make_s3_connection()
+        s3 = conn.connection
+        self.server.responses.append(http_response(b'hello'))
+        with mock.patch.object(s3, 'build_request',
+                               wraps=s3.build_request) as build_request:
+            self.run_async(conn.make_request('GET', 'mybucket', 'mykey'))
+        build_request.assert_called_once_with('GET', 'mybucket', 'mykey')
+
+    def test_make_request_without_build_request(self):
+        from boto.async_connection import AsyncConnection
+        conn = AsyncConnection(Route53Connection('access_key', 'secret_key'))
+        self.addCleanup(conn.close)
+        with self.assertRaises(BotoClientError):
+            self.run_async(conn.make_request('GET', '/2013-04-01/hostedzone'))
+        self.assertEqual(self.server.requests, [])
+
+    def make_s3_connection(self):
+        from boto.async_connection import AsyncConnection
+        conn = AsyncConnection(S3Connection(
+            'access_key', 'secret_key', host='127.0.0.1', port=self.port,
+            is_secure=False, calling_format=OrdinaryCallingFormat()))
+        self.addCleanup(conn.close)
+        return conn
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,7 @@
 #
 import os
 import socket
+import threading
 
 from tests.compat import mock, unittest
 from httpretty import HTTPretty
@@ -28,8 +29,10 @@ from httpretty import HTTPretty
 from boto import UserAgent
 from boto.compat import json, parse_qs
 from boto.connection import AWSQueryConnection, AWSAuthConnection, HTTPRequest
+from boto.connection import ConnectionRegistry
 from boto.exception import BotoServerError
 from boto.regioninfo import RegionInfo
+from boto.retry import RetryPolicy
 
 
 class TestListParamsSerialization(unittest.TestCase):
@@ -405,6 +408,38 @@ class TestAWSQueryConnectionSimple(TestAWSQueryConnection):
                                  'POST')
         self.assertEqual(resp.read(), b"{'test': 'success'}")
 
+    @mock.patch('time.sleep')
+    def test_temp_failure_is_counted(self, sleep_mock):
+        responses = [HTTPretty.Response(body="{'test': 'fail'}", status=503),
+                     HTTPretty.Response(body="{'test': 'success'}", status=200)]
+        HTTPretty.register_uri(HTTPretty.POST,
+                               'https://%s/temp_fail/' % self.region.endpoint,
+                               responses=responses)
+
+        conn = self.region.connect(aws_access_key_id='access_key',
+                                   aws_secret_access_key='secret')
+        conn.make_request('myCmd1', {}, '/temp_fail/', 'POST')
+        stats = conn.retry_policy.stats
+        self.assertEqual(stats['retries'], 1)
+        self.assertEqual(stats['retries_by_class'], {'server': 1})
+        self.assertEqual(stats['sleep_time'], sleep_mock.call_args[0][0])
+
+    @mock.patch('time.sleep')
+    def test_retry_budget_stops_retries(self, sleep_mock):
+        HTTPretty.register_uri(HTTPretty.POST,
+                               'https://%s/temp_fail/' % self.region.endpoint,
+                               body="{'test': 'fail'}", status=503)
+
+        conn = self.region.connect(aws_access_key_id='access_key',
+                                   aws_secret_access_key='secret')
+        conn.set_retry_policy(RetryPolicy(budget=10))
+        with self.assertRaises(BotoServerError):
+            conn.make_request('myCmd1', {}, '/temp_fail/', 'POST')
+        # Each retry of a server error costs 5 tokens.
+        self.assertEqual(sleep_mock.call_count, 2)
+        self.assertEqual(conn.retry_policy.tokens, 0)
+        self.assertEqual(conn.retry_policy.stats['denied'], 1)
+
     def test_unhandled_exception(self):
         HTTPretty.register_uri(HTTPretty.POST,
                                'https://%s/temp_exception/' % self.region.endpoint,
@@ -553,5 +588,96 @@ class TestHTTPRequest(unittest.TestCase):
         # example, assumes headers are of type str.)
         self.assertIsInstance(request.headers['Content-Length'], str)
 
+
+class TestConnectionRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = ConnectionRegistry()
+        self.region = RegionInfo(name='cc-zone-1',
+                                 endpoint='mockservice.cc-zone-1.amazonaws.com')
+
+    def get(self, **kwargs):
+        kwargs.setdefault('aws_access_key_id', 'access_key')
+        kwargs.setdefault('aws_secret_access_key', 'secret')
+        return self.registry.get(MockAWSService, **kwargs)
+
+    def test_same_arguments_share_a_connection(self):
+        conn = self.get(region=self.region)
+        # An equal region is enough, it doesn't need to be the same object.
+        other_region = RegionInfo(
+            name='cc-zone-1', endpoint='mockservice.cc-zone-1.amazonaws.com')
+        self.assertIs(self.get(region=other_region), conn)
+
+    def test_different_arguments_get_different_connections(self):
+        conn = self.get(region=self.region)
+        self.assertIsNot(
+            self.get(region=self.region, aws_access_key_id='other_key'),
+            conn)
+        other_region = RegionInfo(
+            name='cc-zone-2', endpoint='mockservice.cc-zone-2.amazonaws.com')
+        self.assertIsNot(self.get(region=other_region), conn)
+
+    def test_pool_shared_across_connections(self):
+        conn = self.get(region=self.region)
+        other = self.get(region=self.region, aws_access_key_id='other_key')
+        self.assertIs(conn._pool, other._pool)
+
+        insecure = self.get(region=self.region, validate_certs=False)
+        self.assertIsNot(insecure._pool, conn._pool)
+        proxied = self.get(region=self.region, proxy='127.0.0.1',
+                           proxy_port=8180)
+        self.assertIsNot(proxied._pool, conn._pool)
+
+    def test_factory_called_once(self):
+        factory = mock.Mock()
+        self.assertIs(self.registry.get(factory, 'us-west-2', foo=['bar']),
+                      factory.return_value)
+        self.registry.get(factory, 'us-west-2', foo=['bar'])
+        factory.assert_called_once_with('us-west-2', foo=['bar'])
+
+    def test_other_connections_not_blocked_while_one_is_made(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_factory(name):
+            started.set()
+            release.wait(5)
+            return mock.Mock(name=name)
+        results = []
+        waiters = [threading.Thread(
+            target=lambda: results.append(
+                self.registry.get(slow_factory, 'slow')))
+            for i in range(2)]
+        for thread in waiters:
+            thread.start()
+        self.assertTrue(started.wait(5))
+        # A different connection is handed out while the slow one is made.
+        fast = self.registry.get(mock.Mock(), 'fast')
+        self.assertIsNotNone(fast)
+        release.set()
+        for thread in waiters:
+            thread.join(5)
+        # Both threads asking for the slow one get the same connection.
+        self.assertEqual(len(results), 2)
+        self.assertIs(results[0], results[1])
+
+    def test_factory_error_is_not_cached(self):
+        factory = mock.Mock(side_effect=[ValueError('boom'), 'conn'])
+        with self.assertRaises(ValueError):
+            self.registry.get(factory, 'us-west-2')
+        self.assertEqual(self.registry.get(factory, 'us-west-2'), 'conn')
+
+    def test_clear(self):
+        conn = self.get(region=self.region)
+        self.registry.clear()
+        self.assertIsNot(self.get(region=self.region), conn)
+
+    @mock.patch('boto.connection.shared_connections')
+    def test_shared_connection_by_name(self, shared_connections):
+        import boto
+        conn = boto.shared_connection('s3', host='s3.example.com')
+        self.assertIs(conn, shared_connections.get.return_value)
+        shared_connections.get.assert_called_once_with(
+            boto.connect_s3, host='s3.example.com')
+
 if __name__ == '__main__':
     unittest.main()
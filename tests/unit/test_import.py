@@ -0,0 +1,56 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+import subprocess
+import sys
+
+from tests.unit import unittest
+
+
+class TestImportBoto(unittest.TestCase):
+    def run_python(self, code):
+        # The test process has already imported most of boto, so check what
+        # a fresh interpreter gets from "import boto".
+        process = subprocess.Popen([sys.executable, '-c', code],
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        output = process.communicate()[0]
+        self.assertEqual(process.returncode, 0, output)
+        return output.decode('utf-8').strip()
+
+    def test_submodules_are_reachable(self):
+        output = self.run_python(
+            'import boto\n'
+            'print(boto.s3.connect_to_region.__module__)\n'
+            'print(boto.regioninfo.RegionInfo.__name__)\n'
+            'print(boto.endpoints.BotoEndpointResolver.__name__)\n')
+        self.assertEqual(output.split(),
+                         ['boto.s3', 'RegionInfo', 'BotoEndpointResolver'])
+
+    def test_unknown_attribute(self):
+        output = self.run_python(
+            'import boto\n'
+            'print(hasattr(boto, "no_such_module"))\n')
+        self.assertEqual(output, 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
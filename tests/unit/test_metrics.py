@@ -0,0 +1,236 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+from tests.compat import mock, unittest
+from httpretty import HTTPretty
+
+from boto.compat import json
+from boto.connection import AWSQueryConnection, HTTPRequest
+from boto.exception import BotoServerError
+from boto.metrics import RequestMetrics, MetricsHook, LatencyHistogram
+from boto.metrics import log_request_metrics
+
+
+class MockQueryConnection(AWSQueryConnection):
+    APIVersion = '2012-01-01'
+
+    def _required_auth_capability(self):
+        return ['sign-v2']
+
+
+def make_metrics(service='sqs', operation='SendMessage', total=0.01):
+    metrics = RequestMetrics(service, operation, 'POST', 'localhost')
+    metrics.marks['end'] = metrics.marks['start'] + total
+    return metrics
+
+
+class TestRequestMetrics(unittest.TestCase):
+    def test_for_query_request(self):
+        conn = MockQueryConnection(aws_access_key_id='access_key',
+                                   aws_secret_access_key='secret')
+        request = HTTPRequest('POST', 'https', 'localhost', 443, '/', None,
+                              {'Action': 'SendMessage'}, {}, 'body')
+        metrics = RequestMetrics.for_request(conn, request)
+        self.assertEqual(metrics.service, 'mockquery')
+        self.assertEqual(metrics.operation, 'SendMessage')
+        metrics.measure_request(request)
+        self.assertEqual(metrics.request_bytes, 4)
+
+    def test_for_json_request(self):
+        conn = MockQueryConnection(aws_access_key_id='access_key',
+                                   aws_secret_access_key='secret')
+        request = HTTPRequest(
+            'POST', 'https', 'localhost', 443, '/', None, {},
+            {'X-Amz-Target': 'DynamoDB_20120810.GetItem',
+             'Content-Length': '12'}, '{}')
+        metrics = RequestMetrics.for_request(conn, request)
+        self.assertEqual(metrics.operation, 'GetItem')
+        metrics.measure_request(request)
+        self.assertEqual(metrics.request_bytes, 12)
+
+    def test_durations(self):
+        metrics = RequestMetrics('s3', 'GET', 'GET', 'localhost')
+        start = metrics.marks['start']
+        for offset, name in enumerate(['attempt', 'signed', 'sent',
+                                       'first_byte', 'body_read', 'end']):
+            metrics.mark(name, start + offset + 1)
+        metrics.connect_time = 0.5
+        durations = metrics.durations()
+        self.assertEqual(durations['sign'], 1)
+        self.assertEqual(durations['send'], 1)
+        self.assertEqual(durations['wait'], 1)
+        self.assertEqual(durations['read'], 1)
+        self.assertEqual(durations['total'], 6)
+        self.assertEqual(durations['connect'], 0.5)
+
+    def test_finish_reports_once(self):
+        metrics = make_metrics()
+        handler = mock.Mock()
+        metrics.report_to(handler)
+        metrics.finish(response_bytes=10)
+        metrics.finish(response_bytes=20)
+        handler.assert_called_once_with(metrics)
+        self.assertEqual(metrics.response_bytes, 10)
+
+    def test_hook_passes_metrics_to_sinks(self):
+        sinks = [mock.Mock(), mock.Mock()]
+        hook = MetricsHook(sinks[:1])
+        hook.add_sink(sinks[1])
+        metrics = make_metrics()
+        hook.handle_request_metrics(metrics)
+        sinks[0].assert_called_once_with(metrics)
+        sinks[1].assert_called_once_with(metrics)
+
+    def test_log_request_metrics(self):
+        with mock.patch('boto.perflog') as perflog:
+            log_request_metrics(make_metrics())
+        self.assertIn('sqs.SendMessage', perflog.debug.call_args[0][0] %
+                      perflog.debug.call_args[0][1:])
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_summary(self):
+        histogram = LatencyHistogram()
+        for ms in [3, 4, 8, 15, 150]:
+            histogram.record(make_metrics(total=ms / 1000.0))
+        error = make_metrics('sqs', 'DeleteMessage', 0.5)
+        error.error = True
+        histogram.record(error)
+
+        self.assertEqual(histogram.keys(), [('sqs', 'DeleteMessage'),
+                                            ('sqs', 'SendMessage')])
+        summary = histogram.summary()[('sqs', 'SendMessage')]
+        self.assertEqual(summary['count'], 5)
+        self.assertEqual(summary['errors'], 0)
+        self.assertAlmostEqual(summary['mean'], 36, places=3)
+        self.assertAlmostEqual(summary['min'], 3, places=3)
+        self.assertEqual(summary['p50'], 10)
+        self.assertAlmostEqual(summary['p99'], 150, places=3)
+        self.assertEqual(histogram.summary()[('sqs', 'DeleteMessage')]
+                         ['errors'], 1)
+
+        buckets = dict(histogram.buckets('sqs', 'SendMessage'))
+        self.assertEqual(buckets[5], 2)
+        self.assertEqual(buckets[10], 1)
+        self.assertEqual(buckets[200], 1)
+        self.assertIn('sqs.SendMessage', histogram.report())
+
+    def test_slower_than_all_buckets(self):
+        histogram = LatencyHistogram(bounds=[10])
+        histogram.add('s3', 'GET', 25)
+        self.assertEqual(histogram.buckets('s3', 'GET'), [(10, 0), (None, 1)])
+        self.assertEqual(histogram.percentile('s3', 'GET', 50), 25)
+
+    def test_phase(self):
+        histogram = LatencyHistogram(phase='connect')
+        metrics = make_metrics()
+        metrics.connect_time = 0.002
+        histogram.record(metrics)
+        self.assertAlmostEqual(
+            histogram.summary()[('sqs', 'SendMessage')]['max'], 2)
+
+    def test_clear(self):
+        histogram = LatencyHistogram()
+        histogram.record(make_metrics())
+        histogram.clear()
+        self.assertEqual(histogram.keys(), [])
+
+
+class TestConnectionMetrics(unittest.TestCase):
+    def setUp(self):
+        HTTPretty.enable()
+        self.addCleanup(HTTPretty.disable)
+        self.reported = []
+        self.conn = MockQueryConnection(aws_access_key_id='access_key',
+                                        aws_secret_access_key='secret',
+                                        host='mockservice.amazonaws.com')
+        self.conn.set_request_hook(MetricsHook([self.reported.append]))
+
+    def test_metrics_reported_when_body_read(self):
+        HTTPretty.register_uri(HTTPretty.POST,
+                               'https://mockservice.amazonaws.com/',
+                               json.dumps({'test': 'secure'}))
+        response = self.conn.make_request('myCmd', {}, '/', 'POST')
+        self.assertEqual(self.reported, [])
+        response.read()
+        response.read()
+
+        self.assertEqual(len(self.reported), 1)
+        metrics = self.reported[0]
+        self.assertEqual(metrics.service, 'mockquery')
+        self.assertEqual(metrics.operation, 'myCmd')
+        self.assertEqual(metrics.status, 200)
+        self.assertFalse(metrics.error)
+        self.assertEqual(metrics.attempts, 1)
+        self.assertEqual(metrics.pool_misses, 1)
+        self.assertEqual(metrics.response_bytes, 18)
+        self.assertGreater(metrics.request_bytes, 0)
+        for phase in ['connect', 'sign', 'send', 'wait', 'read', 'total']:
+            self.assertIn(phase, metrics.durations())
+
+    def test_pooled_connection_is_a_hit(self):
+        HTTPretty.register_uri(HTTPretty.POST,
+                               'https://mockservice.amazonaws.com/',
+                               json.dumps({'test': 'secure'}),
+                               connection='keep-alive')
+        self.conn.make_request('myCmd', {}, '/', 'POST').read()
+        self.conn.make_request('myCmd', {}, '/', 'POST').read()
+        self.assertEqual(self.reported[1].pool_hits, 1)
+        self.assertEqual(self.reported[1].pool_misses, 0)
+
+    def test_streamed_body(self):
+        HTTPretty.register_uri(HTTPretty.POST,
+                               'https://mockservice.amazonaws.com/',
+                               'x' * 100)
+        response = self.conn.make_request('myCmd', {}, '/', 'POST')
+        while response.read(30):
+            pass
+        self.assertEqual(self.reported[0].response_bytes, 100)
+
+    @mock.patch('time.sleep')
+    def test_failed_request(self, sleep_mock):
+        HTTPretty.register_uri(HTTPretty.POST,
+                               'https://mockservice.amazonaws.com/',
+                               'error', status=500)
+        self.conn.num_retries = 2
+        with self.assertRaises(BotoServerError):
+            self.conn.make_request('myCmd', {}, '/', 'POST')
+        metrics = self.reported[0]
+        self.assertTrue(metrics.error)
+        self.assertEqual(metrics.status, 500)
+        self.assertEqual(metrics.attempts, 3)
+        self.assertEqual(metrics.retries, 2)
+        self.assertEqual(metrics.retry_sleep,
+                         sum(call[0][0] for call in sleep_mock.call_args_list))
+
+    def test_no_metrics_without_request_hook(self):
+        HTTPretty.register_uri(HTTPretty.POST,
+                               'https://mockservice.amazonaws.com/',
+                               json.dumps({'test': 'secure'}))
+        self.conn.set_request_hook(None)
+        with mock.patch.object(RequestMetrics, 'for_request') as for_request:
+            self.conn.make_request('myCmd', {}, '/', 'POST').read()
+        self.assertFalse(for_request.called)
+        self.assertEqual(self.reported, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -143,6 +143,44 @@ class TestEndpointLoading(unittest.TestCase):
         self.assertEqual(west_2.endpoint, 'ec2.us-west-2.amazonaws.com')
         self.assertEqual(west_2.connection_cls, FakeConn)
 
+    def test_get_regions_reuses_region_objects(self):
+        first = get_regions('ec2')
+        second = get_regions('ec2')
+        self.assertEqual([r.name for r in first], [r.name for r in second])
+        for a, b in zip(first, second):
+            self.assertIs(a, b)
+        # Different classes get their own objects.
+        overridden = get_regions('ec2', region_cls=TestRegionInfo)
+        self.assertIsInstance(overridden[0], TestRegionInfo)
+
+    def test_endpoints_override_invalidates_cache(self):
+        west_2 = connect('ec2', 'us-west-2', connection_cls=FakeConn).region
+        self.assertNotIn('test-1', [r.name for r in get_regions('ec2')])
+
+        path = os.path.join(os.path.dirname(__file__), 'test_endpoints.json')
+        with mock.patch.dict(os.environ, {'BOTO_ENDPOINTS': path}):
+            connection = connect('ec2', 'test-1', connection_cls=FakeConn)
+            self.assertEqual(connection.region.endpoint,
+                             'ec2.test-1.amazonaws.com')
+            self.assertIsNot(
+                connect('ec2', 'us-west-2', connection_cls=FakeConn).region,
+                west_2)
+
+        # The override doesn't stick around once it's removed.
+        self.assertNotIn('test-1', [r.name for r in get_regions('ec2')])
+
+    def test_endpoints_file_change_invalidates_cache(self):
+        path = os.path.join(os.path.dirname(__file__), 'test_endpoints.json')
+        with mock.patch.dict(os.environ, {'BOTO_ENDPOINTS': path}):
+            with mock.patch('os.path.getmtime', return_value=1):
+                self.assertIn('test-1', load_regions()['ec2'])
+            with mock.patch('boto.regioninfo.load_endpoint_json',
+                            return_value={'ec2': {'test-2': 'ec2.test-2'}}):
+                with mock.patch('os.path.getmtime', return_value=1):
+                    self.assertNotIn('test-2', load_regions()['ec2'])
+                with mock.patch('os.path.getmtime', return_value=2):
+                    self.assertIn('test-2', load_regions()['ec2'])
+
 
 class TestConnectToRegion(unittest.TestCase):
     def test_connect(self):
@@ -0,0 +1,108 @@
+# Copyright (c) 2014 Amazon.com, Inc. or its affiliates.  All Rights Reserved
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, dis-
+# tribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the fol-
+# lowing conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABIL-
+# ITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT
+# SHALL THE AUTHOR BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+import pickle
+
+from tests.compat import mock, unittest
+
+from boto.retry import RetryPolicy, RetryRule
+
+
+class TestRetryPolicy(unittest.TestCase):
+    @mock.patch('random.random', return_value=1)
+    def test_full_jitter(self, random_mock):
+        policy = RetryPolicy(jitter='full', max_delay=60)
+        self.assertEqual(policy.delay(0), 1)
+        self.assertEqual(policy.delay(3), 8)
+        self.assertEqual(policy.delay(3, 'throttling'), 0.4)
+        self.assertEqual(policy.delay(10), 60)
+
+    @mock.patch('random.random', return_value=1)
+    def test_decorrelated_jitter(self, random_mock):
+        policy = RetryPolicy(jitter='decorrelated', max_delay=60)
+        self.assertEqual(policy.delay(0), 1)
+        self.assertEqual(policy.delay(1, previous=1), 3)
+        self.assertEqual(policy.delay(2, previous=3), 9)
+        self.assertEqual(policy.delay(2), 9)
+        self.assertEqual(policy.delay(5, previous=30), 60)
+        random_mock.return_value = 0
+        self.assertEqual(policy.delay(5, previous=30), 1)
+
+    def test_unknown_jitter(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(jitter='none')
+
+    def test_rules(self):
+        policy = RetryPolicy(rules={'throttling': RetryRule(base_delay=2)})
+        self.assertEqual(policy.rule('throttling').base_delay, 2)
+        self.assertEqual(policy.rule('server').base_delay, 1)
+        self.assertEqual(policy.rule('other').cost, 5)
+
+    def test_no_budget(self):
+        policy = RetryPolicy()
+        self.assertIsNone(policy.tokens)
+        for i in range(1000):
+            self.assertTrue(policy.acquire('connection'))
+        self.assertEqual(policy.stats['retries'], 1000)
+
+    def test_budget(self):
+        policy = RetryPolicy(budget=12)
+        self.assertTrue(policy.acquire('server'))
+        self.assertTrue(policy.acquire('throttling'))
+        self.assertFalse(policy.acquire('connection'))
+        self.assertEqual(policy.tokens, 2)
+        self.assertTrue(policy.acquire('checksum'))
+        self.assertEqual(policy.stats['retries'], 3)
+        self.assertEqual(policy.stats['retries_by_class'],
+                         {'server': 1, 'throttling': 1, 'checksum': 1})
+        self.assertEqual(policy.stats['denied'], 1)
+
+    def test_successes_refill_budget(self):
+        policy = RetryPolicy(budget=5)
+        policy.acquire('server')
+        self.assertEqual(policy.tokens, 0)
+        for i in range(10):
+            policy.record_success()
+        self.assertEqual(policy.tokens, 5)
+
+    def test_budget_from_config(self):
+        with mock.patch('boto.config.has_option', return_value=True), \
+                mock.patch('boto.config.getint', return_value=50):
+            self.assertEqual(RetryPolicy().budget, 50)
+
+    def test_stats(self):
+        policy = RetryPolicy()
+        policy.acquire('server')
+        policy.record_sleep(1.5)
+        policy.record_sleep(0.5)
+        self.assertEqual(policy.stats['sleep_time'], 2)
+        policy.reset_stats()
+        self.assertEqual(policy.stats['retries'], 0)
+        self.assertEqual(policy.stats['sleep_time'], 0)
+
+    def test_pickle(self):
+        policy = pickle.loads(pickle.dumps(RetryPolicy(budget=10)))
+        self.assertEqual(policy.budget, 10)
+        self.assertTrue(policy.acquire('server'))
+
+
+if __name__ == '__main__':
+    unittest.main()
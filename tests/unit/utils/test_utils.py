@@ -34,6 +34,7 @@ from boto.utils import _build_instance_metadata_url
 from boto.utils import get_instance_userdata
 from boto.utils import retry_url
 from boto.utils import LazyLoadMetadata
+from boto.utils import LRUCache
 
 from boto.compat import json, _thread
 
@@ -413,5 +414,21 @@ class TestParseHost(unittest.TestCase):
         result = boto.utils.parse_host(host)
         self.assertEquals(result, host)
 
+
+class TestLRUCache(unittest.TestCase):
+    def test_delete(self):
+        cache = LRUCache(3)
+        for key in 'abc':
+            cache[key] = key
+        del cache['b']
+        del cache['c']
+        self.assertEqual(list(cache), ['a'])
+        cache['d'] = 'd'
+        del cache['a']
+        self.assertEqual(list(cache), ['d'])
+        self.assertNotIn('a', cache)
+        with self.assertRaises(KeyError):
+            del cache['a']
+
 if __name__ == '__main__':
     unittest.main()